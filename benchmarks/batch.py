@@ -0,0 +1,49 @@
+"""
+Compares the throughput of converting a corpus sentence by sentence with the batch API; sentences_to_arpa_old converts every distinct word of the batch only once.
+
+usage: python benchmarks/batch.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import sys
+import tempfile
+import time
+
+from synthetic import get_synthetic_sentences, write_synthetic_dictionary
+
+from cmudict_parser import get_dict
+
+SENTENCES = 50000
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  cmudict = get_dict(folder, silent=True)
+  sentences = get_synthetic_sentences(list(cmudict._entries_arpa), SENTENCES)
+
+  start = time.perf_counter()
+  for sentence in sentences:
+    cmudict.sentence_to_arpa(sentence)
+  loop_arpa = time.perf_counter() - start
+
+  start = time.perf_counter()
+  cmudict.sentences_to_arpa(sentences)
+  batch_arpa = time.perf_counter() - start
+
+  start = time.perf_counter()
+  for sentence in sentences:
+    cmudict.sentence_to_arpa_old(sentence, replace_unknown_with="_", use_caching=False)
+  loop_old = time.perf_counter() - start
+
+  start = time.perf_counter()
+  cmudict.sentences_to_arpa_old(sentences, replace_unknown_with="_", use_caching=False)
+  batch_old = time.perf_counter() - start
+
+  print(f"sentence_to_arpa loop:      {SENTENCES / loop_arpa:10.0f} sentences/s")
+  print(f"sentences_to_arpa:          {SENTENCES / batch_arpa:10.0f} sentences/s ({loop_arpa / batch_arpa:.1f}x)")
+  print(f"sentence_to_arpa_old loop:  {SENTENCES / loop_old:10.0f} sentences/s")
+  print(f"sentences_to_arpa_old:      {SENTENCES / batch_old:10.0f} sentences/s ({loop_old / batch_old:.1f}x)")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+"""
+Measures the conversion of long hyphenated chains with SentenceToIPA.get_ipa_of_word_in_sentence().
+The time per part should stay constant when the chains get longer; a plain dict uses the recursive resolution and is measured for comparison.
+
+usage: python benchmarks/hyphen.py
+"""
+
+import time
+from logging import ERROR, getLogger
+from typing import Dict, List
+
+from cmudict_parser.SentenceToIPA import (UpperKeyDict,
+                                          get_ipa_of_word_in_sentence)
+
+DICTIONARY = {"DAY-BY-DAY": "D EY1 B AY1 D EY1", "DAY": "D EY1", "BY": "B AY1", "TO": "T UW1",
+              "WELL-KNOWN": "W EH1 L N OW1 N", "WELL": "W EH1 L", "KNOWN": "N OW1 N"}
+PART_COUNTS = [10, 100, 1000, 10000]
+# the recursive resolution of a plain dict takes minutes for longer chains
+MAX_PART_COUNT_OF_DICT = 100
+
+CHAINS = {
+  "compound words": ["day", "by", "day", "to", "well", "known"],
+  "single words": ["by", "to"],
+  "unknown words": ["xx", "yy"],
+}
+
+
+def _time_per_part(dictionary: Dict[str, str], parts: List[str], part_count: int) -> float:
+  token = "-".join(parts[pos % len(parts)] for pos in range(part_count))
+  repeat = max(1, 10000 // part_count)
+  start = time.perf_counter()
+  for _ in range(repeat):
+    get_ipa_of_word_in_sentence(dictionary, token, "_")
+  return (time.perf_counter() - start) / repeat / part_count
+
+
+def main() -> None:
+  getLogger("cmudict_parser.SentenceToIPA").setLevel(ERROR)
+  dictionaries = {"UpperKeyDict": UpperKeyDict(DICTIONARY), "dict": DICTIONARY}
+  for name, parts in CHAINS.items():
+    print(name)
+    for part_count in PART_COUNTS:
+      results = []
+      for dictionary_name, dictionary in dictionaries.items():
+        if dictionary is DICTIONARY and part_count > MAX_PART_COUNT_OF_DICT:
+          continue
+        try:
+          results.append(f"{dictionary_name}: {_time_per_part(dictionary, parts, part_count) * 1e6:10.1f}us per part")
+        except RecursionError:
+          results.append(f"{dictionary_name}: RecursionError")
+      print(f"  {part_count:6} parts: {', '.join(results)}")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,174 @@
+"""
+Measures the build time, the memory and the query latency of the indexes of CMUDict for dictionaries of different sizes.
+The latency of a query should not grow with the size of the dictionary.
+
+usage: python benchmarks/indexes.py [dictionary_folder]
+If no folder is given, synthetic dictionaries of different sizes are generated.
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from synthetic import get_synthetic_entries
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictFuzzyIndex import FuzzyIndex
+from cmudict_parser.CMUDictNGramIndex import NGramIndex, contains_sequence
+from cmudict_parser.CMUDictPrefixIndex import PrefixIndex
+from cmudict_parser.CMUDictReverseIndex import ReverseIndex, remove_stress
+from cmudict_parser.CMUDictRhymeIndex import RhymeIndex, get_rhyme_part
+from cmudict_parser.CMUDictStressless import StresslessARPADict
+
+Entries = Dict[str, List[List[str]]]
+
+WORD_COUNTS = [10000, 50000, 134000]
+QUERIES = 10000
+# a scan of all entries takes milliseconds, therefore it is measured with less queries
+SCAN_QUERIES = 20
+FUZZY_QUERIES = 1000
+
+
+def _latency(query: Callable[[Any], Any], arguments: List[Any]) -> float:
+  if len(arguments) == 0:
+    return float("nan")
+  start = time.perf_counter()
+  for argument in arguments:
+    query(argument)
+  return (time.perf_counter() - start) / len(arguments)
+
+
+def _benchmark_prefix_index(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  words = list(entries)
+  start = time.perf_counter()
+  index = PrefixIndex(words)
+  build_seconds = time.perf_counter() - start
+  samples = rnd.choices(words, k=QUERIES)
+  prefixes = [word[:3] for word in samples]
+  tokens = [f"{word}xyz" for word in samples]
+  return {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": index.get_memory_size() / 2**20,
+    "words_with_prefix_us": _latency(lambda prefix: index.words_with_prefix(prefix, limit=10), prefixes) * 1e6,
+    "count_words_with_prefix_us": _latency(index.count_words_with_prefix, prefixes) * 1e6,
+    "longest_prefix_match_us": _latency(index.longest_prefix_match, tokens) * 1e6,
+  }
+
+
+def _benchmark_reverse_index(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  start = time.perf_counter()
+  index = ReverseIndex(entries)
+  build_seconds = time.perf_counter() - start
+  pronunciations = [pronunciations[0] for pronunciations in rnd.choices(list(entries.values()), k=QUERIES)]
+  return {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": index.get_memory_size() / 2**20,
+    "get_words_us": _latency(index.get_words, pronunciations) * 1e6,
+  }
+
+
+def _scan_rhymes(entries: Entries, pronunciation: List[str]) -> List[str]:
+  rhyme_part = get_rhyme_part(pronunciation)
+  return [word for word, pronunciations in entries.items()
+          if any(get_rhyme_part(other) == rhyme_part for other in pronunciations)]
+
+
+def _benchmark_rhyme_index(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  start = time.perf_counter()
+  index = RhymeIndex(entries)
+  build_seconds = time.perf_counter() - start
+  pronunciations = [pronunciations[0] for pronunciations in rnd.choices(list(entries.values()), k=QUERIES)]
+  return {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": index.get_memory_size() / 2**20,
+    "get_words_us": _latency(index.get_words, pronunciations) * 1e6,
+    "scan_us": _latency(lambda pronunciation: _scan_rhymes(entries, pronunciation), pronunciations[:SCAN_QUERIES]) * 1e6,
+  }
+
+
+def _scan_sequence(entries: Entries, sequence: List[str]) -> List[str]:
+  return [word for word, pronunciations in entries.items()
+          if any(contains_sequence(pronunciation, sequence) for pronunciation in pronunciations)]
+
+
+def _benchmark_ngram_index(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  start = time.perf_counter()
+  index = NGramIndex(entries)
+  build_seconds = time.perf_counter() - start
+  pronunciations = [pronunciations[0] for pronunciations in rnd.choices(list(entries.values()), k=QUERIES)]
+  results: Dict[str, float] = {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": index.get_memory_size() / 2**20,
+  }
+  # sequences of 3 symbols are answered with one posting list, longer ones need the intersection and the verification
+  for length in (3, 5):
+    sequences = [pronunciation[:length] for pronunciation in pronunciations if len(pronunciation) >= length]
+    results[f"get_words_{length}_us"] = _latency(index.get_words, sequences) * 1e6
+    results[f"scan_{length}_us"] = _latency(lambda sequence: _scan_sequence(entries, sequence),
+                                            sequences[:SCAN_QUERIES]) * 1e6
+  return results
+
+
+def _misspell(word: str, rnd: random.Random) -> str:
+  pos = rnd.randrange(len(word))
+  edit = rnd.randrange(3)
+  if edit == 0:
+    return word[:pos] + word[pos + 1:]
+  if edit == 1:
+    return word[:pos] + rnd.choice("AEIOU") + word[pos:]
+  return word[:pos] + word[pos + 1:pos + 2] + word[pos:pos + 1] + word[pos + 2:]
+
+
+def _benchmark_fuzzy_index(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  words = list(entries)
+  start = time.perf_counter()
+  index = FuzzyIndex(words)
+  build_seconds = time.perf_counter() - start
+  misspelled_words = [_misspell(word, rnd) for word in rnd.choices(words, k=FUZZY_QUERIES)]
+  return {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": index.get_memory_size() / 2**20,
+    "distance_1_us": _latency(lambda word: index.get_closest_words(word, max_distance=1), misspelled_words) * 1e6,
+    "distance_2_us": _latency(index.get_closest_words, misspelled_words) * 1e6,
+  }
+
+
+def _benchmark_stressless_table(entries: Entries, rnd: random.Random) -> Dict[str, float]:
+  start = time.perf_counter()
+  table = StresslessARPADict(entries)
+  build_seconds = time.perf_counter() - start
+  words = rnd.choices(list(entries), k=QUERIES)
+  return {
+    "build_ms": build_seconds * 1e3,
+    "memory_mb": table.get_memory_size() / 2**20,
+    "lookup_us": _latency(table.__getitem__, words) * 1e6,
+    # what a caller does without the table
+    "strip_per_call_us": _latency(lambda word: [remove_stress(pronunciation) for pronunciation in entries[word]], words) * 1e6,
+  }
+
+
+BENCHMARKS = {
+  "prefix index": _benchmark_prefix_index,
+  "reverse index": _benchmark_reverse_index,
+  "rhyme index": _benchmark_rhyme_index,
+  "n-gram index": _benchmark_ngram_index,
+  "fuzzy index": _benchmark_fuzzy_index,
+  "stressless table": _benchmark_stressless_table,
+}
+
+
+def main() -> None:
+  if len(sys.argv) > 1:
+    dictionaries = [dict(get_dict(sys.argv[1], silent=True)._entries_arpa)]
+  else:
+    dictionaries = [get_synthetic_entries(word_count) for word_count in WORD_COUNTS]
+  for name, benchmark in BENCHMARKS.items():
+    print(name)
+    for entries in dictionaries:
+      results = benchmark(entries, random.Random(42))
+      print(f"  {len(entries):7} words: " + ", ".join(f"{key}: {value:.2f}" for key, value in results.items()))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,60 @@
+"""
+Compares the IPA modes of get_dict(): IPA_EAGER converts all entries while loading, IPA_LAZY converts each word on its first lookup.
+Measures the load time, the memory of the converted entries and the lookup latency before and after the words were converted.
+
+usage: python benchmarks/ipa.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+from synthetic import get_synthetic_sentences, write_synthetic_dictionary
+
+from cmudict_parser import IPA_EAGER, IPA_LAZY, CMUDict, get_dict
+
+LOOKUPS = 100000
+SENTENCES = 10000
+
+
+def _time_lookups(cmudict: CMUDict, words: List[str]) -> float:
+  start = time.perf_counter()
+  for word in words:
+    cmudict.get_first_ipa(word)
+  return (time.perf_counter() - start) / len(words)
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  # the first load writes the snapshot, therefore both modes load from it
+  get_dict(folder, silent=True)
+
+  for ipa_mode in (IPA_EAGER, IPA_LAZY):
+    start = time.perf_counter()
+    cmudict = get_dict(folder, silent=True, ipa_mode=ipa_mode)
+    load_seconds = time.perf_counter() - start
+    words = list(cmudict._entries_arpa.keys())
+    sentences = get_synthetic_sentences(words, SENTENCES)
+    lookup_words = random.Random(42).choices(words, k=LOOKUPS)
+
+    first_lookup = _time_lookups(cmudict, lookup_words)
+    repeated_lookup = _time_lookups(cmudict, lookup_words)
+    start = time.perf_counter()
+    cmudict.sentences_to_ipa(sentences, replace_unknown_with="_", use_caching=False)
+    sentences_seconds = time.perf_counter() - start
+
+    entries_ipa = cmudict._get_entries_ipa()
+    print(f"{ipa_mode}:")
+    print(f"  load:                  {load_seconds:.3f}s")
+    print(f"  first lookups:         {first_lookup * 1e6:.2f}us")
+    print(f"  repeated lookups:      {repeated_lookup * 1e6:.2f}us")
+    print(f"  {SENTENCES} sentences:      {sentences_seconds:.3f}s")
+    print(f"  converted entries:     {entries_ipa.converted_count} of {len(entries_ipa)}")
+    print(f"  memory of IPA entries: {entries_ipa.get_memory_size() / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+  main()
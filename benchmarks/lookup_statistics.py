@@ -0,0 +1,93 @@
+"""
+Measures the overhead of the lookup statistics: lookups and batch conversion with statistics disabled and enabled.
+The baseline repeats the lookups and the conversion without any statistics code, it shows what the disabled statistics cost.
+The unknown words of the corpus are random and mostly distinct, which is the worst case for the top-k sketch.
+
+usage: python benchmarks/lookup_statistics.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from synthetic import get_oov_heavy_sentences, write_synthetic_dictionary
+
+from cmudict_parser import CMUDict, get_dict
+from cmudict_parser.CMUDict import ARPA_SPACE, ARPA_UNKNOWN, ENG_SPACE
+
+SENTENCES = 20000
+
+
+def _lookup_all(cmudict: CMUDict, words: List[str]) -> None:
+  for word in words:
+    cmudict.contains(word)
+
+
+def _contains_baseline(cmudict: CMUDict, word: str) -> bool:
+  # CMUDict.contains without the statistics
+  assert isinstance(word, str)
+  cmudict._ensure_data_is_loaded()
+  return word.upper() in cmudict._entries_arpa.keys()
+
+
+def _lookup_all_baseline(cmudict: CMUDict, words: List[str]) -> None:
+  for word in words:
+    _contains_baseline(cmudict, word)
+
+
+def _sentences_to_arpa_baseline(cmudict: CMUDict, sentences: List[str]) -> None:
+  # CMUDict.sentences_to_arpa without the statistics
+  entries_first_arpa = cmudict._get_entries_first_arpa(True)
+  unknown = [ARPA_UNKNOWN]
+  result = []
+  for sentence in sentences:
+    assert isinstance(sentence, str)
+    arpa_of_sentence = []
+    for word in sentence.split(ENG_SPACE):
+      arpa_of_sentence.append(ARPA_SPACE)
+      arpa_of_sentence.extend(entries_first_arpa.get(word.upper(), unknown))
+    del arpa_of_sentence[0]
+    result.append(arpa_of_sentence)
+
+
+def _duration(function: Callable[[], None]) -> float:
+  start = time.perf_counter()
+  function()
+  return time.perf_counter() - start
+
+
+def _best_of_interleaved(cmudict: CMUDict, baseline_function: Callable[[], None], function: Callable[[], None], repeat: int = 7) -> Tuple[float, float, float]:
+  # the variants run in turns, therefore a slower phase of the machine affects all of them
+  baseline, disabled, enabled = [], [], []
+  for _ in range(repeat):
+    baseline.append(_duration(baseline_function))
+    cmudict.disable_statistics()
+    disabled.append(_duration(function))
+    cmudict.enable_statistics()
+    enabled.append(_duration(function))
+  return min(baseline), min(disabled), min(enabled)
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  cmudict = get_dict(folder, silent=True)
+  sentences = get_oov_heavy_sentences(list(cmudict._entries_arpa), SENTENCES, oov_ratio=0.2)
+  words = " ".join(sentences).split(" ")
+  known_words = [word for word in words if word.upper() in cmudict._entries_arpa]
+
+  for name, baseline_function, function in (
+    ("contains (20% OOV)", lambda: _lookup_all_baseline(cmudict, words), lambda: _lookup_all(cmudict, words)),
+    ("contains (no OOV)", lambda: _lookup_all_baseline(cmudict, known_words), lambda: _lookup_all(cmudict, known_words)),
+    ("sentences_to_arpa", lambda: _sentences_to_arpa_baseline(cmudict, sentences), lambda: cmudict.sentences_to_arpa(sentences)),
+  ):
+    baseline, disabled, enabled = _best_of_interleaved(cmudict, baseline_function, function)
+    print(f"{name:20} baseline: {baseline:.3f}s, disabled: {disabled:.3f}s ({disabled / baseline - 1:+.1%}), "
+          f"enabled: {enabled:.3f}s ({enabled / baseline - 1:+.1%})")
+
+  print("top unknown words:", cmudict.lookup_statistics["top_unknown_words"][:5])
+
+
+if __name__ == "__main__":
+  main()
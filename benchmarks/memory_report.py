@@ -0,0 +1,51 @@
+"""
+Reports the memory footprint of the parsed ARPADict (lists of symbol strings) compared with the encoded dictionary (bytes of symbol IDs).
+Objects which are referenced multiple times are counted once.
+
+usage: python benchmarks/memory_report.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import sys
+import tempfile
+from typing import Any, Set
+
+from synthetic import write_synthetic_dictionary
+
+from cmudict_parser.ARPAEncoding import EncodedARPADict
+from cmudict_parser.CMUDictDownloader import ensure_files_are_downloaded
+from cmudict_parser.CMUDictParser import parse
+
+
+def get_deep_size(obj: Any, seen: Set[int]) -> int:
+  if id(obj) in seen:
+    return 0
+  seen.add(id(obj))
+  size = sys.getsizeof(obj)
+  if isinstance(obj, dict):
+    size += sum(get_deep_size(key, seen) + get_deep_size(value, seen) for key, value in obj.items())
+  elif isinstance(obj, (list, tuple, set)):
+    size += sum(get_deep_size(item, seen) for item in obj)
+  return size
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  entries, symbols = parse(ensure_files_are_downloaded(folder), silent=True)
+  encoded = EncodedARPADict(entries, symbols)
+
+  # the words are the same objects in both dictionaries
+  words_size = sum(sys.getsizeof(word) for word in entries)
+  lists_size = get_deep_size(entries, set()) - words_size
+  encoded_size = get_deep_size(encoded.encoded_entries, set()) - words_size
+  pronunciation_count = sum(len(pronunciations) for pronunciations in entries.values())
+  symbol_count = sum(len(p) for pronunciations in entries.values() for p in pronunciations)
+
+  print(f"words: {len(entries)}, pronunciations: {pronunciation_count}, symbols: {symbol_count}")
+  print(f"words (shared):  {words_size / 2**20:7.1f} MiB")
+  print(f"ARPADict:        {lists_size / 2**20:7.1f} MiB")
+  print(f"EncodedARPADict: {encoded_size / 2**20:7.1f} MiB ({lists_size / encoded_size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,67 @@
+"""
+Measures CMUDict.to_numpy() for each storage against converting the entries with Python loops, and saving and loading the arrays with np.memmap.
+
+usage: python benchmarks/numpy_export.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+from synthetic import write_synthetic_dictionary
+
+from cmudict_parser.CMUDict import (STORAGE_ENCODED, STORAGE_LISTS,
+                                    STORAGE_MMAP, get_dict)
+from cmudict_parser.CMUDictNumPy import (get_padded_matrix,
+                                         load_phoneme_arrays,
+                                         save_phoneme_arrays)
+
+
+def _convert_with_loops(entries, symbols) -> np.ndarray:
+  # what a training job does without the export: a padded matrix filled row by row
+  symbol_ids = {symbol: i for i, symbol in enumerate(sorted(symbols))}
+  pronunciations = [pronunciation for pronunciations in entries.values() for pronunciation in pronunciations]
+  result = np.full((len(pronunciations), max(len(p) for p in pronunciations)), -1, dtype=np.int16)
+  for row, pronunciation in enumerate(pronunciations):
+    for column, symbol in enumerate(pronunciation):
+      result[row, column] = symbol_ids[symbol]
+  return result
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+
+  cmudict = get_dict(folder, silent=True)
+  start = time.perf_counter()
+  _convert_with_loops(cmudict._entries_arpa, cmudict.all_phoneme_symbols)
+  print(f"python loops:        {time.perf_counter() - start:.3f}s")
+
+  for storage in (STORAGE_LISTS, STORAGE_ENCODED, STORAGE_MMAP):
+    cmudict = get_dict(folder, silent=True, storage=storage)
+    start = time.perf_counter()
+    arrays = cmudict.to_numpy()
+    print(f"to_numpy ({storage}): {time.perf_counter() - start:.3f}s")
+
+  start = time.perf_counter()
+  matrix = get_padded_matrix(arrays)
+  print(f"padded matrix:       {time.perf_counter() - start:.3f}s, {matrix.nbytes / 2**20:.1f} MB, shape {matrix.shape}")
+  csr_bytes = sum(array.nbytes for array in (arrays.symbol_ids, arrays.offsets, arrays.word_index, arrays.variant_counts))
+  print(f"csr arrays:          {csr_bytes / 2**20:.1f} MB")
+
+  arrays_folder = tempfile.mkdtemp()
+  try:
+    start = time.perf_counter()
+    save_phoneme_arrays(arrays, arrays_folder)
+    print(f"save:                {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    load_phoneme_arrays(arrays_folder, mmap=True)
+    print(f"load (memmap):       {time.perf_counter() - start:.3f}s")
+  finally:
+    shutil.rmtree(arrays_folder)
+
+
+if __name__ == "__main__":
+  main()
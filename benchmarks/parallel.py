@@ -0,0 +1,40 @@
+"""
+Measures the scaling of convert_parallel() with the number of worker processes.
+
+usage: python benchmarks/parallel.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import get_synthetic_sentences, write_synthetic_dictionary
+
+from cmudict_parser import CONVERSION_ARPA_OLD, convert_parallel, get_dict
+
+SENTENCES = 200000
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  cmudict = get_dict(folder, silent=True)
+  sentences = get_synthetic_sentences(list(cmudict._entries_arpa), SENTENCES)
+  cpu_count = os.cpu_count() or 1
+  print(f"CPUs: {cpu_count}")
+
+  worker_counts = sorted({1, 2, 4, 8, cpu_count})
+  baseline = None
+  for workers in worker_counts:
+    start = time.perf_counter()
+    for _ in convert_parallel(cmudict, sentences, CONVERSION_ARPA_OLD, workers=workers, replace_unknown_with="_"):
+      pass
+    duration = time.perf_counter() - start
+    if baseline is None:
+      baseline = duration
+    print(f"{workers:3} workers: {SENTENCES / duration:10.0f} sentences/s, speedup {baseline / duration:.2f}x")
+
+
+if __name__ == "__main__":
+  main()
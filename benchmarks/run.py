@@ -0,0 +1,183 @@
+"""
+Benchmark suite: measures the time and the peak memory of every stage, from parsing the dictionary files to converting sentences of different corpora.
+The results are written as JSON, a previous result file can be passed to compare two commits.
+
+usage: python benchmarks/run.py [--dictionary-folder FOLDER] [--output results.json] [--compare previous.json]
+If no folder is given, a synthetic dictionary is generated in a temporary folder, therefore the suite runs offline.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from logging import ERROR, getLogger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from synthetic import get_corpora, write_synthetic_dictionary
+
+from cmudict_parser.CMUDict import (STORAGE_LISTS, STORAGE_MMAP, CMUDict,
+                                    get_dict)
+from cmudict_parser.CMUDictDownloader import ensure_files_are_downloaded
+from cmudict_parser.CMUDictParser import parse
+
+RESULTS_FORMAT_VERSION = 1
+
+# name, function which is measured, number of processed items
+Stage = Tuple[str, Callable[[], Any], int]
+
+
+def _load(folder: str, use_cache: bool, storage: str) -> CMUDict:
+  result = CMUDict()
+  result._load(folder, silent=True, use_cache=use_cache, storage=storage)
+  return result
+
+
+def _lookup_all(cmudict: CMUDict, words: List[str]) -> None:
+  for word in words:
+    if cmudict.contains(word):
+      cmudict.get_first_arpa(word)
+
+
+def _convert_each_old(cmudict: CMUDict, sentences: List[str]) -> None:
+  for sentence in sentences:
+    cmudict.sentence_to_arpa_old(sentence, replace_unknown_with="_", use_caching=False)
+
+
+def _convert_each(cmudict: CMUDict, sentences: List[str]) -> None:
+  for sentence in sentences:
+    cmudict.sentence_to_arpa(sentence)
+
+
+def _convert_each_to_ipa(cmudict: CMUDict, sentences: List[str]) -> None:
+  for sentence in sentences:
+    cmudict.sentence_to_ipa(sentence, replace_unknown_with="_", use_caching=False)
+
+
+def get_stages(folder: str, corpus_scale: float, stage_filter: Optional[str]) -> List[Stage]:
+  paths = ensure_files_are_downloaded(folder)
+  # the snapshot and the mapped file are written once, the load stages measure the warm start
+  cmudict = get_dict(folder, silent=True)
+  get_dict(folder, silent=True, storage=STORAGE_MMAP)
+  words = list(cmudict._entries_arpa)
+  lookup_words = [word.lower() for word in words[::max(1, len(words) // 100000)]] + ["xyzxyz"] * 1000
+
+  stages: List[Stage] = [
+    ("parse", lambda: parse(paths, silent=True), len(words)),
+    ("load_without_cache", lambda: _load(folder, False, STORAGE_LISTS), len(words)),
+    ("load_warm", lambda: _load(folder, True, STORAGE_LISTS), len(words)),
+    ("load_mmap_warm", lambda: _load(folder, True, STORAGE_MMAP), len(words)),
+    ("get_first_arpa", lambda: _lookup_all(cmudict, lookup_words), len(lookup_words)),
+  ]
+  # the per-sentence and the batch conversions of each format, like benchmarks/batch.py and benchmarks/sentence_to_ipa.py
+  for corpus_name, sentences in get_corpora(words, corpus_scale).items():
+    stages.extend([
+      (f"sentence_to_arpa_old/{corpus_name}", lambda s=sentences: _convert_each_old(cmudict, s), len(sentences)),
+      (f"sentences_to_arpa_old/{corpus_name}", lambda s=sentences: cmudict.sentences_to_arpa_old(
+        s, replace_unknown_with="_", use_caching=False), len(sentences)),
+      (f"sentence_to_arpa/{corpus_name}", lambda s=sentences: _convert_each(cmudict, s), len(sentences)),
+      (f"sentences_to_arpa/{corpus_name}", lambda s=sentences: cmudict.sentences_to_arpa(s), len(sentences)),
+      (f"sentence_to_ipa/{corpus_name}", lambda s=sentences: _convert_each_to_ipa(cmudict, s), len(sentences)),
+      (f"sentences_to_ipa/{corpus_name}", lambda s=sentences: cmudict.sentences_to_ipa(
+        s, replace_unknown_with="_", use_caching=False), len(sentences)),
+    ])
+  if stage_filter is not None:
+    stages = [stage for stage in stages if stage_filter in stage[0]]
+  return stages
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+  durations = []
+  for _ in range(repeat):
+    start = time.perf_counter()
+    function()
+    durations.append(time.perf_counter() - start)
+  # tracing slows down the execution, therefore the peak memory is measured in a separate run
+  tracemalloc.start()
+  try:
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+  return {
+    "seconds": min(durations),
+    "median_seconds": statistics.median(durations),
+    "peak_memory_bytes": peak,
+  }
+
+
+def _get_git_commit() -> Optional[str]:
+  try:
+    return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True,
+                          text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+
+def compare(results: Dict[str, Any], previous: Dict[str, Any]) -> None:
+  print(f"{'stage':45} {'time':>10} {'previous':>10} {'ratio':>7} {'peak':>10} {'ratio':>7}")
+  for name, result in results["stages"].items():
+    old = previous["stages"].get(name)
+    if old is None:
+      continue
+    time_ratio = result["seconds"] / old["seconds"] if old["seconds"] > 0 else float("nan")
+    memory_ratio = result["peak_memory_bytes"] / \
+        old["peak_memory_bytes"] if old["peak_memory_bytes"] > 0 else float("nan")
+    print(f"{name:45} {result['seconds']:9.4f}s {old['seconds']:9.4f}s {time_ratio:6.2f}x "
+          f"{result['peak_memory_bytes'] / 2**20:8.1f}MB {memory_ratio:6.2f}x")
+
+
+def main() -> None:
+  parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+  parser.add_argument("--dictionary-folder", help="folder with the dictionary files, a synthetic dictionary if not given")
+  parser.add_argument("--output", help="JSON file for the results, standard output if not given")
+  parser.add_argument("--compare", help="JSON file with previous results")
+  parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per stage, the fastest counts")
+  parser.add_argument("--corpus-scale", type=float, default=1.0, help="multiplies the size of the corpora")
+  parser.add_argument("--stages", help="run only the stages whose name contains this text")
+  args = parser.parse_args()
+  # the warning for every replaced unknown word would be measured as well
+  getLogger("cmudict_parser.SentenceToIPA").setLevel(ERROR)
+
+  folder = args.dictionary_folder or write_synthetic_dictionary(tempfile.mkdtemp())
+  stages = get_stages(folder, args.corpus_scale, args.stages)
+  results: Dict[str, Any] = {
+    "version": RESULTS_FORMAT_VERSION,
+    "meta": {
+      "created": datetime.now(timezone.utc).isoformat(),
+      "git_commit": _get_git_commit(),
+      "python": sys.version.split()[0],
+      "platform": platform.platform(),
+      "synthetic_dictionary": args.dictionary_folder is None,
+      "corpus_scale": args.corpus_scale,
+      "repeat": args.repeat,
+    },
+    "stages": {},
+  }
+  for name, function, items in stages:
+    result = measure(function, args.repeat)
+    result["items"] = items
+    result["items_per_second"] = items / result["seconds"] if result["seconds"] > 0 else None
+    results["stages"][name] = result
+    print(f"{name:45} {result['seconds']:9.4f}s {result['peak_memory_bytes'] / 2**20:8.1f}MB", file=sys.stderr)
+
+  if args.output is None:
+    print(json.dumps(results, indent=2))
+  else:
+    with open(args.output, "w", encoding="utf-8") as f:
+      json.dump(results, f, indent=2)
+
+  if args.compare is not None:
+    with open(args.compare, encoding="utf-8") as f:
+      previous = json.load(f)
+    compare(results, previous)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,52 @@
+"""
+Measures the per-sentence latency of SentenceToIPA.sentence_to_ipa() with asserts enabled:
+a plain dict (all keys are checked to be upper case on every converted word) compared with an UpperKeyDict (checked once).
+
+usage: python benchmarks/sentence_to_ipa.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from synthetic import write_synthetic_dictionary
+
+from cmudict_parser.CMUDictDownloader import ensure_files_are_downloaded
+from cmudict_parser.CMUDictParser import parse
+from cmudict_parser.SentenceToIPA import UpperKeyDict, sentence_to_ipa
+
+WORDS_PER_SENTENCE = 12
+
+
+def get_sentences(words: List[str], count: int) -> List[str]:
+  rnd = random.Random(42)
+  return [" ".join(rnd.choice(words).lower() for _ in range(WORDS_PER_SENTENCE)) + "." for _ in range(count)]
+
+
+def _time_per_sentence(dict: Dict[str, str], sentences: List[str]) -> float:
+  start = time.perf_counter()
+  for sentence in sentences:
+    sentence_to_ipa(dict, sentence, replace_unknown_with="_", use_caching=False)
+  return (time.perf_counter() - start) / len(sentences)
+
+
+def main() -> None:
+  if not __debug__:
+    print("Run the benchmark without -O, otherwise the asserts are not executed.")
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  entries, _ = parse(ensure_files_are_downloaded(folder), silent=True)
+  first_arpa = {word: " ".join(pronunciations[0]) for word, pronunciations in entries.items()}
+  words = list(first_arpa.keys())
+
+  before = _time_per_sentence(first_arpa, get_sentences(words, 5))
+  after = _time_per_sentence(UpperKeyDict(first_arpa), get_sentences(words, 5000))
+
+  print(f"dict:         {before * 1e3:9.3f}ms per sentence")
+  print(f"UpperKeyDict: {after * 1e3:9.3f}ms per sentence ({before / after:.0f}x faster)")
+
+
+if __name__ == "__main__":
+  main()
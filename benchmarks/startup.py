@@ -0,0 +1,45 @@
+"""
+Compares a cold start of get_dict() (parsing the dictionary files) with a warm start (loading the binary snapshot).
+
+usage: python benchmarks/startup.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import write_synthetic_dictionary
+
+from cmudict_parser import get_dict
+from cmudict_parser.CMUDictDownloader import DICT_FILENAME
+
+
+def _remove_caches(folder: str) -> None:
+  for name in os.listdir(folder):
+    if name.startswith(f"{DICT_FILENAME}.") and name.endswith(".cache"):
+      os.remove(os.path.join(folder, name))
+
+
+def _time_get_dict(folder: str, use_cache: bool) -> float:
+  start = time.perf_counter()
+  get_dict(folder, silent=True, use_cache=use_cache)
+  return time.perf_counter() - start
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  _remove_caches(folder)
+
+  no_cache = _time_get_dict(folder, use_cache=False)
+  cold = _time_get_dict(folder, use_cache=True)
+  warm = min(_time_get_dict(folder, use_cache=True) for _ in range(3))
+
+  print(f"without cache:        {no_cache:.3f}s")
+  print(f"cold (parse + write): {cold:.3f}s")
+  print(f"warm (snapshot):      {warm:.3f}s ({no_cache / warm:.1f}x faster)")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,50 @@
+"""
+Compares the storages of CMUDict: load time, memory allocated by the process and lookup latency.
+
+usage: python benchmarks/storage.py [dictionary_folder]
+If no folder is given, a synthetic dictionary is generated in a temporary folder.
+"""
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import write_synthetic_dictionary
+
+from cmudict_parser import (STORAGE_ENCODED, STORAGE_LISTS, STORAGE_MMAP,
+                            get_dict)
+
+LOOKUPS = 100000
+
+
+def _benchmark(folder: str, storage: str) -> None:
+  # creates the snapshot files beforehand so that only the loading is measured
+  words = list(get_dict(folder, silent=True, storage=storage)._entries_arpa)
+  rnd = random.Random(42)
+  queries = [rnd.choice(words).lower() for _ in range(LOOKUPS)]
+
+  tracemalloc.start()
+  start = time.perf_counter()
+  cmudict = get_dict(folder, silent=True, storage=storage)
+  load_duration = time.perf_counter() - start
+  allocated, _ = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  start = time.perf_counter()
+  for word in queries:
+    cmudict.get_all_arpa(word)
+  lookup_duration = time.perf_counter() - start
+
+  print(f"{storage:8} load: {load_duration:.3f}s, allocated: {allocated / 2**20:.1f} MiB, get_all_arpa: {lookup_duration / LOOKUPS * 1e6:.2f}us")
+
+
+def main() -> None:
+  folder = sys.argv[1] if len(sys.argv) > 1 else write_synthetic_dictionary(tempfile.mkdtemp())
+  for storage in (STORAGE_LISTS, STORAGE_ENCODED, STORAGE_MMAP):
+    _benchmark(folder, storage)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,156 @@
+"""
+Generates a synthetic dictionary in the CMUDict 0.7b file layout so that the benchmarks can run offline.
+The files are written with the original file names, therefore get_dict() does not try to download anything.
+"""
+
+import os
+import random
+from typing import Dict, List
+
+from cmudict_parser.CMUDictDownloader import (DICT_FILENAME, PHONES_FILENAME,
+                                              SYMBOLS_FILENAME)
+
+VOWELS = ["AA", "AE", "AH", "AO", "AW", "AY", "EH", "ER",
+          "EY", "IH", "IY", "OW", "OY", "UH", "UW"]
+CONSONANTS = ["B", "CH", "D", "DH", "F", "G", "HH", "JH", "K", "L", "M", "N",
+              "NG", "P", "R", "S", "SH", "T", "TH", "V", "W", "Y", "Z", "ZH"]
+SYMBOLS = sorted(CONSONANTS + VOWELS + [f"{v}{s}" for v in VOWELS for s in "012"])
+
+DEFAULT_WORD_COUNT = 134000
+ALT_PRONUNCIATION_RATIO = 0.07
+
+
+def _random_pronunciation(rnd: random.Random) -> List[str]:
+  result = []
+  for _ in range(rnd.randint(1, 4)):
+    if rnd.random() < 0.7:
+      result.append(rnd.choice(CONSONANTS))
+    result.append(f"{rnd.choice(VOWELS)}{rnd.choice('0112')}")
+    if rnd.random() < 0.4:
+      result.append(rnd.choice(CONSONANTS))
+  return result
+
+
+def _random_word(rnd: random.Random) -> str:
+  letters = "ABCDEFGHIJKLMNOPRSTUVWY"
+  return "".join(rnd.choice(letters) for _ in range(rnd.randint(2, 12)))
+
+
+def get_synthetic_words(count: int = DEFAULT_WORD_COUNT, seed: int = 1234) -> List[str]:
+  rnd = random.Random(seed)
+  words = {chr(c) for c in range(ord("A"), ord("Z") + 1)}
+  while len(words) < count:
+    words.add(_random_word(rnd))
+  return sorted(words)
+
+
+def get_synthetic_entries(count: int = DEFAULT_WORD_COUNT, seed: int = 1234) -> Dict[str, List[List[str]]]:
+  ''' Words with random pronunciations like the parsed dictionary, without writing and parsing the files. '''
+  rnd = random.Random(seed)
+  result = {}
+  for word in get_synthetic_words(count, seed):
+    result[word] = [_random_pronunciation(rnd)]
+    if rnd.random() < ALT_PRONUNCIATION_RATIO:
+      result[word].append(_random_pronunciation(rnd))
+  return result
+
+
+def write_synthetic_dictionary(folder: str, count: int = DEFAULT_WORD_COUNT, seed: int = 1234) -> str:
+  rnd = random.Random(seed)
+  os.makedirs(folder, exist_ok=True)
+
+  with open(os.path.join(folder, SYMBOLS_FILENAME), "w", encoding="latin-1") as f:
+    f.write("\n".join(SYMBOLS) + "\n")
+
+  with open(os.path.join(folder, PHONES_FILENAME), "w", encoding="latin-1") as f:
+    f.write("\n".join(f"{s}\t{'vowel' if s in VOWELS else 'stop'}" for s in CONSONANTS + VOWELS) + "\n")
+
+  with open(os.path.join(folder, DICT_FILENAME), "w", encoding="latin-1") as f:
+    f.write(";;; synthetic dictionary for benchmarks\n")
+    f.write("!EXCLAMATION-POINT  EH2 K S K L AH0 M EY1 SH AH0 N P OY2 N T\n")
+    for word in get_synthetic_words(count, seed):
+      f.write(f"{word}  {' '.join(_random_pronunciation(rnd))}\n")
+      if rnd.random() < ALT_PRONUNCIATION_RATIO:
+        f.write(f"{word}(1)  {' '.join(_random_pronunciation(rnd))}\n")
+
+  return folder
+
+
+def get_synthetic_sentences(words: List[str], count: int, words_per_sentence: int = 12, seed: int = 42) -> List[str]:
+  ''' Sentences of lower case words which are drawn from a Zipf-like distribution, like in natural text. '''
+  rnd = random.Random(seed)
+  vocabulary = words[:]
+  rnd.shuffle(vocabulary)
+  weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+  tokens = rnd.choices(vocabulary, weights=weights, k=count * words_per_sentence)
+  return [" ".join(tokens[i:i + words_per_sentence]).lower() for i in range(0, len(tokens), words_per_sentence)]
+
+
+def _sample_words(rnd: random.Random, words: List[str], count: int) -> List[str]:
+  return [word.lower() for word in rnd.choices(words, k=count)]
+
+
+def get_short_prompts(words: List[str], count: int, seed: int = 42) -> List[str]:
+  rnd = random.Random(seed)
+  result = []
+  for _ in range(count):
+    tokens = _sample_words(rnd, words, rnd.randint(3, 8))
+    result.append(" ".join(tokens).capitalize() + rnd.choice(".?!"))
+  return result
+
+
+def get_long_paragraphs(words: List[str], count: int, words_per_paragraph: int = 150, seed: int = 42) -> List[str]:
+  rnd = random.Random(seed)
+  result = []
+  for _ in range(count):
+    tokens = _sample_words(rnd, words, words_per_paragraph)
+    for i in range(7, len(tokens), 8):
+      tokens[i] += rnd.choice(",,.;")
+    result.append(" ".join(tokens) + ".")
+  return result
+
+
+PUNCTUATION_BEFORE = ["", "(", "\"", "'", "(\"", "..."]
+PUNCTUATION_AFTER = ["", ",", "!?", "\")", "'", "...", ");"]
+
+
+def get_punctuation_heavy_sentences(words: List[str], count: int, seed: int = 42) -> List[str]:
+  rnd = random.Random(seed)
+  result = []
+  for _ in range(count):
+    tokens = [rnd.choice(PUNCTUATION_BEFORE) + word + rnd.choice(PUNCTUATION_AFTER)
+              for word in _sample_words(rnd, words, 12)]
+    result.append(" ".join(tokens))
+  return result
+
+
+def get_hyphen_heavy_sentences(words: List[str], count: int, seed: int = 42) -> List[str]:
+  rnd = random.Random(seed)
+  result = []
+  for _ in range(count):
+    tokens = ["-".join(_sample_words(rnd, words, rnd.randint(1, 4))) for _ in range(8)]
+    result.append(" ".join(tokens) + ".")
+  return result
+
+
+def get_oov_heavy_sentences(words: List[str], count: int, oov_ratio: float = 0.5, seed: int = 42) -> List[str]:
+  rnd = random.Random(seed)
+  result = []
+  for _ in range(count):
+    tokens = _sample_words(rnd, words, 12)
+    for i in range(len(tokens)):
+      if rnd.random() < oov_ratio:
+        tokens[i] = "".join(rnd.choice("qxz") for _ in range(rnd.randint(3, 9)))
+    result.append(" ".join(tokens) + ".")
+  return result
+
+
+def get_corpora(words: List[str], scale: float = 1.0, seed: int = 42) -> Dict[str, List[str]]:
+  ''' Synthetic corpora with different characteristics, scale multiplies the number of sentences. '''
+  return {
+    "short_prompts": get_short_prompts(words, max(1, int(5000 * scale)), seed),
+    "long_paragraphs": get_long_paragraphs(words, max(1, int(100 * scale)), seed=seed),
+    "punctuation_heavy": get_punctuation_heavy_sentences(words, max(1, int(2000 * scale)), seed),
+    "hyphen_heavy": get_hyphen_heavy_sentences(words, max(1, int(2000 * scale)), seed),
+    "oov_heavy": get_oov_heavy_sentences(words, max(1, int(2000 * scale)), seed=seed),
+  }
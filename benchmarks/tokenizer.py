@@ -0,0 +1,46 @@
+"""
+Measures the conversion of long punctuation-heavy tokens with SentenceToIPA.get_ipa_of_word_in_sentence().
+The time per character should stay constant when the tokens get longer.
+
+usage: python benchmarks/tokenizer.py
+"""
+
+import time
+from logging import ERROR, getLogger
+from typing import Callable
+
+from cmudict_parser.SentenceToIPA import (UpperKeyDict,
+                                          get_ipa_of_word_in_sentence)
+
+DICTIONARY = UpperKeyDict({"TO": "T UW1", "NO": "N OW1", "'TIS": "T IH1 Z"})
+LENGTHS = [100, 1000, 10000, 100000]
+
+TOKENS = {
+  "punctuation around a word": lambda length: "(\"" * (length // 4) + "to" + "\")" * (length // 4),
+  "words between punctuation": lambda length: "to,(no)." * (length // 8),
+  "apostrophes around a word": lambda length: "'" * (length // 2) + "tis" + "'" * (length // 2),
+}
+
+
+def _time_per_char(make_token: Callable[[int], str], length: int) -> float:
+  token = make_token(length)
+  repeat = max(1, 100000 // length)
+  start = time.perf_counter()
+  for _ in range(repeat):
+    get_ipa_of_word_in_sentence(DICTIONARY, token, "_")
+  return (time.perf_counter() - start) / repeat / len(token)
+
+
+def main() -> None:
+  getLogger("cmudict_parser.SentenceToIPA").setLevel(ERROR)
+  for name, make_token in TOKENS.items():
+    print(name)
+    for length in LENGTHS:
+      try:
+        print(f"  {length:7} chars: {_time_per_char(make_token, length) * 1e9:10.1f}ns per char")
+      except RecursionError:
+        print(f"  {length:7} chars: RecursionError")
+
+
+if __name__ == "__main__":
+  main()
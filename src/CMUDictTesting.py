@@ -0,0 +1,23 @@
+"""
+Writes small dictionaries in the file layout of CMUDict 0.7b for the tests.
+The files have the original file names, therefore get_dict() loads them and does not try to download anything.
+The module is placed outside of the package cmudict_parser, therefore it is not installed with it.
+"""
+
+import os
+
+from cmudict_parser.CMUDictDownloader import (DICT_FILENAME, PHONES_FILENAME,
+                                              SYMBOLS_FILENAME)
+
+TEST_SYMBOLS = "AH0\nAH1\nN\nOW1\nT\nUW1\n"
+TEST_DICTIONARY = "A  AH0\nNO  N OW1\nNOT  N AH1 T\nTO  T UW1\n"
+FILE_ENCODING = "latin-1"
+
+
+def write_test_dictionary(folder: str, symbols: str = TEST_SYMBOLS, dictionary: str = TEST_DICTIONARY, phones: str = "") -> str:
+  ''' Writes the symbols, phones and dictionary files into the folder and returns the folder. '''
+  os.makedirs(folder, exist_ok=True)
+  for filename, content in ((SYMBOLS_FILENAME, symbols), (PHONES_FILENAME, phones), (DICT_FILENAME, dictionary)):
+    with open(os.path.join(folder, filename), "w", encoding=FILE_ENCODING) as f:
+      f.write(content)
+  return folder
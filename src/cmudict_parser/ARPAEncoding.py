@@ -0,0 +1,100 @@
+"""
+Compact encoding of ARPA pronunciations: every symbol of the symbols file is mapped to a small integer ID and a pronunciation is stored as bytes of these IDs.
+The pronunciations are decoded to lists of strings only when they are returned.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Set
+
+from cmudict_parser.CMUDictParser import (ARPADict, ARPAPronunciation,
+                                          ARPAPronunciations, ARPASymbol, Word)
+
+SymbolIds = Dict[ARPASymbol, int]
+
+# separates the pronunciations of one word in EncodedARPADict, therefore it can not be used as symbol ID
+PRONUNCIATION_SEPARATOR = 255
+MAX_SYMBOL_COUNT = PRONUNCIATION_SEPARATOR
+
+
+def get_symbol_ids(symbols: Set[ARPASymbol]) -> SymbolIds:
+  sorted_symbols = sorted(symbols)
+  if len(sorted_symbols) > MAX_SYMBOL_COUNT:
+    raise Exception(f"At most {MAX_SYMBOL_COUNT} symbols can be encoded!")
+  result = {symbol: i for i, symbol in enumerate(sorted_symbols)}
+  return result
+
+
+def get_symbols_from_ids(symbol_ids: SymbolIds) -> List[ARPASymbol]:
+  result = sorted(symbol_ids.keys(), key=symbol_ids.get)
+  return result
+
+
+def encode_pronunciation(pronunciation: ARPAPronunciation, symbol_ids: SymbolIds) -> bytes:
+  return bytes(symbol_ids[symbol] for symbol in pronunciation)
+
+
+def decode_pronunciation(encoded: bytes, symbols: List[ARPASymbol]) -> ARPAPronunciation:
+  return [symbols[symbol_id] for symbol_id in encoded]
+
+
+class EncodedARPADict(Mapping):
+  ''' Read-only mapping from upper case words to their ARPA pronunciations; all pronunciations of a word are stored in one bytes object. '''
+
+  def __init__(self, entries: ARPADict, symbols: Set[ARPASymbol]):
+    symbol_ids = get_symbol_ids(symbols)
+    self._symbols = get_symbols_from_ids(symbol_ids)
+    separator = bytes([PRONUNCIATION_SEPARATOR])
+    self._entries: Dict[Word, bytes] = {
+      word: separator.join(encode_pronunciation(pronunciation, symbol_ids) for pronunciation in pronunciations) for word, pronunciations in entries.items()
+    }
+
+  @property
+  def symbols(self) -> Set[ARPASymbol]:
+    return set(self._symbols)
+
+  @property
+  def encoded_entries(self) -> Dict[Word, bytes]:
+    return self._entries
+
+  def get_first(self, word: Word) -> Optional[ARPAPronunciation]:
+    encoded = self._entries.get(word, None)
+    if encoded is None:
+      return None
+    end = encoded.find(PRONUNCIATION_SEPARATOR)
+    return decode_pronunciation(encoded if end == -1 else encoded[:end], self._symbols)
+
+  def __getitem__(self, word: Word) -> ARPAPronunciations:
+    encoded = self._entries[word]
+    return [decode_pronunciation(pronunciation, self._symbols) for pronunciation in encoded.split(bytes([PRONUNCIATION_SEPARATOR]))]
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+
+class FirstARPAView(Mapping):
+  ''' View on the first pronunciation of each word of an encoded or mapped dictionary. '''
+
+  def __init__(self, entries: Mapping):
+    assert hasattr(entries, "get_first")
+    self._entries = entries
+
+  def __getitem__(self, word: Word) -> ARPAPronunciation:
+    result = self._entries.get_first(word)
+    if result is None:
+      raise KeyError(word)
+    return result
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -0,0 +1,64 @@
+import unittest
+
+from cmudict_parser.ARPAEncoding import (EncodedARPADict, FirstARPAView,
+                                         decode_pronunciation,
+                                         encode_pronunciation, get_symbol_ids,
+                                         get_symbols_from_ids)
+
+
+class UnitTests(unittest.TestCase):
+  def test_get_symbol_ids__returns_ids_in_sorted_order(self):
+    res = get_symbol_ids({"UW1", "T", "AH0"})
+
+    self.assertEqual({"AH0": 0, "T": 1, "UW1": 2}, res)
+
+  def test_get_symbol_ids__too_many_symbols__throws_exception(self):
+    with self.assertRaises(Exception):
+      get_symbol_ids({str(i) for i in range(256)})
+
+  def test_get_symbols_from_ids__returns_symbols_ordered_by_id(self):
+    res = get_symbols_from_ids({"AH0": 0, "T": 1, "UW1": 2})
+
+    self.assertEqual(["AH0", "T", "UW1"], res)
+
+  def test_encode_pronunciation__decode_pronunciation__returns_input(self):
+    symbol_ids = {"AH0": 0, "T": 1, "UW1": 2}
+    encoded = encode_pronunciation(["T", "UW1"], symbol_ids)
+    res = decode_pronunciation(encoded, get_symbols_from_ids(symbol_ids))
+
+    self.assertEqual(b"\x01\x02", encoded)
+    self.assertEqual(["T", "UW1"], res)
+
+  def test_encoded_arpa_dict__returns_same_entries_as_input(self):
+    entries = {"TO": [["T", "UW1"], ["T", "AH0"]], "A": [["AH0"]]}
+    res = EncodedARPADict(entries, {"AH0", "T", "UW1"})
+
+    self.assertEqual(entries, dict(res))
+    self.assertEqual(2, len(res))
+    self.assertIn("TO", res)
+    self.assertNotIn("TOO", res)
+    self.assertEqual({"AH0", "T", "UW1"}, res.symbols)
+
+  def test_encoded_arpa_dict__stores_one_bytes_object_per_word(self):
+    res = EncodedARPADict({"TO": [["T", "UW1"], ["T", "AH0"]]}, {"AH0", "T", "UW1"})
+
+    self.assertEqual({"TO": b"\x01\x02\xff\x01\x00"}, res.encoded_entries)
+
+  def test_encoded_arpa_dict__get_first__returns_first_pronunciation(self):
+    res = EncodedARPADict({"TO": [["T", "UW1"], ["T", "AH0"]], "A": [["AH0"]]}, {"AH0", "T", "UW1"})
+
+    self.assertEqual(["T", "UW1"], res.get_first("TO"))
+    self.assertEqual(["AH0"], res.get_first("A"))
+    self.assertIsNone(res.get_first("TOO"))
+
+  def test_first_arpa_view__returns_first_pronunciations(self):
+    entries = EncodedARPADict({"TO": [["T", "UW1"], ["T", "AH0"]]}, {"AH0", "T", "UW1"})
+    res = FirstARPAView(entries)
+
+    self.assertEqual({"TO": ["T", "UW1"]}, dict(res))
+    self.assertIsNone(res.get("TOO"))
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,147 @@
+"""
+Conversion of ARPA pronunciations to IPA, e.g. "T UW1" -> "tˈu".
+Every symbol of the dictionary, including its stress marker, is mapped once to its IPA string; a pronunciation is converted by joining the strings of its symbols.
+The stress marker is placed directly before the vowel, e.g. "AA2 L OW1" -> "ˌɑlˈoʊ".
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Set
+
+from cmudict_parser.CMUDictParser import ARPAPronunciation, ARPASymbol, Word
+
+IPAPronunciation = str
+IPAPronunciations = List[IPAPronunciation]
+IPAMapping = Dict[ARPASymbol, str]
+
+IPA_EAGER = "eager"
+IPA_LAZY = "lazy"
+IPA_MODES = {IPA_EAGER, IPA_LAZY}
+
+ARPA_TO_IPA: Dict[ARPASymbol, str] = {
+  "AA": "ɑ",
+  "AE": "æ",
+  "AH": "ʌ",
+  "AO": "ɔ",
+  "AW": "aʊ",
+  "AY": "aɪ",
+  "B": "b",
+  "CH": "ʧ",
+  "D": "d",
+  "DH": "ð",
+  "EH": "ɛ",
+  "ER": "ɝ",
+  "EY": "eɪ",
+  "F": "f",
+  "G": "g",
+  "HH": "h",
+  "IH": "ɪ",
+  "IY": "i",
+  "JH": "ʤ",
+  "K": "k",
+  "L": "l",
+  "M": "m",
+  "N": "n",
+  "NG": "ŋ",
+  "OW": "oʊ",
+  "OY": "ɔɪ",
+  "P": "p",
+  "R": "ɹ",
+  "S": "s",
+  "SH": "ʃ",
+  "T": "t",
+  "TH": "θ",
+  "UH": "ʊ",
+  "UW": "u",
+  "V": "v",
+  "W": "w",
+  "Y": "j",
+  "Z": "z",
+  "ZH": "ʒ",
+}
+
+IPA_OF_STRESS = {
+  "0": "",
+  "1": "ˈ",
+  "2": "ˌ",
+}
+
+
+def get_ipa_of_symbol(symbol: ARPASymbol) -> str:
+  if symbol[-1] in IPA_OF_STRESS:
+    stress, symbol_without_stress = IPA_OF_STRESS[symbol[-1]], symbol[:-1]
+  else:
+    stress, symbol_without_stress = "", symbol
+  if symbol_without_stress not in ARPA_TO_IPA:
+    raise Exception(f"The symbol \"{symbol}\" has no IPA!")
+  return stress + ARPA_TO_IPA[symbol_without_stress]
+
+
+def get_ipa_mapping(symbols: Iterable[ARPASymbol]) -> IPAMapping:
+  ''' The IPA of each symbol, e.g. for all symbols of the dictionary. '''
+  return {symbol: get_ipa_of_symbol(symbol) for symbol in symbols}
+
+
+def arpa_to_ipa(pronunciation: ARPAPronunciation, mapping: IPAMapping) -> IPAPronunciation:
+  return "".join([mapping[symbol] for symbol in pronunciation])
+
+
+class IPADict(Mapping):
+  '''
+  Read-only mapping from upper case words to the IPA of all their pronunciations.
+  eager: True to convert all entries now, otherwise each entry is converted on its first lookup and kept.
+  A lazy dictionary can be used by several threads at once: a word which is converted by two threads at the same time is only converted twice.
+  '''
+
+  def __init__(self, entries: Mapping, symbols: Set[ARPASymbol], eager: bool):
+    self._entries = entries
+    self._mapping = get_ipa_mapping(symbols)
+    self._converted: Dict[Word, IPAPronunciations] = {}
+    if eager:
+      for word, pronunciations in entries.items():
+        self._converted[word] = [arpa_to_ipa(pronunciation, self._mapping) for pronunciation in pronunciations]
+
+  @property
+  def converted_count(self) -> int:
+    ''' Number of converted entries, all entries if the dictionary is eager. '''
+    return len(self._converted)
+
+  def __getitem__(self, word: Word) -> IPAPronunciations:
+    result = self._converted.get(word, None)
+    if result is None:
+      result = [arpa_to_ipa(pronunciation, self._mapping) for pronunciation in self._entries[word]]
+      self._converted[word] = result
+    return result
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the converted entries without the words, which are shared with the dictionary. '''
+    return sys.getsizeof(self._converted) + sum(sys.getsizeof(pronunciations) + sum(sys.getsizeof(pronunciation) for pronunciation in pronunciations)
+                                                for pronunciations in self._converted.values())
+
+
+class FirstIPAView(Mapping):
+  ''' View on the IPA of the first pronunciation of each word, which is the value format SentenceToIPA expects. '''
+
+  def __init__(self, entries_ipa: IPADict):
+    self._entries_ipa = entries_ipa
+
+  def __getitem__(self, word: Word) -> IPAPronunciation:
+    return self._entries_ipa[word][0]
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries_ipa
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries_ipa)
+
+  def __len__(self) -> int:
+    return len(self._entries_ipa)
@@ -0,0 +1,113 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.ARPAToIPA import (IPA_EAGER, IPA_LAZY, IPADict,
+                                      arpa_to_ipa, get_ipa_mapping,
+                                      get_ipa_of_symbol)
+from cmudict_parser.CMUDict import STORAGE_ENCODED, STORAGE_MMAP, get_dict
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AA2\nAH0\nDH\nEH1\nIH0\nL\nOW1\nR\nT\nUW1\n"
+DICTIONARY = "'ALLO  AA2 L OW1\nTHEY'RE  DH EH1 R\nTO  T UW1\nTO(1)  T IH0\nTO(2)  T AH0\n"
+
+ENTRIES = {
+  "'ALLO": [["AA2", "L", "OW1"]],
+  "TO": [["T", "UW1"], ["T", "IH0"], ["T", "AH0"]],
+}
+ENTRIES_SYMBOLS = {"AA2", "AH0", "IH0", "L", "OW1", "T", "UW1"}
+
+
+class ARPAToIPAUnitTests(unittest.TestCase):
+  def test_get_ipa_of_symbol__stress__is_placed_before_vowel(self):
+    self.assertEqual("ˈu", get_ipa_of_symbol("UW1"))
+    self.assertEqual("ˌɑ", get_ipa_of_symbol("AA2"))
+    self.assertEqual("ɝ", get_ipa_of_symbol("ER0"))
+    self.assertEqual("ʧ", get_ipa_of_symbol("CH"))
+
+  def test_get_ipa_of_symbol__unknown_symbol__throws_exception(self):
+    with self.assertRaises(Exception):
+      get_ipa_of_symbol("XX1")
+
+  def test_arpa_to_ipa__joins_symbols(self):
+    mapping = get_ipa_mapping(["AA2", "L", "OW1", "DH", "EH1", "R"])
+
+    self.assertEqual("ˌɑlˈoʊ", arpa_to_ipa(["AA2", "L", "OW1"], mapping))
+    self.assertEqual("ðˈɛɹ", arpa_to_ipa(["DH", "EH1", "R"], mapping))
+    self.assertEqual("", arpa_to_ipa([], mapping))
+
+  def test_ipa_dict__eager__converts_all_entries(self):
+    res = IPADict(ENTRIES, ENTRIES_SYMBOLS, eager=True)
+
+    self.assertEqual(2, res.converted_count)
+    self.assertEqual(["tˈu", "tɪ", "tʌ"], res["TO"])
+
+  def test_ipa_dict__lazy__converts_entry_once_on_first_lookup(self):
+    res = IPADict(ENTRIES, ENTRIES_SYMBOLS, eager=False)
+
+    self.assertEqual(0, res.converted_count)
+    first = res["TO"]
+    self.assertIs(first, res["TO"])
+    self.assertEqual(1, res.converted_count)
+    self.assertEqual(["'ALLO", "TO"], list(res))
+    self.assertNotIn("XXL", res)
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_get_all_ipa__to(self):
+    for ipa_mode in (IPA_EAGER, IPA_LAZY):
+      cmu_dict = get_dict(self.folder, silent=True, ipa_mode=ipa_mode)
+
+      self.assertEqual(["tˈu", "tɪ", "tʌ"], cmu_dict.get_all_ipa("to"))
+
+  def test_get_first_ipa__storages__return_same_ipa(self):
+    for storage in (STORAGE_ENCODED, STORAGE_MMAP):
+      cmu_dict = get_dict(self.folder, silent=True, storage=storage, ipa_mode=IPA_EAGER)
+
+      self.assertEqual("ˌɑlˈoʊ", cmu_dict.get_first_ipa("'Allo"))
+      self.assertEqual("ðˈɛɹ", cmu_dict.get_first_ipa("they're"))
+
+  def test_get_first_ipa__unknown_word__throws_exception(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    with self.assertRaises(Exception):
+      cmu_dict.get_first_ipa("xxl")
+
+  def test_load_statistics__eager__records_conversion(self):
+    eager_dict = get_dict(self.folder, silent=True, ipa_mode=IPA_EAGER)
+    lazy_dict = get_dict(self.folder, silent=True, ipa_mode=IPA_LAZY)
+
+    self.assertIn("convert_ipa", [stage.name for stage in eager_dict.load_statistics])
+    self.assertNotIn("convert_ipa", [stage.name for stage in lazy_dict.load_statistics])
+
+  def test_get_dict__unknown_ipa_mode__throws_exception(self):
+    with self.assertRaises(ValueError):
+      get_dict(self.folder, silent=True, ipa_mode="xyz")
+    with self.assertRaises(ValueError):
+      get_dict(self.folder, silent=True, lazy=True, ipa_mode="xyz")
+
+  def test_sentence_to_ipa__uses_own_cache(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    arpa = cmu_dict.sentence_to_arpa_old("to", replace_unknown_with="_")
+    res = cmu_dict.sentence_to_ipa("(to-to) xxl", replace_unknown_with="_")
+
+    self.assertEqual("T UW1", arpa)
+    self.assertEqual("(tˈu-tˈu) ___", res)
+    self.assertEqual(cmu_dict.sentences_to_ipa(["(to-to) xxl"], replace_unknown_with="_"), [res])
+    self.assertEqual(2, cmu_dict.ipa_cache_statistics["size"])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(ARPAToIPAUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
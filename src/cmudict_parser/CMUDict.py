@@ -3,105 +3,650 @@ Remarks:
 https://github.com/cmusphinx/cmudict is newer than 0.7b! It has for example 'declarative' but is has unfortunately no MIT-license.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+import string
+import threading
+from collections import Counter
+from collections.abc import Mapping
+from logging import getLogger
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Set, Tuple, Union)
 
-from cmudict_parser.CMUDictDownloader import ensure_files_are_downloaded
-from cmudict_parser.CMUDictParser import (ARPAPronunciation,
+from cmudict_parser.ARPAEncoding import EncodedARPADict, FirstARPAView
+from cmudict_parser.ARPAToIPA import (IPA_EAGER, IPA_LAZY, IPA_MODES,
+                                      FirstIPAView, IPADict, IPAPronunciation,
+                                      IPAPronunciations)
+from cmudict_parser.CMUDictCache import (get_cache_path, get_files_hash,
+                                         load_cache, remove_outdated_caches,
+                                         save_cache)
+from cmudict_parser.CMUDictDownloader import (Checksums,
+                                              ensure_files_are_downloaded)
+from cmudict_parser.CMUDictFuzzyIndex import (DEFAULT_MAX_DISTANCE, FuzzyIndex,
+                                              FuzzyMatch)
+from cmudict_parser.CMUDictInstrumentation import LoadRecorder, LoadStage
+from cmudict_parser.CMUDictMapped import (MAPPED_FILE_EXTENSION,
+                                          MappedARPADict, is_valid_mapped_dict,
+                                          write_mapped_dict)
+from cmudict_parser.CMUDictNGramIndex import NGramIndex
+from cmudict_parser.CMUDictParser import (ARPADict, ARPAPronunciation,
                                           ARPAPronunciations, ARPASymbol, Word,
                                           parse)
+from cmudict_parser.CMUDictPrefixIndex import PrefixIndex
+from cmudict_parser.CMUDictReverseIndex import ReverseIndex
+from cmudict_parser.CMUDictRhymeIndex import RhymeIndex
+from cmudict_parser.CMUDictStatistics import DEFAULT_TOP_K, LookupStatistics
+from cmudict_parser.CMUDictStressless import StresslessARPADict
+from cmudict_parser.SentenceToIPA import (DEFAULT_CACHE_SIZE, ConversionCache,
+                                          UpperKeyDict)
 from cmudict_parser.SentenceToIPA import sentence_to_ipa as get_ipa_of_sentence
+from cmudict_parser.SentenceToIPA import \
+    sentences_to_ipa as get_ipa_of_sentences
+
+if TYPE_CHECKING:
+  from cmudict_parser.CMUDictNumPy import PhonemeArrays
 
 ENG_SPACE = " "
 ARPA_SPACE = " "
 ARPA_UNKNOWN = "<UNK>"
 ARPA_ALLOWED_PUNCTUATION = {"!", "?", ".", ",", ";", "\"", "'", "-"}
 
+STORAGE_LISTS = "lists"
+STORAGE_ENCODED = "encoded"
+STORAGE_MMAP = "mmap"
+STORAGES = {STORAGE_LISTS, STORAGE_ENCODED, STORAGE_MMAP}
+
 
 def join_lists(lists: List[List[Any]], join_with: List[Any]) -> List[Any]:
   if len(lists) == 0:
     return []
   if len(lists) == 1:
     return lists[0]
-  result = lists[0]
+  result = list(lists[0])
   for i in range(1, len(lists)):
     result.extend(join_with)
     result.extend(lists[i])
   return result
 
 
+class ARPAStringView(Mapping):
+  ''' View on the first pronunciations as strings, e.g. "T UW1", which is the value format SentenceToIPA expects. '''
+
+  def __init__(self, entries_first_arpa: Mapping):
+    self._entries_first_arpa = entries_first_arpa
+
+  def __getitem__(self, word: Word) -> str:
+    return ARPA_SPACE.join(self._entries_first_arpa[word])
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries_first_arpa
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries_first_arpa)
+
+  def __len__(self) -> int:
+    return len(self._entries_first_arpa)
+
+
 class CMUDict():
-  def __init__(self):
-    self._loaded = False
+  '''
+  Thread-safety: after loading, the lookups and conversions can be called from several threads at once.
+  They only read the loaded entries and do not lock; the conversion cache is safe for concurrent use.
+  A dictionary which is loaded lazily (get_dict(..., lazy=True)) is loaded exactly once by the first thread which accesses it, the other threads wait for it.
+  Derived lookups, which are built on first use, are built once in the same way.
+  '''
 
-  def _load(self, dictionary_dir: str, silent: bool) -> None:
+  def __init__(self, cache_size: Optional[int] = DEFAULT_CACHE_SIZE):
+    ''' cache_size: maximum number of converted words which are cached, None for no limit '''
     self._loaded = False
-    paths = ensure_files_are_downloaded(dictionary_dir)
-    entries, all_arpa_symbols = parse(paths, silent)
-    self._all_symbols = all_arpa_symbols
+    self._lazy_load_args: Optional[Tuple[str, bool, bool, str, str, Optional[str], Optional[Checksums]]] = None
+    self._lock = threading.RLock()
+    self._cache = ConversionCache(cache_size)
+    # the IPA and the ARPA of a word are cached separately
+    self._ipa_cache = ConversionCache(cache_size)
+    self._statistics: Optional[LookupStatistics] = None
 
-    self._entries_arpa = entries
-    self._entries_first_arpa = self._extract_first_arpa()
-    self._loaded = True
+  def _load(self, dictionary_dir: str, silent: bool, use_cache: bool = True, storage: str = STORAGE_LISTS, ipa_mode: str = IPA_LAZY, base_url: Optional[str] = None, checksums: Optional[Checksums] = None) -> None:
+    # everything is built in local variables and published at the end, _loaded is set last
+    # therefore other threads never see a partly loaded dictionary
+    with self._lock:
+      recorder = LoadRecorder()
+      with recorder.stage("total") as total_counts:
+        with recorder.stage("download"):
+          paths = ensure_files_are_downloaded(dictionary_dir, base_url, checksums)
+        if storage == STORAGE_MMAP:
+          all_symbols, entries_arpa, entries_first_arpa = _load_mapped(paths, silent, use_cache, recorder)
+        elif storage in (STORAGE_LISTS, STORAGE_ENCODED):
+          if use_cache:
+            entries, all_symbols = _parse_cached(paths, silent, recorder)
+          else:
+            entries, all_symbols = parse(paths, silent, recorder)
+
+          if storage == STORAGE_ENCODED:
+            with recorder.stage("encode") as counts:
+              entries_arpa = EncodedARPADict(entries, all_symbols)
+              entries_first_arpa = FirstARPAView(entries_arpa)
+              counts["words"] = len(entries_arpa)
+          else:
+            entries_arpa = entries
+            with recorder.stage("extract_first_arpa") as counts:
+              entries_first_arpa = _extract_first_arpa(entries)
+              counts["words"] = len(entries_first_arpa)
+        else:
+          raise ValueError(f"Unknown storage \"{storage}\"!")
+        if ipa_mode == IPA_EAGER:
+          with recorder.stage("convert_ipa") as counts:
+            entries_ipa: Optional[IPADict] = IPADict(entries_arpa, all_symbols, eager=True)
+            counts["words"] = len(entries_ipa)
+        elif ipa_mode == IPA_LAZY:
+          entries_ipa = None
+        else:
+          raise ValueError(f"Unknown IPA mode \"{ipa_mode}\"!")
+        total_counts["words"] = len(entries_arpa)
+      self._all_symbols = all_symbols
+      self._entries_arpa = entries_arpa
+      self._entries_first_arpa = entries_first_arpa
+      self._entries_ipa = entries_ipa
+      self._storage = storage
+      self._load_stages = recorder.stages
+      self._first_arpa_lookup: Optional[UpperKeyDict] = None
+      self._first_ipa_lookup: Optional[UpperKeyDict] = None
+      self._prefix_index: Optional[PrefixIndex] = None
+      self._reverse_index: Optional[ReverseIndex] = None
+      self._reverse_index_without_stress: Optional[ReverseIndex] = None
+      self._rhyme_index: Optional[RhymeIndex] = None
+      self._rhyme_index_without_secondary_stress: Optional[RhymeIndex] = None
+      self._ngram_index: Optional[NGramIndex] = None
+      self._fuzzy_index: Optional[FuzzyIndex] = None
+      self._stressless_arpa: Optional[StresslessARPADict] = None
+      self._stressless_first_arpa: Optional[FirstARPAView] = None
+      self._index_stages: List[LoadStage] = []
+      self._lazy_load_args = None
+      self._loaded = True
+
+  def _set_lazy_load(self, dictionary_dir: str, silent: bool, use_cache: bool, storage: str, ipa_mode: str, base_url: Optional[str], checksums: Optional[Checksums]) -> None:
+    if storage not in STORAGES:
+      raise ValueError(f"Unknown storage \"{storage}\"!")
+    if ipa_mode not in IPA_MODES:
+      raise ValueError(f"Unknown IPA mode \"{ipa_mode}\"!")
+    self._lazy_load_args = (dictionary_dir, silent, use_cache, storage, ipa_mode, base_url, checksums)
+
+  @property
+  def load_statistics(self) -> List[LoadStage]:
+    ''' Duration and counts of each stage of the last load, the stage "total" is the last one. '''
+    self._ensure_data_is_loaded()
+    return self._load_stages
+
+  @property
+  def index_statistics(self) -> List[LoadStage]:
+    ''' Duration, number of entries and memory_bytes of each index which was built since the last load, e.g. the stage "build_prefix_index". '''
+    self._ensure_data_is_loaded()
+    return list(self._index_stages)
+
+  @property
+  def storage(self) -> str:
+    self._ensure_data_is_loaded()
+    return self._storage
 
   @property
   def all_phoneme_symbols(self) -> Set[ARPASymbol]:
+    self._ensure_data_is_loaded()
     return self._all_symbols
 
   def _ensure_data_is_loaded(self) -> None:
-    if not self._loaded:
-      raise Exception("Please load the dictionary first.")
+    if self._loaded:
+      return
+    with self._lock:
+      # another thread could have loaded the dictionary while this one was waiting
+      if self._loaded:
+        return
+      if self._lazy_load_args is None:
+        raise Exception("Please load the dictionary first.")
+      self._load(*self._lazy_load_args)
 
-  def _extract_first_arpa(self) -> Dict[Word, ARPAPronunciation]:
-    result: Dict[Word, ARPAPronunciation] = {
-      word: arpa_pronunciations[0] for word, arpa_pronunciations in self._entries_arpa.items()
-    }
+  def _get_or_create(self, attribute: str, factory: Callable[[], Any]) -> Any:
+    ''' Returns the derived lookup which is stored in the attribute, it is created by the first caller only. '''
+    result = getattr(self, attribute)
+    if result is None:
+      with self._lock:
+        result = getattr(self, attribute)
+        if result is None:
+          result = factory()
+          setattr(self, attribute, result)
     return result
 
+  def _get_index(self, attribute: str, name: str, factory: Callable[[], Any]) -> Any:
+    ''' Like _get_or_create for indexes, the build is recorded as stage "build_<name>". '''
+    def build() -> Any:
+      recorder = LoadRecorder()
+      with recorder.stage(f"build_{name}") as counts:
+        index = factory()
+        counts["entries"] = len(index)
+        counts["memory_bytes"] = index.get_memory_size()
+      self._index_stages.append(recorder.stages[-1])
+      return index
+    return self._get_or_create(attribute, build)
+
+  def _get_prefix_index(self) -> PrefixIndex:
+    self._ensure_data_is_loaded()
+    return self._get_index("_prefix_index", "prefix_index", lambda: PrefixIndex(self._entries_arpa.keys()))
+
+  def _get_reverse_index(self, stress: bool) -> ReverseIndex:
+    self._ensure_data_is_loaded()
+    if stress:
+      return self._get_index("_reverse_index", "reverse_index", lambda: ReverseIndex(self._entries_arpa, stress=True))
+    return self._get_index("_reverse_index_without_stress", "reverse_index_without_stress",
+                           lambda: ReverseIndex(self._entries_arpa, stress=False))
+
+  def _get_rhyme_index(self, secondary_stress: bool) -> RhymeIndex:
+    self._ensure_data_is_loaded()
+    if secondary_stress:
+      return self._get_index("_rhyme_index", "rhyme_index", lambda: RhymeIndex(self._entries_arpa, secondary_stress=True))
+    return self._get_index("_rhyme_index_without_secondary_stress", "rhyme_index_without_secondary_stress",
+                           lambda: RhymeIndex(self._entries_arpa, secondary_stress=False))
+
+  def _get_ngram_index(self) -> NGramIndex:
+    self._ensure_data_is_loaded()
+    return self._get_index("_ngram_index", "ngram_index", lambda: NGramIndex(self._entries_arpa))
+
+  def _get_fuzzy_index(self) -> FuzzyIndex:
+    self._ensure_data_is_loaded()
+    return self._get_index("_fuzzy_index", "fuzzy_index", lambda: FuzzyIndex(self._entries_arpa.keys()))
+
+  def _get_stressless_arpa(self) -> StresslessARPADict:
+    self._ensure_data_is_loaded()
+    return self._get_index("_stressless_arpa", "stressless_arpa", lambda: StresslessARPADict(self._entries_arpa))
+
+  def _get_entries_arpa(self, stress: bool) -> Mapping:
+    self._ensure_data_is_loaded()
+    return self._entries_arpa if stress else self._get_stressless_arpa()
+
+  def _get_entries_first_arpa(self, stress: bool) -> Mapping:
+    self._ensure_data_is_loaded()
+    if stress:
+      return self._entries_first_arpa
+    return self._get_or_create("_stressless_first_arpa", lambda: FirstARPAView(self._get_stressless_arpa()))
+
+  def _get_first_arpa_lookup(self) -> UpperKeyDict:
+    # the keys are checked only once and not on every converted word
+    return self._get_or_create("_first_arpa_lookup", lambda: UpperKeyDict(ARPAStringView(self._entries_first_arpa)))
+
+  def _get_entries_ipa(self) -> IPADict:
+    # an eager dictionary is converted while loading, a lazy one converts each word on its first lookup
+    self._ensure_data_is_loaded()
+    return self._get_or_create("_entries_ipa", lambda: IPADict(self._entries_arpa, self._all_symbols, eager=False))
+
+  def _get_first_ipa_lookup(self) -> UpperKeyDict:
+    return self._get_or_create("_first_ipa_lookup", lambda: UpperKeyDict(FirstIPAView(self._get_entries_ipa())))
+
+  def sentence_to_ipa(self, sentence: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool = True) -> str:
+    assert sentence is not None
+    self._ensure_data_is_loaded()
+    if self._statistics is not None:
+      self._record_words_of_sentences((sentence,))
+    return get_ipa_of_sentence(self._get_first_ipa_lookup(), sentence, replace_unknown_with, use_caching, self._ipa_cache)
+
+  def sentences_to_ipa(self, sentences: Iterable[str], replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool = True) -> List[str]:
+    ''' Batch version of sentence_to_ipa; every distinct word of the batch is converted only once. '''
+    self._ensure_data_is_loaded()
+    if self._statistics is not None:
+      sentences = list(sentences)
+      for sentence in sentences:
+        self._record_words_of_sentences((sentence,))
+    return get_ipa_of_sentences(self._get_first_ipa_lookup(), sentences, replace_unknown_with, use_caching, self._ipa_cache)
+
   def sentence_to_arpa_old(self, sentence: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool = True) -> str:
     assert sentence is not None
     self._ensure_data_is_loaded()
-    return get_ipa_of_sentence(self._entries_first_arpa, sentence, replace_unknown_with, use_caching)
+    if self._statistics is not None:
+      self._record_words_of_sentences((sentence,))
+    return get_ipa_of_sentence(self._get_first_arpa_lookup(), sentence, replace_unknown_with, use_caching, self._cache)
 
-  def sentence_to_arpa(self, sentence: str) -> ARPAPronunciation:
+  def sentence_to_arpa(self, sentence: str, stress: bool = True) -> ARPAPronunciation:
+    ''' stress: False to return the symbols without stress markers '''
     assert isinstance(sentence, str)
-    self._ensure_data_is_loaded()
+    entries_first_arpa = self._get_entries_first_arpa(stress)
+    unknown_words: Optional["Counter[Word]"] = None if self._statistics is None else Counter()
     tmp = []
     for word in sentence.split(ENG_SPACE):
-      if self.contains(word):
-        arpa_pronunciation = self.get_first_arpa(word)
+      arpa_pronunciation = entries_first_arpa.get(word.upper(), None)
+      if arpa_pronunciation is not None:
         tmp.append(arpa_pronunciation)
       else:
         tmp.append([ARPA_UNKNOWN])
+        if unknown_words is not None:
+          unknown_words[word] += 1
+    if unknown_words is not None:
+      self._statistics.record_counts(len(tmp) - sum(unknown_words.values()), unknown_words)
     return join_lists(tmp, join_with=[ARPA_SPACE])
 
+  def sentences_to_arpa_old(self, sentences: Iterable[str], replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool = True) -> List[str]:
+    ''' Batch version of sentence_to_arpa_old; every distinct word of the batch is converted only once. '''
+    self._ensure_data_is_loaded()
+    if self._statistics is not None:
+      sentences = list(sentences)
+      for sentence in sentences:
+        self._record_words_of_sentences((sentence,))
+    return get_ipa_of_sentences(self._get_first_arpa_lookup(), sentences, replace_unknown_with, use_caching, self._cache)
+
+  def sentences_to_arpa(self, sentences: Iterable[str], stress: bool = True) -> List[ARPAPronunciation]:
+    '''
+    Batch version of sentence_to_arpa.
+    Unlike the other batch conversions it does not deduplicate the words of the batch, a lookup costs less than remembering its result.
+    '''
+    entries_first_arpa = self._get_entries_first_arpa(stress)
+    # only copied into the results, therefore all unknown words can share it
+    unknown = [ARPA_UNKNOWN]
+    unknown_words: Optional["Counter[Word]"] = None if self._statistics is None else Counter()
+    lookups = 0
+    result = []
+    for sentence in sentences:
+      assert isinstance(sentence, str)
+      arpa_of_sentence: ARPAPronunciation = []
+      words = sentence.split(ENG_SPACE)
+      if unknown_words is None:
+        for word in words:
+          arpa_of_sentence.append(ARPA_SPACE)
+          arpa_of_sentence.extend(entries_first_arpa.get(word.upper(), unknown))
+      else:
+        # a separate loop keeps the counting out of the loop without statistics
+        for word in words:
+          arpa_of_word = entries_first_arpa.get(word.upper(), unknown)
+          if arpa_of_word is unknown:
+            unknown_words[word] += 1
+          arpa_of_sentence.append(ARPA_SPACE)
+          arpa_of_sentence.extend(arpa_of_word)
+        lookups += len(words)
+      # every word is preceded by a space, the split returns at least one word
+      del arpa_of_sentence[0]
+      result.append(arpa_of_sentence)
+    if unknown_words is not None:
+      self._statistics.record_counts(lookups - sum(unknown_words.values()), unknown_words)
+    return result
+
   def contains(self, word: Word) -> bool:
     assert isinstance(word, str)
     self._ensure_data_is_loaded()
     result = word.upper() in self._entries_arpa.keys()
+    if self._statistics is not None:
+      self._statistics.record(word, result)
+    return result
+
+  def get_first_arpa(self, word: Word, stress: bool = True) -> ARPAPronunciation:
+    '''
+    stress: False to return the symbols without stress markers, e.g. ["T", "UW"] for "to"
+    The table of pronunciations without stress is built on the first call with stress=False.
+    '''
+    assert isinstance(word, str)
+    result = self._get_entries_first_arpa(stress).get(word.upper(), None)
+    if self._statistics is not None:
+      self._statistics.record(word, result is not None)
+    if result is None:
+      raise Exception(f"The word \"{word}\" was not in the dictionary!")
+    return result
+
+  def get_all_arpa(self, word: Word, stress: bool = True) -> ARPAPronunciations:
+    assert isinstance(word, str)
+    '''
+    Returns list of ARPAbet pronunciations of the given word.
+    stress: False to return the pronunciations without stress markers; pronunciations which differ only in the stress are returned once
+    '''
+    result = self._get_entries_arpa(stress).get(word.upper(), None)
+    if self._statistics is not None:
+      self._statistics.record(word, result is not None)
+    if result is None:
+      raise Exception(f"The word \"{word}\" was not in the dictionary!")
     return result
 
-  def get_first_arpa(self, word: Word) -> ARPAPronunciation:
+  def get_first_ipa(self, word: Word) -> IPAPronunciation:
     assert isinstance(word, str)
     self._ensure_data_is_loaded()
-    result = self._entries_first_arpa.get(word.upper(), None)
+    entries_ipa = self._get_entries_ipa()
+    upper_word = word.upper()
+    result = entries_ipa[upper_word][0] if upper_word in entries_ipa else None
+    if self._statistics is not None:
+      self._statistics.record(word, result is not None)
     if result is None:
       raise Exception(f"The word \"{word}\" was not in the dictionary!")
     return result
 
-  def get_all_arpa(self, word: Word) -> ARPAPronunciations:
+  def get_all_ipa(self, word: Word) -> IPAPronunciations:
     assert isinstance(word, str)
-    '''Returns list of ARPAbet pronunciations of the given word.'''
+    '''Returns list of IPA pronunciations of the given word.'''
     self._ensure_data_is_loaded()
-    result = self._entries_arpa.get(word.upper(), None)
+    result = self._get_entries_ipa().get(word.upper(), None)
+    if self._statistics is not None:
+      self._statistics.record(word, result is not None)
     if result is None:
       raise Exception(f"The word \"{word}\" was not in the dictionary!")
     return result
 
+  def words_with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Word]:
+    '''
+    Returns the sorted words which start with the prefix, e.g. for autocompletion; only the first limit words if a limit is given.
+    The prefix index is built on the first prefix query.
+    '''
+    return self._get_prefix_index().words_with_prefix(prefix, limit)
+
+  def count_words_with_prefix(self, prefix: str) -> int:
+    return self._get_prefix_index().count_words_with_prefix(prefix)
+
+  def longest_prefix_match(self, token: str) -> Optional[Word]:
+    ''' Returns the longest word which is a prefix of the token, e.g. "TO" for "toxyz", None if there is none. '''
+    return self._get_prefix_index().longest_prefix_match(token)
+
+  def get_words_for_arpa(self, pronunciation: Union[str, ARPAPronunciation], stress: bool = True) -> List[Word]:
+    '''
+    Returns the words which have the pronunciation, e.g. ["KNOW", "NO", "NOH"] for "N OW1".
+    pronunciation: list of symbols or a string like "N OW1"
+    stress: False to ignore the stress markers
+    The reverse index is built on the first call, one for each value of stress.
+    '''
+    return self._get_reverse_index(stress).get_words(pronunciation)
+
+  def homophones(self, word: Word, stress: bool = True) -> List[Word]:
+    ''' Returns the other words which share at least one pronunciation with the word. '''
+    return self._get_other_words(self._get_reverse_index(stress), word)
+
+  def rhymes_for_arpa(self, pronunciation: Union[str, ARPAPronunciation], secondary_stress: bool = True) -> List[Word]:
+    '''
+    Returns the words which rhyme with the pronunciation: their pronunciations are equal from the last vowel with primary stress to the end.
+    pronunciation: list of symbols or a string like "T UW1"
+    secondary_stress: False to ignore the secondary stress after the vowel with primary stress
+    The rhyme index is built on the first call, one for each value of secondary_stress.
+    '''
+    return self._get_rhyme_index(secondary_stress).get_words(pronunciation)
+
+  def rhymes(self, word: Word, secondary_stress: bool = True) -> List[Word]:
+    ''' Returns the other words which rhyme with at least one pronunciation of the word. '''
+    return self._get_other_words(self._get_rhyme_index(secondary_stress), word)
+
+  def words_containing_arpa(self, sequence: Union[str, ARPAPronunciation], stress: bool = True) -> List[Word]:
+    '''
+    Returns the words with a pronunciation which contains the sequence of symbols, e.g. "S T R" for "STREET" and "DESTROY".
+    sequence: list of symbols or a string like "S T R"
+    stress: False to ignore the stress markers
+    The n-gram index is built on the first call.
+    '''
+    return self._get_ngram_index().get_words(sequence, stress)
+
+  def get_closest_words(self, word: Word, max_distance: int = DEFAULT_MAX_DISTANCE, limit: Optional[int] = None) -> List[FuzzyMatch]:
+    '''
+    Returns the words within the edit distance and their distance, e.g. [("RECEIVE", 1)] for "recieve"; sorted by the distance and then by the word.
+    Insertions, deletions, substitutions and transpositions of adjacent letters count as one edit each.
+    max_distance: at most DEFAULT_MAX_DISTANCE
+    limit: maximum number of returned words
+    The fuzzy index is built on the first call.
+    '''
+    return self._get_fuzzy_index().get_closest_words(word, max_distance, limit)
+
+  def to_numpy(self) -> "PhonemeArrays":
+    '''
+    Returns all pronunciations as NumPy arrays of symbol IDs with the word index and the number of pronunciations of each word, see CMUDictNumPy.
+    Needs NumPy, which is an optional dependency.
+    '''
+    # NumPy is imported only if it is used
+    from cmudict_parser.CMUDictNumPy import get_phoneme_arrays
+    self._ensure_data_is_loaded()
+    return get_phoneme_arrays(self._entries_arpa, self._all_symbols)
+
+  def _get_other_words(self, index: ReverseIndex, word: Word) -> List[Word]:
+    upper_word = word.upper()
+    # the dict removes the words which are found for several pronunciations and keeps the order
+    result = dict.fromkeys(other_word for pronunciation in self.get_all_arpa(word)
+                           for other_word in index.get_words(pronunciation) if other_word != upper_word)
+    return list(result)
+
+  def iter_words_of_sentence(self, sentence: str) -> Iterator[Tuple[Word, bool]]:
+    '''
+    Yields the words of the sentence which the conversions look up and whether they are in the dictionary, without counting them in the lookup statistics.
+    The punctuation around a word is removed and a hyphenated word which is not in the dictionary is split into its parts.
+    '''
+    self._ensure_data_is_loaded()
+    entries_first_arpa = self._entries_first_arpa
+    for token in sentence.split(ENG_SPACE):
+      word = token.strip(string.punctuation)
+      if len(word) == 0:
+        continue
+      if "-" in word and word.upper() not in entries_first_arpa:
+        for part in word.split("-"):
+          if len(part) > 0:
+            yield part, part.upper() in entries_first_arpa
+      else:
+        yield word, word.upper() in entries_first_arpa
+
+  def _record_words_of_sentences(self, sentences: Iterable[str]) -> None:
+    # the conversion caches whole words with punctuation, therefore the words are looked up once more for the statistics
+    hits = 0
+    unknown_words: "Counter[Word]" = Counter()
+    for sentence in sentences:
+      for word, is_known in self.iter_words_of_sentence(sentence):
+        if is_known:
+          hits += 1
+        else:
+          unknown_words[word] += 1
+    self._statistics.record_counts(hits, unknown_words)
+
+  def enable_statistics(self, top_k: int = DEFAULT_TOP_K) -> None:
+    ''' Starts counting lookups, hits, misses and the top_k most frequent unknown words of all lookups and conversions. '''
+    self._statistics = LookupStatistics(top_k)
+
+  def disable_statistics(self) -> None:
+    self._statistics = None
+
+  @property
+  def lookup_statistics(self) -> Dict[str, Any]:
+    '''
+    Snapshot of lookups, hits, misses, oov_rate and top_unknown_words (word, count, maximum overestimation of the count), and of the statistics of both caches.
+    Words of conversions are counted once per occurrence; unknown words are counted in upper case.
+    '''
+    if self._statistics is None:
+      raise Exception("Please enable the statistics first.")
+    result = self._statistics.snapshot()
+    result["cache"] = self._cache.statistics
+    result["ipa_cache"] = self._ipa_cache.statistics
+    return result
+
+  def reset_statistics(self) -> None:
+    ''' Resets the lookup and the cache statistics. '''
+    if self._statistics is not None:
+      self._statistics.reset()
+    self._cache.reset_statistics()
+    self._ipa_cache.reset_statistics()
+
+  @property
+  def cache_statistics(self) -> Dict[str, Any]:
+    ''' hits, misses, evictions, size and max_size of the cache of words which are converted by sentence_to_arpa_old '''
+    return self._cache.statistics
+
+  @property
+  def ipa_cache_statistics(self) -> Dict[str, Any]:
+    ''' Like cache_statistics for the cache of sentence_to_ipa. '''
+    return self._ipa_cache.statistics
+
+  def clear_cache(self) -> None:
+    self._cache.clear()
+    self._ipa_cache.clear()
+
   def __len__(self) -> int:
+    self._ensure_data_is_loaded()
     return len(self._entries_arpa)
 
+  def __getstate__(self) -> Dict[str, Any]:
+    # locks can not be pickled, e.g. for the workers of convert_parallel
+    state = self.__dict__.copy()
+    del state["_lock"]
+    return state
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    self.__dict__.update(state)
+    self._lock = threading.RLock()
+
+
+def _extract_first_arpa(entries: ARPADict) -> Dict[Word, ARPAPronunciation]:
+  result: Dict[Word, ARPAPronunciation] = {
+    word: arpa_pronunciations[0] for word, arpa_pronunciations in entries.items()
+  }
+  return result
+
+
+def _get_files_hash(paths: Tuple[str, str, str], recorder: LoadRecorder) -> str:
+  symbols_path, _, dict_path = paths
+  with recorder.stage("hash_files"):
+    return get_files_hash(symbols_path, dict_path)
+
+
+def _load_mapped(paths: Tuple[str, str, str], silent: bool, use_cache: bool, recorder: LoadRecorder) -> Tuple[Set[ARPASymbol], MappedARPADict, FirstARPAView]:
+  _, _, dict_path = paths
+  mapped_path = get_cache_path(dict_path, _get_files_hash(paths, recorder), MAPPED_FILE_EXTENSION)
+  if not is_valid_mapped_dict(mapped_path):
+    if use_cache:
+      entries, all_arpa_symbols = _parse_cached(paths, silent, recorder)
+    else:
+      entries, all_arpa_symbols = parse(paths, silent, recorder)
+    with recorder.stage("write_mapped") as counts:
+      remove_outdated_caches(mapped_path)
+      write_mapped_dict(mapped_path, entries, all_arpa_symbols)
+      counts["words"] = len(entries)
+  with recorder.stage("open_mapped") as counts:
+    mapped_entries = MappedARPADict(mapped_path)
+    counts["words"] = len(mapped_entries)
+  return mapped_entries.symbols, mapped_entries, FirstARPAView(mapped_entries)
+
+
+def _parse_cached(paths: Tuple[str, str, str], silent: bool, recorder: LoadRecorder) -> Tuple[ARPADict, Set[ARPASymbol]]:
+  _, _, dict_path = paths
+  cache_path = get_cache_path(dict_path, _get_files_hash(paths, recorder))
+  with recorder.stage("load_snapshot") as counts:
+    cached = load_cache(cache_path)
+    counts["hit"] = int(cached is not None)
+  if cached is not None:
+    return cached
+  entries, all_arpa_symbols = parse(paths, silent, recorder)
+  with recorder.stage("save_snapshot") as counts:
+    try:
+      save_cache(cache_path, entries, all_arpa_symbols)
+      counts["saved"] = 1
+    except OSError as error:
+      counts["saved"] = 0
+      logger = getLogger(__name__)
+      logger.warning(f"The parsed dictionary could not be cached: {error}")
+  return entries, all_arpa_symbols
+
 
-def get_dict(download_folder: str = "/tmp", silent: bool = False) -> CMUDict:
-  result = CMUDict()
-  result._load(download_folder, silent)
+def get_dict(download_folder: str = "/tmp", silent: bool = False, use_cache: bool = True, storage: str = STORAGE_LISTS, cache_size: Optional[int] = DEFAULT_CACHE_SIZE, lazy: bool = False, statistics: bool = False, ipa_mode: str = IPA_LAZY, base_url: Optional[str] = None, checksums: Optional[Checksums] = None) -> CMUDict:
+  '''
+  storage: STORAGE_LISTS keeps all entries in memory, STORAGE_ENCODED keeps them in memory as bytes of symbol IDs, STORAGE_MMAP opens a memory-mapped file next to the downloaded files which is shared by all processes on the host.
+  cache_size: maximum number of converted words which are cached, None for no limit
+  lazy: the dictionary is loaded on its first use instead of now, which is safe if several threads use it at once
+  statistics: count lookups and unknown words, see CMUDict.lookup_statistics
+  ipa_mode: IPA_EAGER converts all entries to IPA while loading, IPA_LAZY converts each word on its first IPA lookup and keeps it
+  base_url: URL or local mirror folder of the dictionary files which are downloaded if they are missing, see CMUDictDownloader
+  checksums: SHA-256 of the dictionary files by filename, e.g. {DICT_FILENAME: "..."}; a file with another checksum is downloaded again, a download with another checksum fails
+  '''
+  result = CMUDict(cache_size)
+  if statistics:
+    result.enable_statistics()
+  if lazy:
+    result._set_lazy_load(download_folder, silent, use_cache, storage, ipa_mode, base_url, checksums)
+  else:
+    result._load(download_folder, silent, use_cache, storage, ipa_mode, base_url, checksums)
   return result
@@ -1,31 +1,69 @@
+import sys
 import unittest
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
 
-from cmudict_parser.CMUDict import CMUDict, get_dict
+from cmudict_parser.CMUDict import (STORAGE_ENCODED, STORAGE_LISTS,
+                                    STORAGE_MMAP, CMUDict, get_dict)
 
-cmu_dict_instance: Optional[CMUDict] = None
+cmu_dict_instances: Dict[str, CMUDict] = {}
+
+THREAD_SENTENCES = [f"to {'no ' * (i % 4)}xxl{i % 7}, (higgledy-myself) a{'.' * (i % 2)}" for i in range(300)]
+
+
+def convert_all(cmu_dict: CMUDict, offset: int) -> Dict[str, Any]:
+  # every thread starts at another sentence, so that the threads work on different words at the same time
+  sentences = THREAD_SENTENCES[offset:] + THREAD_SENTENCES[:offset]
+  result: Dict[str, Any] = {}
+  for sentence, batch_result in zip(sentences, cmu_dict.sentences_to_arpa_old(sentences, replace_unknown_with="_")):
+    result[sentence] = (
+      cmu_dict.sentence_to_arpa_old(sentence, replace_unknown_with="_"),
+      cmu_dict.sentence_to_arpa(sentence),
+      [cmu_dict.contains(word) for word in sentence.split(" ")],
+      batch_result,
+    )
+  result["to"] = cmu_dict.get_all_arpa("to")
+  return result
 
 
 class UnitTests(unittest.TestCase):
+  storage = STORAGE_LISTS
+
   def __init__(self, methodName: str) -> None:
-    global cmu_dict_instance
-    if cmu_dict_instance is None:
-      cmu_dict_instance = get_dict(silent=True)
-    self.cmu_dict = cmu_dict_instance
+    if self.storage not in cmu_dict_instances:
+      cmu_dict_instances[self.storage] = get_dict(silent=True, storage=self.storage)
+    self.cmu_dict = cmu_dict_instances[self.storage]
     super().__init__(methodName)
 
   def test_sentence_to_ipa__with_caching__executes_custom_func_only_once(self):
     input_word = "xyzxyz"
     assert not self.cmu_dict.contains(input_word.upper())
+    calls = []
+
+    def replace(word: str) -> str:
+      calls.append(word)
+      return str(len(calls) - 1)
 
     res = [self.cmu_dict.sentence_to_ipa(
       sentence=input_word,
-      replace_unknown_with=lambda _: str(i),
+      replace_unknown_with=replace,
       use_caching=True
-    ) for i in range(2)]
+    ) for _ in range(2)]
 
     self.assertEqual(["0", "0"], res)
 
+  def test_sentence_to_ipa__with_caching__different_replace_unknown_with__are_cached_separately(self):
+    input_word = "xyzxyz"
+    assert not self.cmu_dict.contains(input_word.upper())
+
+    res = [self.cmu_dict.sentence_to_ipa(
+      sentence=input_word,
+      replace_unknown_with=replace_unknown_with,
+      use_caching=True
+    ) for replace_unknown_with in ["_", "-", "_", None]]
+
+    self.assertEqual(["______", "------", "______", "xyzxyz"], res)
+
   def test_sentence_to_ipa__without_caching__executes_custom_func(self):
     input_word = "xyzxyz"
     assert not self.cmu_dict.contains(input_word.upper())
@@ -41,14 +79,75 @@ class UnitTests(unittest.TestCase):
   def test_sentence_to_ipa__uses_caching_by_default(self):
     input_word = "xyzxyz"
     assert not self.cmu_dict.contains(input_word.upper())
+    calls = []
+
+    def replace(word: str) -> str:
+      calls.append(word)
+      return str(len(calls) - 1)
 
     res = [self.cmu_dict.sentence_to_ipa(
       sentence=input_word,
-      replace_unknown_with=lambda _: str(i)
-    ) for i in range(2)]
+      replace_unknown_with=replace
+    ) for _ in range(2)]
 
     self.assertEqual(["0", "0"], res)
 
+  def test_sentences_to_arpa__returns_same_results_as_sentence_to_arpa(self):
+    sentences = ["to no", "xxl to  to", "", "no"]
+    res = self.cmu_dict.sentences_to_arpa(sentences)
+
+    self.assertEqual([self.cmu_dict.sentence_to_arpa(sentence) for sentence in sentences], res)
+
+  def test_sentences_to_arpa_old__returns_same_results_as_sentence_to_arpa_old(self):
+    sentences = ["(to-no) xxl", "to, to."]
+    res = self.cmu_dict.sentences_to_arpa_old(sentences, replace_unknown_with="_", use_caching=False)
+
+    self.assertEqual([self.cmu_dict.sentence_to_arpa_old(sentence, replace_unknown_with="_",
+                     use_caching=False) for sentence in sentences], res)
+
+  def test_cache_statistics__sentence_to_arpa_old__counts_hits_and_evictions(self):
+    cmu_dict = get_dict(silent=True, storage=self.storage, cache_size=1)
+    cmu_dict.sentence_to_arpa_old("to to no", replace_unknown_with="_")
+    res = cmu_dict.cache_statistics
+
+    self.assertEqual({"hits": 1, "misses": 2, "evictions": 1, "size": 1, "max_size": 1}, res)
+
+  def test_clear_cache__clears_only_own_cache(self):
+    cmu_dict1 = get_dict(silent=True, storage=self.storage)
+    cmu_dict2 = get_dict(silent=True, storage=self.storage)
+    cmu_dict1.sentence_to_arpa_old("to", replace_unknown_with="_")
+    cmu_dict2.sentence_to_arpa_old("to", replace_unknown_with="_")
+    cmu_dict1.clear_cache()
+
+    self.assertEqual(0, cmu_dict1.cache_statistics["size"])
+    self.assertEqual(1, cmu_dict2.cache_statistics["size"])
+
+  def test_get_dict__lazy__loads_on_first_use(self):
+    cmu_dict = get_dict(silent=True, storage=self.storage, lazy=True)
+    self.assertFalse(cmu_dict._loaded)
+
+    res = cmu_dict.get_first_arpa("to")
+
+    self.assertTrue(cmu_dict._loaded)
+    self.assertEqual(self.cmu_dict.get_first_arpa("to"), res)
+
+  def test_threads__lazy_dict_with_small_cache__return_same_results_as_one_thread(self):
+    expected = convert_all(self.cmu_dict, 0)
+    # a lazy dictionary is loaded by the first thread and a small cache evicts all the time
+    cmu_dict = get_dict(silent=True, storage=self.storage, cache_size=10, lazy=True)
+    thread_count = 16
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+      with ThreadPoolExecutor(thread_count) as executor:
+        res = list(executor.map(lambda i: convert_all(cmu_dict, i * 17), range(thread_count)))
+    finally:
+      sys.setswitchinterval(switch_interval)
+
+    for thread_res in res:
+      self.assertEqual(expected, thread_res)
+    self.assertLessEqual(cmu_dict.cache_statistics["size"], 10)
+
   def test_len(self):
     res = len(self.cmu_dict)
     self.assertEqual(125022, res)
@@ -405,6 +504,18 @@ class UnitTests(unittest.TestCase):
     self.assertEqual("________--________, mˌaɪsˈɛlf--________, ________--ˈaɪ", res)
 
 
+class EncodedUnitTests(UnitTests):
+  storage = STORAGE_ENCODED
+
+
+class MappedUnitTests(UnitTests):
+  storage = STORAGE_MMAP
+
+
 if __name__ == '__main__':
-  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(UnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(EncodedUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(MappedUnitTests),
+  ])
   unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,63 @@
+"""
+Converts sentences inside an asyncio event loop without blocking it for long.
+The sentences are converted in chunks with the batch methods of CMUDict; between two chunks the control is given back to the event loop.
+Optionally the chunks are converted in an executor, then the event loop is not blocked at all.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import (Any, AsyncIterable, AsyncIterator, Iterable, List,
+                    Optional, Union)
+
+from cmudict_parser.CMUDict import CMUDict
+from cmudict_parser.CMUDictParallel import CONVERSION_ARPA, CONVERSIONS
+
+# a chunk of this size blocks the event loop only for a few milliseconds
+DEFAULT_ASYNC_CHUNK_SIZE = 100
+
+
+async def _iter_chunks_async(sentences: Union[AsyncIterable[str], Iterable[str]], chunk_size: int) -> AsyncIterator[List[str]]:
+  chunk: List[str] = []
+  if hasattr(sentences, "__aiter__"):
+    async for sentence in sentences:
+      chunk.append(sentence)
+      if len(chunk) == chunk_size:
+        yield chunk
+        chunk = []
+  else:
+    for sentence in sentences:
+      chunk.append(sentence)
+      if len(chunk) == chunk_size:
+        yield chunk
+        chunk = []
+  if len(chunk) > 0:
+    yield chunk
+
+
+async def convert_async(cmudict: CMUDict, sentences: Union[AsyncIterable[str], Iterable[str]], conversion: str = CONVERSION_ARPA, chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE, offload: bool = False, executor: Optional[Executor] = None, **kwargs) -> AsyncIterator[Any]:
+  '''
+  Yields the conversion of each sentence in input order, e.g. async for arpa in convert_async(cmudict, sentences): ...
+  sentences: async or normal iterable
+  conversion: name of the batch method of CMUDict, e.g. CONVERSION_ARPA
+  chunk_size: number of sentences which are converted at once, it bounds the time the event loop is blocked
+  offload: convert the chunks in the executor instead of the event loop
+  executor: executor for offload, None for the default executor of the event loop
+  kwargs: passed to the batch method, e.g. replace_unknown_with for CONVERSION_ARPA_OLD and CONVERSION_IPA
+  '''
+  if conversion not in CONVERSIONS:
+    raise ValueError(f"Unknown conversion \"{conversion}\"!")
+  if chunk_size < 1:
+    raise ValueError("Parameter chunk_size needs to be at least 1.")
+  method = getattr(cmudict, conversion)
+  loop = asyncio.get_running_loop()
+
+  async for chunk in _iter_chunks_async(sentences, chunk_size):
+    if offload:
+      converted = await loop.run_in_executor(executor, partial(method, chunk, **kwargs))
+    else:
+      converted = method(chunk, **kwargs)
+    for result in converted:
+      yield result
+    # let other tasks run before the next chunk is converted
+    await asyncio.sleep(0)
@@ -0,0 +1,96 @@
+import asyncio
+import shutil
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictAsync import convert_async
+from cmudict_parser.CMUDictParallel import CONVERSION_ARPA_OLD
+from CMUDictTesting import write_test_dictionary
+
+SENTENCES = [f"to {'no ' * (i % 3)}xxl a{'.' * (i % 2)}" for i in range(250)]
+
+
+async def iter_async(sentences: List[str]) -> AsyncIterator[str]:
+  for sentence in sentences:
+    yield sentence
+
+
+async def collect(iterator: AsyncIterator) -> list:
+  return [result async for result in iterator]
+
+
+class UnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp())
+    cls.cmu_dict = get_dict(cls.folder, silent=True)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_convert_async__async_iterable__returns_results_in_input_order(self):
+    res = asyncio.run(collect(convert_async(self.cmu_dict, iter_async(SENTENCES), chunk_size=7)))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa(SENTENCES), res)
+
+  def test_convert_async__iterable_arpa_old__passes_arguments(self):
+    res = asyncio.run(collect(convert_async(self.cmu_dict, SENTENCES,
+                      CONVERSION_ARPA_OLD, chunk_size=10, replace_unknown_with="_")))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa_old(SENTENCES, replace_unknown_with="_"), res)
+
+  def test_convert_async__offload__returns_same_results(self):
+    with ThreadPoolExecutor(2) as executor:
+      res = asyncio.run(collect(convert_async(self.cmu_dict, SENTENCES, offload=True, executor=executor)))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa(SENTENCES), res)
+
+  def test_convert_async__unknown_conversion__throws_exception(self):
+    with self.assertRaises(ValueError):
+      asyncio.run(collect(convert_async(self.cmu_dict, SENTENCES, "sentence_to_xyz")))
+
+  def test_convert_async__large_input__does_not_stall_event_loop(self):
+    sentences = SENTENCES * 400
+    chunk_size = 50
+
+    start = time.perf_counter()
+    self.cmu_dict.sentences_to_arpa_old(sentences[:chunk_size], replace_unknown_with="_", use_caching=False)
+    chunk_duration = time.perf_counter() - start
+
+    async def measure_stall() -> float:
+      max_stall = 0.0
+      done = asyncio.Event()
+
+      async def heartbeat() -> None:
+        nonlocal max_stall
+        last = time.perf_counter()
+        while not done.is_set():
+          await asyncio.sleep(0)
+          now = time.perf_counter()
+          max_stall = max(max_stall, now - last)
+          last = now
+
+      task = asyncio.create_task(heartbeat())
+      async for _ in convert_async(self.cmu_dict, sentences, CONVERSION_ARPA_OLD, chunk_size=chunk_size, replace_unknown_with="_", use_caching=False):
+        pass
+      done.set()
+      await task
+      return max_stall
+
+    total_start = time.perf_counter()
+    max_stall = asyncio.run(measure_stall())
+    total_duration = time.perf_counter() - total_start
+
+    # the event loop is blocked for about one chunk at most and not for the whole input
+    self.assertLess(max_stall, max(chunk_duration * 10, 0.05))
+    self.assertLess(max_stall, total_duration / 10)
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,160 @@
+"""
+Command-line interface, e.g.: cmudict-parser convert input.txt --output output.txt --workers 4 --stats
+The input is streamed line by line, therefore the memory does not grow with the size of the input.
+"""
+
+import string
+import sys
+import time
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from contextlib import ExitStack
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from cmudict_parser.ARPAToIPA import IPA_EAGER, IPA_LAZY
+from cmudict_parser.CMUDict import (STORAGE_ENCODED, STORAGE_LISTS,
+                                    STORAGE_MMAP, CMUDict, get_dict)
+from cmudict_parser.CMUDictDownloader import FILENAMES
+from cmudict_parser.CMUDictParallel import (CONVERSION_ARPA_OLD,
+                                            CONVERSION_IPA, DEFAULT_CHUNK_SIZE,
+                                            convert_parallel)
+
+FORMAT_ARPA = "arpa"
+FORMAT_IPA = "ipa"
+CONVERSION_OF_FORMAT = {
+  FORMAT_ARPA: CONVERSION_ARPA_OLD,
+  FORMAT_IPA: CONVERSION_IPA,
+}
+
+# number of converted lines which are written at once
+DEFAULT_WRITE_CHUNK_SIZE = 1000
+
+
+class ConversionStatistics():
+  ''' Counts the lines and the words which are not in the dictionary while the lines are streamed. '''
+
+  def __init__(self, cmudict: CMUDict):
+    self._cmudict = cmudict
+    self.lines = 0
+    self.words = 0
+    self.unknown_words = 0
+    self._start = time.perf_counter()
+
+  def count(self, lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+      self.lines += 1
+      # the words are counted like in CMUDict.lookup_statistics, but without changing them
+      for _, is_known in self._cmudict.iter_words_of_sentence(line):
+        self.words += 1
+        if not is_known:
+          self.unknown_words += 1
+      yield line
+
+  def get_summary(self) -> str:
+    duration = time.perf_counter() - self._start
+    lines_per_second = self.lines / duration if duration > 0 else 0.0
+    oov_rate = self.unknown_words / self.words if self.words > 0 else 0.0
+    return (f"lines: {self.lines}, duration: {duration:.2f}s, lines/s: {lines_per_second:.0f}, "
+            f"words: {self.words}, unknown words: {self.unknown_words}, OOV rate: {oov_rate:.2%}")
+
+
+def _read_lines(files: List[IO[str]]) -> Iterator[str]:
+  for file in files:
+    for line in file:
+      yield line.rstrip("\r\n")
+
+
+def _write_chunked(output: IO[str], lines: Iterable[str], write_chunk_size: int) -> None:
+  chunk: List[str] = []
+  for line in lines:
+    chunk.append(line)
+    if len(chunk) == write_chunk_size:
+      output.write("\n".join(chunk) + "\n")
+      chunk = []
+  if len(chunk) > 0:
+    output.write("\n".join(chunk) + "\n")
+  output.flush()
+
+
+def _parse_checksum(value: str) -> Tuple[str, str]:
+  filename, separator, checksum = value.partition("=")
+  if separator == "" or filename not in FILENAMES:
+    raise ArgumentTypeError(f"expected FILENAME=SHA256 with one of the filenames {', '.join(FILENAMES)}")
+  if len(checksum) != 64 or any(char not in string.hexdigits for char in checksum):
+    raise ArgumentTypeError("the SHA-256 needs to be 64 hexadecimal characters")
+  return filename, checksum
+
+
+def convert(args: Namespace) -> None:
+  # the workers inherit the converted entries instead of converting each word again
+  ipa_mode = IPA_EAGER if args.format == FORMAT_IPA and args.workers > 1 else IPA_LAZY
+  cmudict = get_dict(args.dictionary_folder, silent=True, storage=args.storage, ipa_mode=ipa_mode, base_url=args.base_url,
+                     checksums=None if args.checksum is None else dict(args.checksum))
+  with ExitStack() as stack:
+    if len(args.files) == 0 or args.files == ["-"]:
+      inputs = [sys.stdin]
+    else:
+      inputs = [stack.enter_context(open(path, encoding=args.encoding)) for path in args.files]
+    if args.output is None:
+      output = sys.stdout
+    else:
+      output = stack.enter_context(open(args.output, "w", encoding=args.encoding))
+
+    lines = _read_lines(inputs)
+    statistics = None
+    if args.stats:
+      statistics = ConversionStatistics(cmudict)
+      lines = statistics.count(lines)
+    converted = convert_parallel(cmudict, lines, CONVERSION_OF_FORMAT[args.format], workers=args.workers,
+                                 chunk_size=args.chunk_size, replace_unknown_with=args.unknown)
+    _write_chunked(output, converted, args.write_chunk_size)
+
+  if statistics is not None:
+    print(statistics.get_summary(), file=sys.stderr)
+
+
+def get_parser() -> ArgumentParser:
+  parser = ArgumentParser(prog="cmudict-parser", description="Converts text with the CMU Pronouncing Dictionary.")
+  subparsers = parser.add_subparsers(dest="command", required=True)
+
+  convert_parser = subparsers.add_parser("convert", help="convert text line by line")
+  convert_parser.add_argument("files", nargs="*", metavar="FILE",
+                              help="input files, standard input if none or - is given")
+  convert_parser.add_argument("-o", "--output", help="output file, standard output if not given")
+  convert_parser.add_argument("-f", "--format", choices=sorted(CONVERSION_OF_FORMAT),
+                              default=FORMAT_ARPA, help="output format")
+  convert_parser.add_argument("-u", "--unknown", default=None,
+                              help="character which replaces each letter of unknown words, they are kept if not given")
+  convert_parser.add_argument("-w", "--workers", type=int, default=1, help="number of processes")
+  convert_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                              help="number of lines which are converted at once")
+  convert_parser.add_argument("--write-chunk-size", type=int, default=DEFAULT_WRITE_CHUNK_SIZE,
+                              help="number of lines which are written at once")
+  convert_parser.add_argument("-d", "--dictionary-folder", default="/tmp",
+                              help="folder of the dictionary files, they are downloaded if missing")
+  convert_parser.add_argument("--base-url", default=None,
+                              help="URL or local mirror folder the dictionary files are downloaded from")
+  convert_parser.add_argument("--checksum", action="append", type=_parse_checksum, metavar="FILENAME=SHA256",
+                              help="SHA-256 of a dictionary file, a file with another checksum is downloaded again; can be given once per file")
+  convert_parser.add_argument("--storage", choices=[STORAGE_LISTS, STORAGE_ENCODED, STORAGE_MMAP],
+                              default=STORAGE_LISTS, help="how the dictionary is stored")
+  convert_parser.add_argument("--encoding", default="utf-8", help="encoding of the input and output files")
+  convert_parser.add_argument("--stats", action="store_true",
+                              help="print lines/s and the rate of unknown words to standard error")
+  convert_parser.set_defaults(func=convert)
+  return parser
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+  parser = get_parser()
+  args = parser.parse_args(arguments)
+  # checked before any input is read, the conversion would fail only at the first chunk or the first unknown word
+  for name, value in (("--workers", args.workers), ("--chunk-size", args.chunk_size), ("--write-chunk-size", args.write_chunk_size)):
+    if value < 1:
+      parser.error(f"{name} needs to be at least 1")
+  if args.unknown is not None and len(args.unknown) >= 2:
+    parser.error("--unknown can only be 0 or 1 character")
+  args.func(args)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,123 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictCLI import main
+from cmudict_parser.CMUDictDownloader import (DICT_FILENAME, PHONES_FILENAME,
+                                              SYMBOLS_FILENAME, get_sha256)
+from CMUDictTesting import write_test_dictionary
+
+SENTENCES = [f"To {'no, ' * (i % 3)}xxl a{'.' * (i % 2)}" for i in range(25)]
+
+
+class UnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp())
+    cls.input_path = os.path.join(cls.folder, "input.txt")
+    with open(cls.input_path, "w", encoding="utf-8") as f:
+      f.write("\n".join(SENTENCES) + "\n")
+    cls.cmu_dict = get_dict(cls.folder, silent=True)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def _read_output(self, output_path: str) -> list:
+    with open(output_path, encoding="utf-8") as f:
+      return f.read().splitlines()
+
+  def test_convert__file__writes_one_line_per_input_line(self):
+    output_path = os.path.join(self.folder, "output.txt")
+    main(["convert", self.input_path, "-o", output_path, "-d", self.folder, "-u", "_", "--write-chunk-size", "4"])
+
+    expected = self.cmu_dict.sentences_to_arpa_old(SENTENCES, replace_unknown_with="_")
+    self.assertEqual(expected, self._read_output(output_path))
+
+  def test_convert__workers__writes_same_output(self):
+    output_path = os.path.join(self.folder, "output_workers.txt")
+    main(["convert", self.input_path, self.input_path, "-o", output_path,
+         "-d", self.folder, "--workers", "2", "--chunk-size", "3"])
+
+    expected = self.cmu_dict.sentences_to_arpa_old(SENTENCES * 2, replace_unknown_with=None)
+    self.assertEqual(expected, self._read_output(output_path))
+
+  def test_convert__ipa_with_workers__writes_ipa(self):
+    output_path = os.path.join(self.folder, "output_ipa.txt")
+    main(["convert", self.input_path, "-o", output_path, "-d", self.folder, "-f", "ipa", "-u", "_", "--workers", "2"])
+
+    expected = self.cmu_dict.sentences_to_ipa(SENTENCES, replace_unknown_with="_")
+    self.assertEqual(expected, self._read_output(output_path))
+    self.assertEqual("tˈu ___ ʌ", self._read_output(output_path)[0])
+
+  def test_convert__stdin__writes_to_stdout(self):
+    stdout = io.StringIO()
+    with patch("sys.stdin", io.StringIO("to no\r\nnot\n")), redirect_stdout(stdout):
+      main(["convert", "-d", self.folder])
+
+    self.assertEqual("T UW1 N OW1\nN AH1 T\n", stdout.getvalue())
+
+  def test_convert__stats__prints_oov_rate(self):
+    stderr = io.StringIO()
+    with patch("sys.stdin", io.StringIO("to xxl\nno, not.\n")), redirect_stdout(io.StringIO()), redirect_stderr(stderr):
+      main(["convert", "-d", self.folder, "--stats"])
+
+    res = stderr.getvalue()
+    self.assertIn("lines: 2,", res)
+    self.assertIn("words: 4, unknown words: 1, OOV rate: 25.00%", res)
+
+  def test_convert__stats_with_hyphenated_words__counts_like_lookup_statistics(self):
+    text = "to-no xxl-not, (a-to)\n"
+    stderr = io.StringIO()
+    with patch("sys.stdin", io.StringIO(text)), redirect_stdout(io.StringIO()), redirect_stderr(stderr):
+      main(["convert", "-d", self.folder, "--stats"])
+    cmu_dict = get_dict(self.folder, silent=True, statistics=True)
+    cmu_dict.sentence_to_arpa_old(text.rstrip("\n"), replace_unknown_with=None)
+    expected = cmu_dict.lookup_statistics
+
+    self.assertEqual(6, expected["lookups"])
+    self.assertIn(f"words: {expected['lookups']}, unknown words: {expected['misses']},", stderr.getvalue())
+
+  def test_convert__checksum_of_corrupted_file__downloads_file_again(self):
+    folder = tempfile.mkdtemp()
+    try:
+      for filename in (SYMBOLS_FILENAME, PHONES_FILENAME):
+        shutil.copyfile(os.path.join(self.folder, filename), os.path.join(folder, filename))
+      with open(os.path.join(folder, DICT_FILENAME), "w", encoding="latin-1") as f:
+        f.write("A  AH0\n")
+      checksum = get_sha256(os.path.join(self.folder, DICT_FILENAME))
+      stdout = io.StringIO()
+      with patch("sys.stdin", io.StringIO("to no\n")), redirect_stdout(stdout):
+        main(["convert", "-d", folder, "--base-url", self.folder, "--checksum", f"{DICT_FILENAME}={checksum}"])
+
+      self.assertEqual("T UW1 N OW1\n", stdout.getvalue())
+    finally:
+      shutil.rmtree(folder)
+
+  def test_convert__invalid_checksum__exits(self):
+    with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+      main(["convert", "-d", self.folder, "--checksum", f"{DICT_FILENAME}=abc"])
+
+  def test_convert__checksum_of_unknown_file__exits(self):
+    with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+      main(["convert", "-d", self.folder, "--checksum", f"other={'0' * 64}"])
+
+
+  def test_main__invalid_arguments__exits_before_reading_input(self):
+    for arguments in (["--chunk-size", "0"], ["--write-chunk-size", "-1"], ["--workers", "0"], ["--unknown", "ab"]):
+      stdin = io.StringIO("to no\n")
+      stderr = io.StringIO()
+      with patch("sys.stdin", stdin), redirect_stderr(stderr), self.assertRaises(SystemExit):
+        main(["convert", "-d", self.folder] + arguments)
+
+      self.assertIn(arguments[0], stderr.getvalue())
+      self.assertEqual(0, stdin.tell())
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,148 @@
+"""
+Binary snapshot of the parsed dictionary which is stored next to the downloaded files.
+The snapshot is keyed by the content hash of the dictionary and the symbols file, so it is invalidated automatically if one of them changes.
+It contains only the words, the symbols and the symbol IDs of the pronunciations, therefore loading it can not run code like unpickling could. Snapshots of other users are ignored, because the default folder /tmp is writable by everyone.
+
+Layout (all integers are unsigned and in native byte order):
+- header: magic, version, byteorder flag and the sizes of the sections
+- symbols: sorted ARPA symbols separated by newlines; the position of a symbol is its ID
+- words: the words separated by newlines in the order of the dictionary
+- variant counts (uint32, word count): number of pronunciations of each word
+- pronunciation data: one byte per symbol ID, every pronunciation is terminated by PRONUNCIATION_SEPARATOR
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import List, Optional, Set, Tuple
+
+from cmudict_parser.ARPAEncoding import (PRONUNCIATION_SEPARATOR,
+                                         encode_pronunciation, get_symbol_ids,
+                                         get_symbols_from_ids)
+from cmudict_parser.CMUDictParser import ARPADict, ARPASymbol
+
+CACHE_FORMAT_VERSION = 2
+CACHE_FILE_EXTENSION = ".cache"
+HASH_CHUNK_SIZE = 1024 * 1024
+MAGIC = b"CMUDSNAP"
+WORD_ENCODING = "latin-1"
+SEPARATOR = b"\n"
+BYTEORDER_FLAG = 1 if sys.byteorder == "little" else 2
+
+# magic, version, byteorder, sizes of the symbols, words, variant counts and pronunciation data sections
+_HEADER = struct.Struct("=8sII4Q")
+
+
+def get_files_hash(symbols_path: str, dict_path: str) -> str:
+  sha = hashlib.sha256()
+  sha.update(str(CACHE_FORMAT_VERSION).encode())
+  for path in (symbols_path, dict_path):
+    with open(path, mode="rb") as f:
+      for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+        sha.update(chunk)
+  return sha.hexdigest()
+
+
+def get_cache_path(dict_path: str, files_hash: str, extension: str = CACHE_FILE_EXTENSION) -> str:
+  return f"{dict_path}.{files_hash[:16]}{extension}"
+
+
+def is_own_file(fileno: int) -> bool:
+  ''' True if the open file belongs to the current user; always True on platforms without user IDs. '''
+  if not hasattr(os, "getuid"):
+    return True
+  return os.fstat(fileno).st_uid == os.getuid()
+
+
+def load_cache(cache_path: str) -> Optional[Tuple[ARPADict, Set[ARPASymbol]]]:
+  if not os.path.isfile(cache_path):
+    return None
+  try:
+    with open(cache_path, mode="rb") as f:
+      if not is_own_file(f.fileno()):
+        return None
+      data = f.read()
+    return _decode(data)
+  except Exception:
+    # corrupt or incompatible snapshot, it will be rebuilt
+    return None
+
+
+def _split(data: bytes) -> List[str]:
+  return data.decode(WORD_ENCODING).split("\n") if len(data) > 0 else []
+
+
+def _decode(data: bytes) -> Optional[Tuple[ARPADict, Set[ARPASymbol]]]:
+  magic, version, byteorder, *sizes = _HEADER.unpack_from(data)
+  if magic != MAGIC or version != CACHE_FORMAT_VERSION or byteorder != BYTEORDER_FLAG or _HEADER.size + sum(sizes) != len(data):
+    return None
+  sections = []
+  position = _HEADER.size
+  for size in sizes:
+    sections.append(data[position:position + size])
+    position += size
+  symbols_data, words_data, variant_counts_data, pron_data = sections
+
+  symbols = [sys.intern(symbol) for symbol in _split(symbols_data)]
+  words = _split(words_data)
+  variant_counts = array("I")
+  variant_counts.frombytes(variant_counts_data)
+  # the last pronunciation is terminated by the separator as well, therefore the last part is empty
+  pronunciations = [list(map(symbols.__getitem__, encoded)) for encoded in pron_data.split(bytes([PRONUNCIATION_SEPARATOR]))]
+  pronunciations.pop()
+  if len(words) != len(variant_counts) or len(pronunciations) != sum(variant_counts):
+    return None
+
+  entries: ARPADict = {}
+  position = 0
+  for word, count in zip(words, variant_counts):
+    entries[word] = pronunciations[position:position + count]
+    position += count
+  return entries, set(symbols)
+
+
+def _encode(entries: ARPADict, symbols: Set[ARPASymbol]) -> bytes:
+  symbol_ids = get_symbol_ids(symbols)
+  terminator = bytes([PRONUNCIATION_SEPARATOR])
+  variant_counts = array("I", [len(pronunciations) for pronunciations in entries.values()])
+  pron_data = b"".join(encode_pronunciation(pronunciation, symbol_ids) + terminator
+                       for pronunciations in entries.values() for pronunciation in pronunciations)
+  sections = [
+    SEPARATOR.join(symbol.encode(WORD_ENCODING) for symbol in get_symbols_from_ids(symbol_ids)),
+    SEPARATOR.join(word.encode(WORD_ENCODING) for word in entries.keys()),
+    variant_counts.tobytes(),
+    pron_data,
+  ]
+  header = _HEADER.pack(MAGIC, CACHE_FORMAT_VERSION, BYTEORDER_FLAG, *(len(section) for section in sections))
+  return header + b"".join(sections)
+
+
+def save_cache(cache_path: str, entries: ARPADict, symbols: Set[ARPASymbol]) -> None:
+  remove_outdated_caches(cache_path)
+  folder, cache_name = os.path.split(cache_path)
+  # a unique temporary file, so that no other thread or process writes to it
+  fd, tmp_path = tempfile.mkstemp(prefix=f"{cache_name}.", suffix=".tmp", dir=folder)
+  try:
+    with os.fdopen(fd, mode="wb") as f:
+      f.write(_encode(entries, symbols))
+    os.replace(tmp_path, cache_path)
+  except BaseException:
+    os.remove(tmp_path)
+    raise
+
+
+def remove_outdated_caches(cache_path: str) -> None:
+  folder, cache_name = os.path.split(cache_path)
+  # <dict_name>.<hash>.<extension>
+  dict_name, _, extension = cache_name.rsplit('.', 2)
+  prefix = f"{dict_name}."
+  suffix = f".{extension}"
+  for name in os.listdir(folder):
+    if name != cache_name and name.startswith(prefix) and name.endswith(suffix):
+      try:
+        os.remove(os.path.join(folder, name))
+      except OSError:
+        pass
@@ -0,0 +1,136 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictCache import (get_cache_path, get_files_hash,
+                                         load_cache, save_cache)
+from cmudict_parser.CMUDictDownloader import DICT_FILENAME, SYMBOLS_FILENAME
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH1\nEY1\nN\nOW1\nT\nUW1\n"
+DICTIONARY = ";;; test\nA  AH0\nA(1)  EY1\nNO  N OW1\nTO  T UW1\n"
+
+
+class _CreatesFileWhenUnpickled():
+  def __init__(self, path: str):
+    self.path = path
+
+  def __reduce__(self):
+    return (open, (self.path, "w"))
+
+
+class UnitTests(unittest.TestCase):
+  def setUp(self) -> None:
+    self.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+    self.symbols_path = os.path.join(self.folder, SYMBOLS_FILENAME)
+    self.dict_path = os.path.join(self.folder, DICT_FILENAME)
+
+  def tearDown(self) -> None:
+    shutil.rmtree(self.folder)
+
+  def _get_cache_files(self):
+    return [name for name in os.listdir(self.folder) if name.endswith(".cache")]
+
+  def test_get_files_hash__same_content__returns_same_hash(self):
+    res1 = get_files_hash(self.symbols_path, self.dict_path)
+    res2 = get_files_hash(self.symbols_path, self.dict_path)
+
+    self.assertEqual(res1, res2)
+
+  def test_get_files_hash__changed_dictionary__returns_other_hash(self):
+    res1 = get_files_hash(self.symbols_path, self.dict_path)
+    write_test_dictionary(self.folder, SYMBOLS, DICTIONARY + "NOT  N AH1 T\n")
+    res2 = get_files_hash(self.symbols_path, self.dict_path)
+
+    self.assertNotEqual(res1, res2)
+
+  def test_save_cache__load_cache__returns_saved_entries(self):
+    cache_path = get_cache_path(self.dict_path, "abc")
+    save_cache(cache_path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+    res = load_cache(cache_path)
+
+    self.assertEqual(({"TO": [["T", "UW1"]]}, {"T", "UW1"}), res)
+
+  def test_save_cache__load_cache__keeps_order_of_words_and_pronunciations(self):
+    entries = {"TO": [["T", "UW1"]], "A": [["AH0"], ["EY1"]], "NO": [["N", "OW1"]]}
+    cache_path = get_cache_path(self.dict_path, "abc")
+    save_cache(cache_path, entries, {"AH0", "EY1", "N", "OW1", "T", "UW1"})
+    res_entries, _ = load_cache(cache_path)
+
+    self.assertEqual(list(entries.items()), list(res_entries.items()))
+
+  def test_save_cache__load_cache__empty_entries(self):
+    cache_path = get_cache_path(self.dict_path, "abc")
+    save_cache(cache_path, {}, set())
+    res = load_cache(cache_path)
+
+    self.assertEqual(({}, set()), res)
+
+  def test_save_cache__leaves_no_temporary_files(self):
+    save_cache(get_cache_path(self.dict_path, "abc"), {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+
+    self.assertEqual([], [name for name in os.listdir(self.folder) if name.endswith(".tmp")])
+
+  def test_load_cache__pickle__is_not_unpickled(self):
+    marker_path = os.path.join(self.folder, "unpickled")
+    cache_path = get_cache_path(self.dict_path, "abc")
+    with open(cache_path, "wb") as f:
+      pickle.dump(_CreatesFileWhenUnpickled(marker_path), f)
+    res = load_cache(cache_path)
+
+    self.assertIsNone(res)
+    self.assertFalse(os.path.exists(marker_path))
+
+  @unittest.skipIf(not hasattr(os, "getuid"), "no user IDs on this platform")
+  def test_load_cache__file_of_other_user__returns_none(self):
+    cache_path = get_cache_path(self.dict_path, "abc")
+    save_cache(cache_path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+    with patch("os.getuid", return_value=os.getuid() + 1):
+      res = load_cache(cache_path)
+
+    self.assertIsNone(res)
+
+  def test_load_cache__not_existing__returns_none(self):
+    res = load_cache(get_cache_path(self.dict_path, "abc"))
+
+    self.assertIsNone(res)
+
+  def test_load_cache__corrupt_file__returns_none(self):
+    cache_path = get_cache_path(self.dict_path, "abc")
+    with open(cache_path, "wb") as f:
+      f.write(b"no snapshot")
+    res = load_cache(cache_path)
+
+    self.assertIsNone(res)
+
+  def test_get_dict__with_cache__writes_cache_and_returns_same_entries(self):
+    res_cold = get_dict(self.folder, silent=True)
+    cache_files = self._get_cache_files()
+    res_warm = get_dict(self.folder, silent=True)
+
+    self.assertEqual(1, len(cache_files))
+    self.assertEqual(res_cold._entries_arpa, res_warm._entries_arpa)
+    self.assertEqual(res_cold.all_phoneme_symbols, res_warm.all_phoneme_symbols)
+    self.assertEqual([["AH0"], ["EY1"]], res_warm.get_all_arpa("a"))
+
+  def test_get_dict__changed_dictionary__invalidates_cache(self):
+    get_dict(self.folder, silent=True)
+    write_test_dictionary(self.folder, SYMBOLS, DICTIONARY + "NOT  N AH1 T\n")
+    res = get_dict(self.folder, silent=True)
+
+    self.assertTrue(res.contains("not"))
+    self.assertEqual(1, len(self._get_cache_files()))
+
+  def test_get_dict__without_cache__writes_no_cache(self):
+    get_dict(self.folder, silent=True, use_cache=False)
+
+    self.assertEqual([], self._get_cache_files())
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,35 +1,160 @@
+"""
+Downloads the dictionary files if they are missing.
+The files are downloaded at once into temporary files which are renamed only after they are complete and their checksums are verified, therefore a killed download never leaves a truncated file.
+Processes which start at the same time on one host wait for the one which downloads the files (on platforms with fcntl).
+The files are downloaded from BASE_URL unless another base URL or a local mirror folder is given, e.g. with the environment variable CMUDICT_BASE_URL.
+"""
+
+import hashlib
 import os
-from typing import Tuple
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.error import HTTPError
 
 import wget
 
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
 BASE_NAME = "cmudict-0.7b"
 SYMBOLS_FILENAME = BASE_NAME + ".symbols"
 PHONES_FILENAME = BASE_NAME + ".phones"
 DICT_FILENAME = BASE_NAME
+FILENAMES = (SYMBOLS_FILENAME, PHONES_FILENAME, DICT_FILENAME)
+LOCK_FILENAME = BASE_NAME + ".lock"
 BASE_URL = "http://svn.code.sf.net/p/cmusphinx/code/trunk/cmudict/"
 URL_SYMBOLS = BASE_URL + SYMBOLS_FILENAME
 URL_PHONES = BASE_URL + PHONES_FILENAME
 URL_DICT = BASE_URL + DICT_FILENAME
+BASE_URL_ENVIRONMENT_VARIABLE = "CMUDICT_BASE_URL"
 
+DEFAULT_RETRIES = 3
+# seconds before the first retry, it is doubled for every further retry
+RETRY_DELAY = 1.0
 
-def ensure_files_are_downloaded(folder: str) -> Tuple[str, str, str]:
-  symbols_path = os.path.join(folder, SYMBOLS_FILENAME)
-  phones_path = os.path.join(folder, PHONES_FILENAME)
-  dict_path = os.path.join(folder, DICT_FILENAME)
+# filename -> SHA-256 of the file as hex
+Checksums = Dict[str, str]
 
-  os.makedirs(folder, exist_ok=True)
 
-  if not os.path.exists(symbols_path):
-    print("Downloading", URL_SYMBOLS)
-    wget.download(URL_SYMBOLS, folder)
+def get_base_url() -> str:
+  return os.environ.get(BASE_URL_ENVIRONMENT_VARIABLE, BASE_URL)
+
+
+def get_sha256(path: str) -> str:
+  result = hashlib.sha256()
+  with open(path, mode="rb") as f:
+    for block in iter(lambda: f.read(1 << 20), b""):
+      result.update(block)
+  return result.hexdigest()
+
+
+def _is_url(base_url: str) -> bool:
+  return "://" in base_url
+
+
+def _has_valid_checksum(path: str, filename: str, checksums: Optional[Checksums]) -> bool:
+  if checksums is None or filename not in checksums:
+    return True
+  return get_sha256(path) == checksums[filename].lower()
+
+
+def _is_missing(path: str, filename: str, checksums: Optional[Checksums]) -> bool:
+  # a file with a wrong checksum is downloaded again, e.g. a truncated file of an older version
+  return not os.path.isfile(path) or not _has_valid_checksum(path, filename, checksums)
+
 
-  if not os.path.exists(phones_path):
-    print("Downloading", URL_PHONES)
-    wget.download(URL_PHONES, folder)
+@contextmanager
+def _host_lock(folder: str) -> Iterator[None]:
+  if fcntl is None:
+    yield
+    return
+  lock_path = os.path.join(folder, LOCK_FILENAME)
+  try:
+    # read-only and readable for everyone, so that all users can lock the file which the first one created in a shared folder like /tmp
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDONLY, 0o666)
+  except OSError as error:
+    raise Exception(f"The lock file \"{lock_path}\" could not be opened, please check its permissions or remove it! {error}") from error
+  try:
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+      yield
+    finally:
+      fcntl.flock(fd, fcntl.LOCK_UN)
+  finally:
+    os.close(fd)
+
+
+def _fetch(base_url: str, filename: str, tmp_path: str) -> None:
+  if _is_url(base_url):
+    url = base_url.rstrip("/") + "/" + filename
+    print("Downloading", url)
+    wget.download(url, out=tmp_path, bar=None)
+  else:
+    shutil.copyfile(os.path.join(base_url, filename), tmp_path)
+
+
+class _ChecksumError(Exception):
+  # e.g. a download which was cut off, therefore it is retried like a network error
+  pass
+
+
+def _can_be_retried(base_url: str, error: Exception) -> bool:
+  # only a download over the network can fail temporarily; a file which is missing on the server or in a local mirror does not appear with retries
+  if not _is_url(base_url) or isinstance(error, FileNotFoundError):
+    return False
+  if isinstance(error, HTTPError):
+    return error.code >= 500
+  return isinstance(error, (OSError, _ChecksumError))
+
+
+def _download(base_url: str, filename: str, path: str, checksums: Optional[Checksums], retries: int) -> None:
+  # unique per process and thread, so that no one else writes the same temporary file
+  tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+  for attempt in range(retries + 1):
+    try:
+      _fetch(base_url, filename, tmp_path)
+      if not _has_valid_checksum(tmp_path, filename, checksums):
+        raise _ChecksumError(f"The checksum of \"{filename}\" from \"{base_url}\" is wrong!")
+      os.replace(tmp_path, path)
+      return
+    except Exception as error:
+      if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+      if attempt == retries or not _can_be_retried(base_url, error):
+        raise
+      time.sleep(RETRY_DELAY * 2**attempt)
+
+
+def ensure_files_are_downloaded(folder: str, base_url: Optional[str] = None, checksums: Optional[Checksums] = None, retries: int = DEFAULT_RETRIES) -> Tuple[str, str, str]:
+  '''
+  Returns the paths of the symbols, phones and dictionary files.
+  base_url: URL of the folder of the files or a local mirror folder they are copied from, get_base_url() if None
+  checksums: SHA-256 of the files which are verified, e.g. {DICT_FILENAME: "..."}; an existing file with a wrong checksum is downloaded again
+  retries: number of retries of a download which failed because of the network; copying from a local mirror is not retried
+  '''
+  if retries < 0:
+    raise ValueError("Parameter retries needs to be non-negative.")
+  if base_url is None:
+    base_url = get_base_url()
+  paths = tuple(os.path.join(folder, filename) for filename in FILENAMES)
+
+  os.makedirs(folder, exist_ok=True)
 
-  if not os.path.exists(dict_path):
-    print("Downloading", URL_DICT)
-    wget.download(URL_DICT, folder)
+  if any(_is_missing(path, filename, checksums) for filename, path in zip(FILENAMES, paths)):
+    with _host_lock(folder):
+      # another process could have downloaded the files while this one was waiting for the lock
+      missing = [(filename, path) for filename, path in zip(FILENAMES, paths) if _is_missing(path, filename, checksums)]
+      if len(missing) > 0:
+        with ThreadPoolExecutor(len(missing)) as executor:
+          futures = [executor.submit(_download, base_url, filename, path, checksums, retries) for filename, path in missing]
+          for future in futures:
+            future.result()
 
+  symbols_path, phones_path, dict_path = paths
   return (symbols_path, phones_path, dict_path)
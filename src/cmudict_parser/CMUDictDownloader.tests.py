@@ -0,0 +1,195 @@
+import functools
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from unittest.mock import patch
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictDownloader import (DICT_FILENAME, FILENAMES,
+                                              LOCK_FILENAME, PHONES_FILENAME,
+                                              SYMBOLS_FILENAME,
+                                              ensure_files_are_downloaded,
+                                              get_sha256)
+
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+CONTENTS = {
+  SYMBOLS_FILENAME: "N\nOW1\nT\nUW1\n",
+  PHONES_FILENAME: "N\tnasal\nT\tstop\n",
+  DICT_FILENAME: "NO  N OW1\nTO  T UW1\n",
+}
+
+
+class _RecordingHandler(SimpleHTTPRequestHandler):
+  requests: List[str] = []
+
+  def do_GET(self):
+    _RecordingHandler.requests.append(self.path)
+    super().do_GET()
+
+  def log_message(self, format, *args):
+    pass
+
+
+class UnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.mirror = tempfile.mkdtemp()
+    for filename, content in CONTENTS.items():
+      with open(os.path.join(cls.mirror, filename), "w", encoding="latin-1") as f:
+        f.write(content)
+    cls.checksums = {filename: get_sha256(os.path.join(cls.mirror, filename)) for filename in FILENAMES}
+    cls.server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_RecordingHandler, directory=cls.mirror))
+    cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+    cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+    cls.server_thread.start()
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    cls.server.shutdown()
+    cls.server.server_close()
+    shutil.rmtree(cls.mirror)
+
+  def setUp(self) -> None:
+    self.folder = tempfile.mkdtemp()
+    _RecordingHandler.requests.clear()
+
+  def tearDown(self) -> None:
+    shutil.rmtree(self.folder)
+
+  def _read(self, path: str) -> str:
+    with open(path, encoding="latin-1") as f:
+      return f.read()
+
+  def _assert_files_are_complete(self, paths) -> None:
+    self.assertEqual([os.path.join(self.folder, filename) for filename in FILENAMES], list(paths))
+    for filename, path in zip(FILENAMES, paths):
+      self.assertEqual(CONTENTS[filename], self._read(path))
+    self.assertEqual(set(FILENAMES) | {LOCK_FILENAME}, set(os.listdir(self.folder)))
+
+  def test_ensure_files_are_downloaded__url__downloads_files(self):
+    res = ensure_files_are_downloaded(self.folder, self.base_url, self.checksums)
+
+    self._assert_files_are_complete(res)
+    self.assertEqual(3, len(_RecordingHandler.requests))
+
+  def test_ensure_files_are_downloaded__existing_files__are_not_downloaded_again(self):
+    ensure_files_are_downloaded(self.folder, self.base_url)
+    ensure_files_are_downloaded(self.folder, self.base_url, self.checksums)
+
+    self.assertEqual(3, len(_RecordingHandler.requests))
+
+  def test_ensure_files_are_downloaded__mirror_folder__copies_files(self):
+    res = ensure_files_are_downloaded(self.folder, self.mirror, self.checksums)
+
+    self._assert_files_are_complete(res)
+    self.assertEqual([], _RecordingHandler.requests)
+
+  def test_ensure_files_are_downloaded__environment_variable__is_used_as_base_url(self):
+    os.environ["CMUDICT_BASE_URL"] = self.mirror
+    try:
+      res = ensure_files_are_downloaded(self.folder)
+    finally:
+      del os.environ["CMUDICT_BASE_URL"]
+
+    self._assert_files_are_complete(res)
+
+  def test_ensure_files_are_downloaded__truncated_file__is_downloaded_again(self):
+    with open(os.path.join(self.folder, DICT_FILENAME), "w", encoding="latin-1") as f:
+      f.write("NO  N")
+    res = ensure_files_are_downloaded(self.folder, self.base_url, self.checksums)
+
+    self._assert_files_are_complete(res)
+
+  def test_get_dict__checksums_and_corrupted_file__downloads_file_again(self):
+    ensure_files_are_downloaded(self.folder, self.mirror)
+    with open(os.path.join(self.folder, DICT_FILENAME), "w", encoding="latin-1") as f:
+      f.write("NO  N OW1\nTO  T")
+    res = get_dict(self.folder, silent=True, base_url=self.base_url, checksums=self.checksums)
+
+    self.assertEqual(CONTENTS[DICT_FILENAME], self._read(os.path.join(self.folder, DICT_FILENAME)))
+    self.assertEqual([f"/{DICT_FILENAME}"], _RecordingHandler.requests)
+    self.assertEqual(["T", "UW1"], res.get_first_arpa("to"))
+
+  def test_get_dict__lazy_with_checksums__downloads_file_again_on_first_use(self):
+    ensure_files_are_downloaded(self.folder, self.mirror)
+    with open(os.path.join(self.folder, DICT_FILENAME), "w", encoding="latin-1") as f:
+      f.write("NO  N OW1\n")
+    res = get_dict(self.folder, silent=True, lazy=True, base_url=self.mirror, checksums=self.checksums)
+
+    self.assertTrue(res.contains("to"))
+
+  def test_ensure_files_are_downloaded__wrong_checksum__throws_exception_and_keeps_no_file(self):
+    checksums = dict(self.checksums)
+    checksums[DICT_FILENAME] = "0" * 64
+
+    with self.assertRaises(Exception):
+      ensure_files_are_downloaded(self.folder, self.base_url, checksums, retries=1)
+
+    self.assertFalse(os.path.exists(os.path.join(self.folder, DICT_FILENAME)))
+    self.assertEqual(2, _RecordingHandler.requests.count(f"/{DICT_FILENAME}"))
+    self.assertFalse(any(filename.endswith(".tmp") for filename in os.listdir(self.folder)))
+
+  def test_ensure_files_are_downloaded__missing_file_on_server__throws_exception(self):
+    with self.assertRaises(Exception):
+      ensure_files_are_downloaded(self.folder, self.base_url + "missing/", retries=0)
+
+  def test_ensure_files_are_downloaded__read_only_lock_file__downloads_files(self):
+    lock_path = os.path.join(self.folder, LOCK_FILENAME)
+    with open(lock_path, "w"):
+      pass
+    os.chmod(lock_path, 0o444)
+    res = ensure_files_are_downloaded(self.folder, self.base_url)
+
+    self._assert_files_are_complete(res)
+
+  @unittest.skipIf(fcntl is None, "no file locks on this platform")
+  def test_ensure_files_are_downloaded__lock_file_not_openable__throws_exception_with_path(self):
+    with patch("os.open", side_effect=PermissionError("Permission denied")):
+      with self.assertRaises(Exception) as context:
+        ensure_files_are_downloaded(self.folder, self.base_url)
+
+    self.assertIn(os.path.join(self.folder, LOCK_FILENAME), str(context.exception))
+
+  def test_ensure_files_are_downloaded__missing_file_on_server__is_not_retried(self):
+    with patch("time.sleep") as sleep:
+      with self.assertRaises(Exception):
+        ensure_files_are_downloaded(self.folder, self.base_url + "missing/", retries=2)
+
+    sleep.assert_not_called()
+    self.assertEqual(1, _RecordingHandler.requests.count(f"/missing/{DICT_FILENAME}"))
+
+  def test_ensure_files_are_downloaded__missing_file_in_mirror_folder__is_not_retried(self):
+    mirror = tempfile.mkdtemp()
+    with patch("time.sleep") as sleep:
+      with self.assertRaises(FileNotFoundError):
+        ensure_files_are_downloaded(self.folder, mirror, retries=2)
+    shutil.rmtree(mirror)
+
+    sleep.assert_not_called()
+
+  def test_ensure_files_are_downloaded__negative_retries__throws_exception(self):
+    with self.assertRaises(ValueError):
+      ensure_files_are_downloaded(self.folder, self.base_url, retries=-1)
+
+  def test_ensure_files_are_downloaded__simultaneous_calls__download_files_once(self):
+    thread_count = 8
+    with ThreadPoolExecutor(thread_count) as executor:
+      res = list(executor.map(lambda _: ensure_files_are_downloaded(self.folder, self.base_url), range(thread_count)))
+
+    for paths in res:
+      self._assert_files_are_complete(paths)
+    self.assertEqual(3, len(_RecordingHandler.requests))
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,117 @@
+"""
+Fuzzy lookup of misspelled words, e.g. "RECIEVE" -> "RECEIVE", with the symmetric delete algorithm of SymSpell (Wolf Garbe).
+All strings which result from deleting up to max_distance letters of the first prefix_length letters of a word are indexed; a query generates the deletes of its prefix, looks up the words which share one of them and verifies their edit distance.
+The deletes are stored as sorted 64-bit numbers (CRC-32 of the delete, word id) instead of strings, which needs about a tenth of the memory; a hash collision only adds a candidate which is then rejected.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Set, Tuple
+from zlib import crc32
+
+from cmudict_parser.CMUDictParser import Word
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+
+# word, edit distance
+FuzzyMatch = Tuple[Word, int]
+
+
+def get_deletes(word: str, max_distance: int) -> Set[str]:
+  ''' The word and all strings which result from deleting up to max_distance of its letters. '''
+  result = {word}
+  deletes = {word}
+  for _ in range(max_distance):
+    deletes = {delete[:pos] + delete[pos + 1:] for delete in deletes for pos in range(len(delete))}
+    result.update(deletes)
+  return result
+
+
+def edit_distance(word1: str, word2: str, max_distance: int) -> int:
+  '''
+  Optimal string alignment distance: insertions, deletions, substitutions and transpositions of adjacent letters count as one edit each.
+  Returns max_distance + 1 if the distance is greater than max_distance.
+  '''
+  if abs(len(word1) - len(word2)) > max_distance:
+    return max_distance + 1
+  previous_previous: List[int] = []
+  previous = list(range(len(word2) + 1))
+  for pos1 in range(1, len(word1) + 1):
+    current = [pos1] + [0] * len(word2)
+    for pos2 in range(1, len(word2) + 1):
+      cost = 0 if word1[pos1 - 1] == word2[pos2 - 1] else 1
+      current[pos2] = min(previous[pos2] + 1, current[pos2 - 1] + 1, previous[pos2 - 1] + cost)
+      if pos1 > 1 and pos2 > 1 and word1[pos1 - 1] == word2[pos2 - 2] and word1[pos1 - 2] == word2[pos2 - 1]:
+        current[pos2] = min(current[pos2], previous_previous[pos2 - 2] + 1)
+    if min(current) > max_distance:
+      return max_distance + 1
+    previous_previous, previous = previous, current
+  return min(previous[-1], max_distance + 1)
+
+
+def _get_hash(delete: str) -> int:
+  # stable in every process, unlike hash(), therefore the index can be sent to other processes
+  return crc32(delete.encode("utf-8"))
+
+
+class FuzzyIndex():
+  '''
+  The words are expected in upper case like the keys of the dictionary, the queries are converted to upper case.
+  max_distance: maximum edit distance of the queries
+  prefix_length: number of letters of each word whose deletes are indexed, longer words are found by their prefix
+  '''
+
+  def __init__(self, words: Iterable[Word], max_distance: int = DEFAULT_MAX_DISTANCE, prefix_length: int = DEFAULT_PREFIX_LENGTH):
+    if max_distance < 0:
+      raise ValueError("Parameter max_distance needs to be non-negative.")
+    if prefix_length <= max_distance:
+      raise ValueError("Parameter prefix_length needs to be greater than max_distance.")
+    self._max_distance = max_distance
+    self._prefix_length = prefix_length
+    self._words: List[Word] = list(words)
+    entries: List[int] = []
+    for word_id, word in enumerate(self._words):
+      entries.extend([_get_hash(delete) << 32 | word_id for delete in get_deletes(word[:prefix_length], max_distance)])
+    entries.sort()
+    self._entries = array("Q", entries)
+
+  @property
+  def max_distance(self) -> int:
+    return self._max_distance
+
+  def get_closest_words(self, word: str, max_distance: Optional[int] = None, limit: Optional[int] = None) -> List[FuzzyMatch]:
+    '''
+    Returns the words within the edit distance, sorted by the distance and then by the word; the word itself has distance 0.
+    max_distance: at most the max_distance of the index, the one of the index if None
+    limit: maximum number of returned words
+    '''
+    if max_distance is None:
+      max_distance = self._max_distance
+    if max_distance < 0 or max_distance > self._max_distance:
+      raise ValueError(f"Parameter max_distance needs to be between 0 and {self._max_distance}.")
+    if limit is not None and limit < 0:
+      raise ValueError("Parameter limit needs to be non-negative.")
+    word = word.upper()
+    candidate_ids: Set[int] = set()
+    for delete in get_deletes(word[:self._prefix_length], max_distance):
+      delete_hash = _get_hash(delete)
+      start = bisect_left(self._entries, delete_hash << 32)
+      end = bisect_left(self._entries, (delete_hash + 1) << 32, start)
+      candidate_ids.update(entry & 0xFFFFFFFF for entry in self._entries[start:end])
+    result = []
+    for candidate_id in candidate_ids:
+      candidate = self._words[candidate_id]
+      distance = edit_distance(word, candidate, max_distance)
+      if distance <= max_distance:
+        result.append((candidate, distance))
+    result.sort(key=lambda match: (match[1], match[0]))
+    return result if limit is None else result[:limit]
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the deletes and the list of words without the words, which are shared with the dictionary. '''
+    return sys.getsizeof(self._entries) + sys.getsizeof(self._words)
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -0,0 +1,86 @@
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictFuzzyIndex import (FuzzyIndex, edit_distance,
+                                              get_deletes)
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AA1\nAH0\nEH1\nIY0\nIY1\nN\nOW1\nP\nR\nS\nT\nUW1\nV\n"
+DICTIONARY = "NO  N OW1\nNOT  N AA1 T\nRECEIVE  R IY0 S IY1 V\nRECIPE  R EH1 S AH0 P IY0\nTO  T UW1\n"
+
+WORDS = ["NO", "NOT", "NOTE", "RECEIVE", "RECIPE", "TO", "UNDERSTANDABLY"]
+
+
+class FuzzyIndexUnitTests(unittest.TestCase):
+  def test_get_deletes__returns_word_and_deletes(self):
+    res = get_deletes("ABC", 2)
+
+    self.assertEqual({"ABC", "BC", "AC", "AB", "A", "B", "C"}, res)
+
+  def test_edit_distance__counts_each_edit_once(self):
+    self.assertEqual(0, edit_distance("RECEIVE", "RECEIVE", 2))
+    self.assertEqual(1, edit_distance("RECIEVE", "RECEIVE", 2))
+    self.assertEqual(1, edit_distance("NOT", "NO", 2))
+    self.assertEqual(2, edit_distance("NOT", "TO", 2))
+    self.assertEqual(3, edit_distance("", "NOT", 3))
+
+  def test_edit_distance__greater_than_max_distance__returns_max_distance_plus_one(self):
+    self.assertEqual(2, edit_distance("RECEIVE", "RECIPE", 1))
+    self.assertEqual(3, edit_distance("TO", "NOTE", 2))
+
+  def test_get_closest_words__returns_words_sorted_by_distance(self):
+    index = FuzzyIndex(WORDS)
+
+    self.assertEqual([("RECEIVE", 1), ("RECIPE", 2)], index.get_closest_words("recieve"))
+    self.assertEqual([("NOT", 0), ("NO", 1), ("NOTE", 1), ("TO", 2)], index.get_closest_words("not"))
+    self.assertEqual([("NOT", 0), ("NO", 1), ("NOTE", 1)], index.get_closest_words("not", max_distance=1))
+    self.assertEqual([("NOT", 0)], index.get_closest_words("not", limit=1))
+    self.assertEqual([], index.get_closest_words("xyzxyz"))
+
+  def test_get_closest_words__word_longer_than_prefix__compares_whole_word(self):
+    index = FuzzyIndex(WORDS, prefix_length=5)
+
+    self.assertEqual([("UNDERSTANDABLY", 2)], index.get_closest_words("understandaby."))
+    self.assertEqual([], index.get_closest_words("understandxxxx"))
+
+  def test_get_closest_words__max_distance_greater_than_index__throws_exception(self):
+    with self.assertRaises(ValueError):
+      FuzzyIndex(WORDS, max_distance=1).get_closest_words("not", max_distance=2)
+
+  def test_init__prefix_length_not_greater_than_max_distance__throws_exception(self):
+    with self.assertRaises(ValueError):
+      FuzzyIndex(WORDS, max_distance=2, prefix_length=2)
+
+  def test_pickle__returns_same_words(self):
+    index = FuzzyIndex(WORDS)
+    res = pickle.loads(pickle.dumps(index))
+
+    self.assertEqual(index.get_closest_words("recieve"), res.get_closest_words("recieve"))
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_get_closest_words__returns_words_of_dictionary(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual([("RECEIVE", 1)], cmu_dict.get_closest_words("recieve", max_distance=1))
+    self.assertEqual([("NO", 1), ("NOT", 1)], cmu_dict.get_closest_words("nt", max_distance=1))
+    self.assertEqual(["build_fuzzy_index"], [stage.name for stage in cmu_dict.index_statistics])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(FuzzyIndexUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
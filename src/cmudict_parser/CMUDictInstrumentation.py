@@ -0,0 +1,63 @@
+"""
+Records the duration and the counts of each stage while a dictionary is loaded, e.g. download, parse_entries or load_snapshot.
+The stages of the last load are available with CMUDict.load_statistics; registered callbacks receive every stage when it is finished, e.g. to send it to a metrics system.
+"""
+
+import time
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+
+class LoadStage(NamedTuple):
+  name: str
+  seconds: float
+  # e.g. {"entries": 133854, "words": 125022}
+  counts: Dict[str, int]
+
+
+LoadCallback = Callable[[LoadStage], None]
+
+_callbacks: List[LoadCallback] = []
+
+
+def register_load_callback(callback: LoadCallback) -> None:
+  ''' The callback is called with every finished stage of every dictionary load. '''
+  global _callbacks
+  # the list is replaced instead of changed, so that a load in another thread can iterate it without a lock
+  _callbacks = _callbacks + [callback]
+
+
+def unregister_load_callback(callback: LoadCallback) -> None:
+  global _callbacks
+  _callbacks = [registered for registered in _callbacks if registered != callback]
+
+
+def _notify(stage: LoadStage) -> None:
+  for callback in _callbacks:
+    try:
+      callback(stage)
+    except Exception as error:
+      # a failing metrics callback should not prevent loading the dictionary
+      logger = getLogger(__name__)
+      logger.warning(f"Load callback failed for stage \"{stage.name}\": {error}")
+
+
+class LoadRecorder():
+  def __init__(self):
+    self.stages: List[LoadStage] = []
+
+  @contextmanager
+  def stage(self, name: str) -> Iterator[Dict[str, int]]:
+    ''' Measures the duration of the with-block, the block can add counts to the yielded dict. '''
+    counts: Dict[str, int] = {}
+    start = time.perf_counter()
+    yield counts
+    stage = LoadStage(name, time.perf_counter() - start, counts)
+    self.stages.append(stage)
+    _notify(stage)
+
+
+def get_recorder(recorder: Optional[LoadRecorder]) -> LoadRecorder:
+  ''' Returns a new recorder if none is given, its stages are reported to the callbacks only. '''
+  return LoadRecorder() if recorder is None else recorder
@@ -0,0 +1,84 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictInstrumentation import (LoadRecorder, LoadStage,
+                                                   register_load_callback,
+                                                   unregister_load_callback)
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nN\nOW1\nT\nUW1\n"
+DICTIONARY = ";;; comment\nNO  N OW1\nTO  T UW1\nTO(1)  T AH0\n"
+
+
+class UnitTests(unittest.TestCase):
+  def setUp(self) -> None:
+    self.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  def tearDown(self) -> None:
+    shutil.rmtree(self.folder)
+
+  def test_load_statistics__first_load__contains_all_stages_with_counts(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    res = {stage.name: stage.counts for stage in cmu_dict.load_statistics}
+
+    self.assertEqual(["download", "hash_files", "load_snapshot", "read_symbols", "parse_entries",
+                     "check_symbols", "save_snapshot", "extract_first_arpa", "total"], list(res))
+    self.assertEqual({"hit": 0}, res["load_snapshot"])
+    self.assertEqual({"lines": 5, "symbols": 5}, res["read_symbols"])
+    self.assertEqual({"entries": 3, "words": 2}, res["parse_entries"])
+    self.assertEqual({"words": 2}, res["total"])
+
+  def test_load_statistics__snapshot_exists__does_not_parse(self):
+    get_dict(self.folder, silent=True)
+    cmu_dict = get_dict(self.folder, silent=True)
+    res = [stage.name for stage in cmu_dict.load_statistics]
+
+    self.assertEqual(["download", "hash_files", "load_snapshot", "extract_first_arpa", "total"], res)
+    self.assertEqual({"hit": 1}, cmu_dict.load_statistics[2].counts)
+
+  def test_load_statistics__mmap__writes_and_opens_mapped_file(self):
+    cmu_dict = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+    res = [stage.name for stage in cmu_dict.load_statistics]
+
+    self.assertIn("write_mapped", res)
+    self.assertEqual(["open_mapped", "total"], res[-2:])
+
+  def test_register_load_callback__receives_every_stage(self):
+    received = []
+    register_load_callback(received.append)
+    try:
+      cmu_dict = get_dict(self.folder, silent=True)
+    finally:
+      unregister_load_callback(received.append)
+    get_dict(self.folder, silent=True)
+
+    self.assertEqual(cmu_dict.load_statistics, received)
+    self.assertTrue(all(stage.seconds >= 0 for stage in received))
+
+  def test_register_load_callback__failing_callback__does_not_prevent_loading(self):
+    def fail(stage: LoadStage) -> None:
+      raise ValueError(stage.name)
+
+    register_load_callback(fail)
+    try:
+      cmu_dict = get_dict(self.folder, silent=True)
+    finally:
+      unregister_load_callback(fail)
+
+    self.assertEqual(2, len(cmu_dict))
+
+  def test_load_recorder__stage__records_counts(self):
+    recorder = LoadRecorder()
+    with recorder.stage("test") as counts:
+      counts["lines"] = 3
+
+    self.assertEqual(1, len(recorder.stages))
+    self.assertEqual("test", recorder.stages[0].name)
+    self.assertEqual({"lines": 3}, recorder.stages[0].counts)
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
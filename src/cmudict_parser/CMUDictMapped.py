@@ -0,0 +1,246 @@
+"""
+Read-only on-disk format of the parsed dictionary which is opened via mmap.
+All processes which open the same file share its pages through the page cache, lookups decode only the requested entry.
+
+Layout (all integers are unsigned and in native byte order):
+- header: magic, version, byteorder flag, counts and the offsets of the sections
+- symbols: sorted ARPA symbols separated by newlines; the position of a symbol is its ID
+- word offsets (uint32, word count + 1) and word data: the words sorted by their latin-1 bytes
+- variant index (uint32, word count + 1): index of the first pronunciation of each word
+- pronunciation offsets (uint32, pronunciation count + 1) and pronunciation data: one byte per symbol ID
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, Set, Tuple, Union
+
+from cmudict_parser.ARPAEncoding import (decode_pronunciation,
+                                         encode_pronunciation, get_symbol_ids,
+                                         get_symbols_from_ids)
+from cmudict_parser.CMUDictCache import is_own_file
+from cmudict_parser.CMUDictParser import (ARPADict, ARPAPronunciation,
+                                          ARPAPronunciations, ARPASymbol, Word)
+
+MAPPED_FILE_EXTENSION = ".mmap"
+MAGIC = b"CMUDMAP\0"
+FORMAT_VERSION = 1
+BYTEORDER_FLAG = 1 if sys.byteorder == "little" else 2
+WORD_ENCODING = "latin-1"
+SYMBOL_SEPARATOR = b"\n"
+# every n-th word is kept in memory to narrow down the binary search on the mapped words
+SPARSE_INDEX_STEP = 64
+
+# magic, version, byteorder, word count, pronunciation count, symbol count, size of the symbols section, 6 section offsets
+_HEADER = struct.Struct("=8sIIIIII6Q")
+
+
+def write_mapped_dict(path: str, entries: ARPADict, symbols: Set[ARPASymbol]) -> None:
+  symbol_ids = get_symbol_ids(symbols)
+  sorted_symbols = get_symbols_from_ids(symbol_ids)
+
+  encoded_words = sorted((word.encode(WORD_ENCODING), word) for word in entries.keys())
+  word_offsets = array("I", [0])
+  variant_index = array("I", [0])
+  pron_offsets = array("I", [0])
+  word_data = bytearray()
+  pron_data = bytearray()
+  for encoded_word, word in encoded_words:
+    word_data += encoded_word
+    word_offsets.append(len(word_data))
+    for pronunciation in entries[word]:
+      pron_data += encode_pronunciation(pronunciation, symbol_ids)
+      pron_offsets.append(len(pron_data))
+    variant_index.append(len(pron_offsets) - 1)
+
+  sections = [
+    SYMBOL_SEPARATOR.join(symbol.encode(WORD_ENCODING) for symbol in sorted_symbols),
+    word_offsets.tobytes(),
+    bytes(word_data),
+    variant_index.tobytes(),
+    pron_offsets.tobytes(),
+    bytes(pron_data),
+  ]
+  offsets = []
+  position = _HEADER.size
+  for section in sections:
+    # uint32 arrays need to be aligned for memoryview.cast()
+    position += -position % 8
+    offsets.append(position)
+    position += len(section)
+
+  header = _HEADER.pack(MAGIC, FORMAT_VERSION, BYTEORDER_FLAG, len(encoded_words),
+                        len(pron_offsets) - 1, len(sorted_symbols), len(sections[0]), *offsets)
+  folder, filename = os.path.split(path)
+  # a unique temporary file, so that no other thread or process writes to it
+  fd, tmp_path = tempfile.mkstemp(prefix=f"{filename}.", suffix=".tmp", dir=folder)
+  try:
+    with os.fdopen(fd, mode="wb") as f:
+      f.write(header)
+      for offset, section in zip(offsets, sections):
+        f.write(b"\0" * (offset - f.tell()))
+        f.write(section)
+    # mkstemp creates the file readable only by its owner, but the mapped file is shared by all processes on the host
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+  except BaseException:
+    os.remove(tmp_path)
+    raise
+
+
+def _read_layout(data: Union[bytes, mmap.mmap], path: str) -> Tuple[int, ...]:
+  '''
+  Returns the counts and the section offsets of the header: word count, pronunciation count, symbol count, size of the symbols section and the 6 offsets.
+  Raises an exception if the file is incompatible or if its sections do not fit its length, e.g. because it is truncated.
+  '''
+  error = Exception(f"The file \"{path}\" is no compatible mapped dictionary!")
+  if len(data) < _HEADER.size:
+    raise error
+  magic, version, byteorder, word_count, pron_count, symbol_count, symbols_size, *offsets = _HEADER.unpack_from(data)
+  if magic != MAGIC or version != FORMAT_VERSION or byteorder != BYTEORDER_FLAG:
+    raise error
+  symbols_start, word_offsets_start, word_data_start, variant_index_start, pron_offsets_start, pron_data_start = offsets
+  if any(offset % 8 != 0 for offset in offsets) or symbols_start < _HEADER.size:
+    raise error
+  if symbols_start + symbols_size > word_offsets_start or word_offsets_start + 4 * (word_count + 1) > word_data_start \
+      or variant_index_start + 4 * (word_count + 1) > pron_offsets_start or pron_offsets_start + 4 * (pron_count + 1) > pron_data_start \
+      or pron_data_start > len(data):
+    raise error
+  # the last offset of each uint32 section is the size of the following data
+  word_data_size, = struct.unpack_from("=I", data, word_offsets_start + 4 * word_count)
+  last_variant, = struct.unpack_from("=I", data, variant_index_start + 4 * word_count)
+  pron_data_size, = struct.unpack_from("=I", data, pron_offsets_start + 4 * pron_count)
+  if word_data_start + word_data_size > variant_index_start or last_variant != pron_count or pron_data_start + pron_data_size != len(data):
+    raise error
+  return (word_count, pron_count, symbol_count, symbols_size, *offsets)
+
+
+def is_valid_mapped_dict(path: str) -> bool:
+  ''' True if the file is a complete mapped dictionary of this version which belongs to the current user. '''
+  if not os.path.isfile(path):
+    return False
+  with open(path, mode="rb") as f:
+    # the default folder /tmp is writable by everyone, a file of another user is not trusted
+    if not is_own_file(f.fileno()) or os.fstat(f.fileno()).st_size == 0:
+      return False
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+      try:
+        _read_layout(data, path)
+      except Exception:
+        return False
+  return True
+
+
+class _WordTable():
+  ''' Sequence view on the sorted words for bisect. '''
+
+  def __init__(self, data: mmap.mmap, word_offsets: memoryview, word_data_start: int, count: int):
+    self._data = data
+    self._word_offsets = word_offsets
+    self._word_data_start = word_data_start
+    self._count = count
+
+  def __len__(self) -> int:
+    return self._count
+
+  def __getitem__(self, index: int) -> bytes:
+    start = self._word_data_start
+    return self._data[start + self._word_offsets[index]:start + self._word_offsets[index + 1]]
+
+
+class MappedARPADict(Mapping):
+  ''' Read-only mapping from upper case words to their ARPA pronunciations backed by a memory-mapped file. '''
+
+  def __init__(self, path: str):
+    self._path = path
+    with open(path, mode="rb") as f:
+      self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+      word_count, pron_count, symbol_count, symbols_size, *offsets = _read_layout(self._mmap, path)
+    except Exception:
+      self._mmap.close()
+      raise
+    buffer = memoryview(self._mmap)
+    symbols_start, word_offsets_start, word_data_start, variant_index_start, pron_offsets_start, pron_data_start = offsets
+
+    symbols_data = buffer[symbols_start:symbols_start + symbols_size].tobytes()
+    self._symbols: List[ARPASymbol] = [symbol.decode(WORD_ENCODING)
+                                       for symbol in symbols_data.split(SYMBOL_SEPARATOR)] if symbol_count > 0 else []
+    assert len(self._symbols) == symbol_count
+    self._word_count = word_count
+    word_offsets = buffer[word_offsets_start:word_offsets_start + 4 * (word_count + 1)].cast("I")
+    self._words = _WordTable(self._mmap, word_offsets, word_data_start, word_count)
+    self._sparse_words = [self._words[i] for i in range(0, word_count, SPARSE_INDEX_STEP)]
+    self._variant_index = buffer[variant_index_start:variant_index_start +
+                                 4 * (word_count + 1)].cast("I")
+    self._pron_offsets = buffer[pron_offsets_start:pron_offsets_start + 4 * (pron_count + 1)].cast("I")
+    self._pron_data_start = pron_data_start
+    self._pron_data = buffer[pron_data_start:pron_data_start + self._pron_offsets[-1]]
+
+  @property
+  def path(self) -> str:
+    return self._path
+
+  @property
+  def symbols(self) -> Set[ARPASymbol]:
+    return set(self._symbols)
+
+  def _find(self, word: Word) -> Optional[int]:
+    if not isinstance(word, str):
+      return None
+    try:
+      key = word.encode(WORD_ENCODING)
+    except UnicodeEncodeError:
+      return None
+    block = bisect_left(self._sparse_words, key)
+    if block < len(self._sparse_words) and self._sparse_words[block] == key:
+      return block * SPARSE_INDEX_STEP
+    low = max(0, (block - 1) * SPARSE_INDEX_STEP)
+    high = min(self._word_count, block * SPARSE_INDEX_STEP)
+    index = bisect_left(self._words, key, low, high)
+    if index < self._word_count and self._words[index] == key:
+      return index
+    return None
+
+  def _decode_pronunciation(self, pron_index: int) -> ARPAPronunciation:
+    start = self._pron_data_start
+    encoded = self._mmap[start + self._pron_offsets[pron_index]:start + self._pron_offsets[pron_index + 1]]
+    return decode_pronunciation(encoded, self._symbols)
+
+  def get_encoded_sections(self) -> Tuple[memoryview, memoryview, memoryview]:
+    '''
+    The sections of the file without copying them: the symbol IDs of all pronunciations (bytes), the offsets of the pronunciations in them (uint32, pronunciation count + 1)
+    and the index of the first pronunciation of each word (uint32, word count + 1). The words are in the order of iteration.
+    '''
+    return self._pron_data, self._pron_offsets, self._variant_index
+
+  def get_first(self, word: Word) -> Optional[ARPAPronunciation]:
+    index = self._find(word)
+    if index is None:
+      return None
+    return self._decode_pronunciation(self._variant_index[index])
+
+  def __getitem__(self, word: Word) -> ARPAPronunciations:
+    index = self._find(word)
+    if index is None:
+      raise KeyError(word)
+    return [self._decode_pronunciation(i) for i in range(self._variant_index[index], self._variant_index[index + 1])]
+
+  def __contains__(self, word: object) -> bool:
+    return self._find(word) is not None
+
+  def __iter__(self) -> Iterator[Word]:
+    for i in range(self._word_count):
+      yield self._words[i].decode(WORD_ENCODING)
+
+  def __len__(self) -> int:
+    return self._word_count
+
+  def __reduce__(self) -> Tuple:
+    # other processes open the same file instead of receiving a copy of the entries
+    return (MappedARPADict, (self._path,))
@@ -0,0 +1,144 @@
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from cmudict_parser.CMUDict import STORAGE_LISTS, STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictDownloader import DICT_FILENAME
+from cmudict_parser.CMUDictMapped import (MappedARPADict, is_valid_mapped_dict,
+                                          write_mapped_dict)
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH1\nEY1\nN\nOW1\nT\nUW1\n"
+DICTIONARY = ";;; test\nA  AH0\nA(1)  EY1\nNO  N OW1\nNOT  N AH1 T\nTO  T UW1\n"
+
+
+class UnitTests(unittest.TestCase):
+  def setUp(self) -> None:
+    self.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+    self.path = os.path.join(self.folder, "test.mmap")
+
+  def tearDown(self) -> None:
+    shutil.rmtree(self.folder)
+
+  def test_write_mapped_dict__reopened__returns_same_entries(self):
+    entries = {"TO": [["T", "UW1"]], "A": [["AH0"], ["EY1"]], "'TIS": [["T", "AH1"]]}
+    write_mapped_dict(self.path, entries, {"AH0", "AH1", "EY1", "T", "UW1"})
+    res = MappedARPADict(self.path)
+
+    self.assertEqual(entries, dict(res))
+    self.assertEqual(["'TIS", "A", "TO"], list(res))
+    self.assertEqual({"AH0", "AH1", "EY1", "T", "UW1"}, res.symbols)
+
+  def test_write_mapped_dict__threads_write_same_file__file_is_valid(self):
+    entries = {"TO": [["T", "UW1"]], "A": [["AH0"], ["EY1"]]}
+    threads = [threading.Thread(target=write_mapped_dict, args=(self.path, entries, {"AH0", "EY1", "T", "UW1"})) for _ in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(entries, dict(MappedARPADict(self.path)))
+    self.assertEqual([], [name for name in os.listdir(self.folder) if name.endswith(".tmp")])
+
+  def test_mapped_arpa_dict__many_words__finds_all_words(self):
+    entries = {f"W{i:04d}": [["T"]] for i in range(0, 1000, 2)}
+    write_mapped_dict(self.path, entries, {"T"})
+    res = MappedARPADict(self.path)
+
+    self.assertTrue(all(f"W{i:04d}" in res for i in range(0, 1000, 2)))
+    self.assertFalse(any(f"W{i:04d}" in res for i in range(1, 1000, 2)))
+    self.assertNotIn("A", res)
+    self.assertNotIn("X", res)
+
+  def test_mapped_arpa_dict__unknown_word__is_not_contained(self):
+    write_mapped_dict(self.path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+    res = MappedARPADict(self.path)
+
+    self.assertNotIn("TOO", res)
+    self.assertNotIn("T", res)
+    self.assertNotIn("TΩ", res)
+    self.assertIsNone(res.get("TOO"))
+    self.assertIsNone(res.get_first("TOO"))
+
+  def test_mapped_arpa_dict__empty__has_no_entries(self):
+    write_mapped_dict(self.path, {}, set())
+    res = MappedARPADict(self.path)
+
+    self.assertEqual(0, len(res))
+    self.assertNotIn("TO", res)
+
+  def test_mapped_arpa_dict__pickle__reopens_file(self):
+    write_mapped_dict(self.path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+    res = pickle.loads(pickle.dumps(MappedARPADict(self.path)))
+
+    self.assertEqual([["T", "UW1"]], res["TO"])
+
+  def test_is_valid_mapped_dict__other_file__returns_false(self):
+    with open(self.path, "wb") as f:
+      f.write(b"abc")
+
+    self.assertFalse(is_valid_mapped_dict(self.path))
+    self.assertFalse(is_valid_mapped_dict(os.path.join(self.folder, "missing")))
+
+  def test_is_valid_mapped_dict__truncated_file__returns_false(self):
+    write_mapped_dict(self.path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+    os.truncate(self.path, os.path.getsize(self.path) - 1)
+
+    self.assertFalse(is_valid_mapped_dict(self.path))
+    with self.assertRaises(Exception):
+      MappedARPADict(self.path)
+
+  @unittest.skipIf(not hasattr(os, "getuid"), "no user IDs on this platform")
+  def test_is_valid_mapped_dict__file_of_other_user__returns_false(self):
+    write_mapped_dict(self.path, {"TO": [["T", "UW1"]]}, {"T", "UW1"})
+
+    with patch("os.getuid", return_value=os.getuid() + 1):
+      self.assertFalse(is_valid_mapped_dict(self.path))
+
+  def test_get_dict__mmap_truncated_file__rebuilds_file(self):
+    get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+    mapped_path, = [os.path.join(self.folder, name) for name in os.listdir(self.folder) if name.endswith(".mmap")]
+    os.truncate(mapped_path, os.path.getsize(mapped_path) // 2)
+    res = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+
+    self.assertTrue(is_valid_mapped_dict(mapped_path))
+    self.assertEqual([["N", "AH1", "T"]], res.get_all_arpa("not"))
+
+  def test_get_dict__mmap__returns_same_results_as_lists(self):
+    lists = get_dict(self.folder, silent=True, storage=STORAGE_LISTS)
+    mapped = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+
+    self.assertEqual(STORAGE_MMAP, mapped.storage)
+    self.assertEqual(len(lists), len(mapped))
+    self.assertEqual(lists.all_phoneme_symbols, mapped.all_phoneme_symbols)
+    for word in ["a", "no", "not", "to"]:
+      self.assertTrue(mapped.contains(word))
+      self.assertEqual(lists.get_first_arpa(word), mapped.get_first_arpa(word))
+      self.assertEqual(lists.get_all_arpa(word), mapped.get_all_arpa(word))
+    self.assertFalse(mapped.contains("xyz"))
+    self.assertEqual(lists.sentence_to_arpa("to a xyz"), mapped.sentence_to_arpa("to a xyz"))
+
+  def test_get_dict__mmap_changed_dictionary__rebuilds_file(self):
+    get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+    with open(os.path.join(self.folder, DICT_FILENAME), "a", encoding="latin-1") as f:
+      f.write("TOT  T AH1 T\n")
+    res = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+    mapped_files = [name for name in os.listdir(self.folder) if name.endswith(".mmap")]
+
+    self.assertTrue(res.contains("tot"))
+    self.assertEqual(1, len(mapped_files))
+
+  def test_sentence_to_arpa__lists__does_not_change_entries(self):
+    lists = get_dict(self.folder, silent=True, storage=STORAGE_LISTS)
+    lists.sentence_to_arpa("to no")
+
+    self.assertEqual(["T", "UW1"], lists.get_first_arpa("to"))
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,123 @@
+"""
+Inverted index from phoneme n-grams to the pronunciations which contain them, e.g. to find all words whose pronunciation contains "S T R".
+Every n-gram of length 1 to n is indexed without the stress markers. A longer sequence is looked up by intersecting the posting lists of its n-grams, starting with the shortest one, and the remaining candidates are verified.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Union
+
+from cmudict_parser.CMUDictParser import (ARPA_SYMBOL_SEPARATOR,
+                                          ARPAPronunciation, Word)
+from cmudict_parser.CMUDictReverseIndex import STRESS_MARKERS, remove_stress
+
+DEFAULT_N = 3
+
+
+def contains_sequence(pronunciation: ARPAPronunciation, sequence: ARPAPronunciation) -> bool:
+  ''' A vowel without stress marker in the sequence matches the vowel with every stress. '''
+  return any(all(_symbols_match(symbol, sequence_symbol) for symbol, sequence_symbol in zip(pronunciation[pos:], sequence))
+             for pos in range(len(pronunciation) - len(sequence) + 1))
+
+
+def _symbols_match(symbol: str, sequence_symbol: str) -> bool:
+  return symbol == sequence_symbol or (sequence_symbol[-1] not in STRESS_MARKERS and symbol.rstrip(STRESS_MARKERS) == sequence_symbol)
+
+
+def _contains_sorted(posting: array, entry_id: int) -> bool:
+  pos = bisect_left(posting, entry_id)
+  return pos < len(posting) and posting[pos] == entry_id
+
+
+class NGramIndex():
+  '''
+  The pronunciations are numbered in the order of the dictionary, therefore each posting list is sorted.
+  n: maximum length of the indexed n-grams, sequences up to this length are answered without verification unless their stress is compared
+  '''
+
+  def __init__(self, entries: Mapping, n: int = DEFAULT_N):
+    if n < 1:
+      raise ValueError("Parameter n needs to be at least 1.")
+    self._n = n
+    self._entries = entries
+    # entry id -> word and position of the pronunciation in the pronunciations of the word
+    self._words: List[Word] = []
+    self._pronunciation_positions = array("H")
+    self._postings: Dict[str, array] = {}
+    for word, pronunciations in entries.items():
+      for pronunciation_pos, pronunciation in enumerate(pronunciations):
+        entry_id = len(self._words)
+        self._words.append(word)
+        self._pronunciation_positions.append(pronunciation_pos)
+        symbols = remove_stress(pronunciation)
+        # an n-gram can occur several times in one pronunciation
+        keys = {ARPA_SYMBOL_SEPARATOR.join(symbols[pos:pos + length])
+                for length in range(1, n + 1) for pos in range(len(symbols) - length + 1)}
+        for key in keys:
+          posting = self._postings.get(key)
+          if posting is None:
+            posting = array("I")
+            self._postings[key] = posting
+          posting.append(entry_id)
+
+  def _get_candidates(self, symbols: ARPAPronunciation) -> Optional[List[int]]:
+    ''' Entry ids which contain all n-grams of the symbols, None if the symbols are an indexed n-gram and need no verification. '''
+    if len(symbols) <= self._n:
+      return None
+    postings = []
+    for pos in range(len(symbols) - self._n + 1):
+      posting = self._postings.get(ARPA_SYMBOL_SEPARATOR.join(symbols[pos:pos + self._n]))
+      if posting is None:
+        return []
+      postings.append(posting)
+    # the shortest posting list limits the candidates, the others are only searched for them
+    postings.sort(key=len)
+    candidates = list(postings[0])
+    for posting in postings[1:]:
+      if len(candidates) == 0:
+        break
+      candidates = [entry_id for entry_id in candidates if _contains_sorted(posting, entry_id)]
+    return candidates
+
+  def get_words(self, sequence: Union[str, ARPAPronunciation], stress: bool = True) -> List[Word]:
+    '''
+    Words with a pronunciation which contains the sequence, in the order of the dictionary.
+    sequence: list of symbols or a string like "S T R"
+    stress: False to ignore the stress markers of the sequence, a vowel without stress marker matches every stress anyway
+    '''
+    if isinstance(sequence, str):
+      sequence = sequence.upper().split()
+    if len(sequence) == 0:
+      raise ValueError("The sequence needs to contain at least one symbol.")
+    symbols = remove_stress(sequence)
+    compare_stress = stress and any(symbol[-1] in STRESS_MARKERS for symbol in sequence)
+    candidates = self._get_candidates(symbols)
+    if candidates is None:
+      candidates = self._postings.get(ARPA_SYMBOL_SEPARATOR.join(symbols), [])
+      if not compare_stress:
+        return self._get_unique_words(candidates)
+    result = []
+    for entry_id in candidates:
+      pronunciation = self._entries[self._words[entry_id]][self._pronunciation_positions[entry_id]]
+      if contains_sequence(pronunciation, sequence if compare_stress else symbols):
+        result.append(entry_id)
+    return self._get_unique_words(result)
+
+  def _get_unique_words(self, entry_ids: List[int]) -> List[Word]:
+    # the pronunciations of a word have consecutive ids
+    result: List[Word] = []
+    for entry_id in entry_ids:
+      word = self._words[entry_id]
+      if len(result) == 0 or result[-1] != word:
+        result.append(word)
+    return result
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the posting lists, their keys and the entry ids without the words, which are shared with the dictionary. '''
+    return (sys.getsizeof(self._postings) + sys.getsizeof(self._words) + sys.getsizeof(self._pronunciation_positions)
+            + sum(sys.getsizeof(key) + sys.getsizeof(posting) for key, posting in self._postings.items()))
+
+  def __len__(self) -> int:
+    return len(self._postings)
@@ -0,0 +1,83 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_ENCODED, get_dict
+from cmudict_parser.CMUDictNGramIndex import NGramIndex, contains_sequence
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "D\nEH1\nIH0\nIY1\nOY1\nR\nS\nT\n"
+DICTIONARY = "DESTROY  D IH0 S T R OY1\nSTREET  S T R IY1 T\nSTREETS  S T R IY1 T S\nTEST  T EH1 S T\nTESTS  T EH1 S T S\nTESTS(1)  T EH1 S\n"
+
+ENTRIES = {
+  "DESTROY": [["D", "IH0", "S", "T", "R", "OY1"]],
+  "STREET": [["S", "T", "R", "IY1", "T"]],
+  "STREETS": [["S", "T", "R", "IY1", "T", "S"]],
+  "TEST": [["T", "EH1", "S", "T"]],
+  "TESTS": [["T", "EH1", "S", "T", "S"], ["T", "EH1", "S"]],
+  "TEXTS": [["T", "EH2", "K", "S", "T", "S"]],
+}
+
+
+class NGramIndexUnitTests(unittest.TestCase):
+  def test_contains_sequence__vowel_without_stress__matches_every_stress(self):
+    self.assertTrue(contains_sequence(["T", "EH1", "S"], ["EH1", "S"]))
+    self.assertTrue(contains_sequence(["T", "EH1", "S"], ["T", "EH"]))
+    self.assertFalse(contains_sequence(["T", "EH1", "S"], ["T", "EH2"]))
+    self.assertFalse(contains_sequence(["T", "EH1"], ["EH1", "S"]))
+
+  def test_get_words__short_sequence__returns_words_of_posting_list(self):
+    index = NGramIndex(ENTRIES)
+
+    self.assertEqual(["DESTROY", "STREET", "STREETS"], index.get_words("S T R"))
+    self.assertEqual(["STREETS", "TESTS", "TEXTS"], index.get_words(["T", "S"]))
+    self.assertEqual([], index.get_words("S R"))
+
+  def test_get_words__long_sequence__returns_verified_words(self):
+    index = NGramIndex(ENTRIES, n=2)
+
+    self.assertEqual(["DESTROY", "STREET", "STREETS"], index.get_words("S T R"))
+    self.assertEqual(["STREET", "STREETS"], index.get_words("s t r iy1 t"))
+    self.assertEqual([], index.get_words("T S T R"))
+
+  def test_get_words__stress__compares_stress_of_vowels_with_marker(self):
+    index = NGramIndex(ENTRIES)
+
+    self.assertEqual(["TEST", "TESTS"], index.get_words("EH1 S T"))
+    self.assertEqual(["TEST", "TESTS"], index.get_words("T EH1"))
+    self.assertEqual(["TEST", "TESTS", "TEXTS"], index.get_words("T EH"))
+    self.assertEqual(["TEST", "TESTS", "TEXTS"], index.get_words("T EH1", stress=False))
+
+  def test_get_words__empty_sequence__throws_exception(self):
+    with self.assertRaises(ValueError):
+      NGramIndex(ENTRIES).get_words("")
+
+  def test_init__n_zero__throws_exception(self):
+    with self.assertRaises(ValueError):
+      NGramIndex(ENTRIES, n=0)
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_words_containing_arpa__returns_words(self):
+    cmu_dict = get_dict(self.folder, silent=True, storage=STORAGE_ENCODED)
+
+    self.assertEqual(["DESTROY", "STREET", "STREETS"], cmu_dict.words_containing_arpa("S T R"))
+    self.assertEqual(["STREETS", "TESTS"], cmu_dict.words_containing_arpa(["T", "S"]))
+    self.assertEqual(["STREET", "STREETS"], cmu_dict.words_containing_arpa("T R IY1 T"))
+    self.assertEqual(["build_ngram_index"], [stage.name for stage in cmu_dict.index_statistics])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(NGramIndexUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,117 @@
+"""
+Export of the dictionary as NumPy arrays of symbol IDs, e.g. for training models; NumPy is an optional dependency: pip install cmudict_parser[numpy]
+The symbol IDs are the positions in the sorted symbols, like in ARPAEncoding. The pronunciations are stored one after another (CSR layout):
+- symbol_ids (uint8): the symbol IDs of all pronunciations
+- offsets (int64, pronunciation count + 1): pronunciation i is symbol_ids[offsets[i]:offsets[i + 1]]
+- word_index (int32, pronunciation count): index of the word of each pronunciation in words
+- variant_counts (int32, word count): number of pronunciations of each word
+Saved arrays can be opened memory-mapped, then all training jobs on a host share one copy of them.
+"""
+
+import os
+from collections.abc import Mapping
+from itertools import chain
+from typing import List, NamedTuple, Set
+
+from cmudict_parser.ARPAEncoding import (PRONUNCIATION_SEPARATOR,
+                                         EncodedARPADict, get_symbol_ids,
+                                         get_symbols_from_ids)
+from cmudict_parser.CMUDictMapped import MappedARPADict
+from cmudict_parser.CMUDictParser import ARPASymbol, Word
+
+try:
+  import numpy as np
+except ImportError as error:
+  raise ImportError("The NumPy export needs NumPy: pip install cmudict_parser[numpy]") from error
+
+DEFAULT_PAD_ID = -1
+
+ARRAY_NAMES = ("symbol_ids", "offsets", "word_index", "variant_counts")
+WORDS_FILENAME = "words.txt"
+SYMBOLS_FILENAME = "symbols.txt"
+TEXT_ENCODING = "utf-8"
+
+
+class PhonemeArrays(NamedTuple):
+  words: List[Word]
+  symbols: List[ARPASymbol]
+  symbol_ids: np.ndarray
+  offsets: np.ndarray
+  word_index: np.ndarray
+  variant_counts: np.ndarray
+
+
+def get_phoneme_arrays(entries: Mapping, symbols: Set[ARPASymbol]) -> PhonemeArrays:
+  ''' The words are in the order of the entries; encoded and mapped dictionaries are converted from their symbol IDs without decoding them. '''
+  if isinstance(entries, MappedARPADict):
+    return _get_phoneme_arrays_of_mapped(entries)
+  if isinstance(entries, EncodedARPADict):
+    return _get_phoneme_arrays_of_encoded(entries)
+  symbol_ids = get_symbol_ids(symbols)
+  pronunciations = [pronunciation for word_pronunciations in entries.values() for pronunciation in word_pronunciations]
+  offsets = np.zeros(len(pronunciations) + 1, dtype=np.int64)
+  np.cumsum(np.fromiter(map(len, pronunciations), dtype=np.int64, count=len(pronunciations)), out=offsets[1:])
+  flat_symbol_ids = np.fromiter(map(symbol_ids.__getitem__, chain.from_iterable(pronunciations)), dtype=np.uint8, count=int(offsets[-1]))
+  variant_counts = np.fromiter(map(len, entries.values()), dtype=np.int32, count=len(entries))
+  return _get_phoneme_arrays(list(entries.keys()), get_symbols_from_ids(symbol_ids), flat_symbol_ids, offsets, variant_counts)
+
+
+def _get_phoneme_arrays_of_encoded(entries: EncodedARPADict) -> PhonemeArrays:
+  encoded_words = list(entries.encoded_entries.values())
+  # the pronunciations of a word are already separated by PRONUNCIATION_SEPARATOR, the words are joined with it as well
+  data = np.frombuffer(bytes([PRONUNCIATION_SEPARATOR]).join(encoded_words), dtype=np.uint8)
+  is_separator = data == PRONUNCIATION_SEPARATOR
+  separator_positions = np.flatnonzero(is_separator)
+  # every separator ends a pronunciation; its position in symbol_ids is reduced by the number of separators before it
+  offsets = np.empty(len(separator_positions) + 2, dtype=np.int64)
+  offsets[0] = 0
+  offsets[1:-1] = separator_positions - np.arange(len(separator_positions))
+  offsets[-1] = len(data) - len(separator_positions)
+  if len(encoded_words) == 0:
+    offsets = offsets[:1]
+  variant_counts = np.fromiter((encoded.count(PRONUNCIATION_SEPARATOR) + 1 for encoded in encoded_words),
+                               dtype=np.int32, count=len(encoded_words))
+  return _get_phoneme_arrays(list(entries.encoded_entries.keys()), sorted(entries.symbols), data[~is_separator], offsets, variant_counts)
+
+
+def _get_phoneme_arrays_of_mapped(entries: MappedARPADict) -> PhonemeArrays:
+  pron_data, pron_offsets, variant_index = entries.get_encoded_sections()
+  # the arrays are copied, so that they do not depend on the mapped file
+  flat_symbol_ids = np.frombuffer(pron_data, dtype=np.uint8).copy()
+  offsets = np.frombuffer(pron_offsets, dtype=np.uint32).astype(np.int64)
+  variant_counts = np.diff(np.frombuffer(variant_index, dtype=np.uint32)).astype(np.int32)
+  return _get_phoneme_arrays(list(entries), sorted(entries.symbols), flat_symbol_ids, offsets, variant_counts)
+
+
+def _get_phoneme_arrays(words: List[Word], symbols: List[ARPASymbol], flat_symbol_ids: np.ndarray, offsets: np.ndarray, variant_counts: np.ndarray) -> PhonemeArrays:
+  word_index = np.repeat(np.arange(len(words), dtype=np.int32), variant_counts)
+  return PhonemeArrays(words, symbols, flat_symbol_ids, offsets, word_index, variant_counts)
+
+
+def get_padded_matrix(arrays: PhonemeArrays, pad_id: int = DEFAULT_PAD_ID) -> np.ndarray:
+  ''' Matrix (int16) with one row per pronunciation; the rows are filled up to the longest pronunciation with pad_id. '''
+  lengths = np.diff(arrays.offsets)
+  max_length = int(lengths.max()) if len(lengths) > 0 else 0
+  result = np.full((len(lengths), max_length), pad_id, dtype=np.int16)
+  result[np.arange(max_length) < lengths[:, None]] = arrays.symbol_ids
+  return result
+
+
+def save_phoneme_arrays(arrays: PhonemeArrays, folder: str) -> None:
+  ''' Writes one .npy file per array and the words and symbols as text files, one per line. '''
+  os.makedirs(folder, exist_ok=True)
+  for name in ARRAY_NAMES:
+    np.save(os.path.join(folder, f"{name}.npy"), getattr(arrays, name))
+  for filename, lines in ((WORDS_FILENAME, arrays.words), (SYMBOLS_FILENAME, arrays.symbols)):
+    with open(os.path.join(folder, filename), "w", encoding=TEXT_ENCODING) as f:
+      f.write("".join(f"{line}\n" for line in lines))
+
+
+def load_phoneme_arrays(folder: str, mmap: bool = True) -> PhonemeArrays:
+  ''' mmap: True to open the arrays as read-only np.memmap instead of reading them into memory '''
+  arrays = {name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode="r" if mmap else None) for name in ARRAY_NAMES}
+  texts = {}
+  for filename in (WORDS_FILENAME, SYMBOLS_FILENAME):
+    with open(os.path.join(folder, filename), encoding=TEXT_ENCODING) as f:
+      texts[filename] = f.read().splitlines()
+  return PhonemeArrays(texts[WORDS_FILENAME], texts[SYMBOLS_FILENAME], **arrays)
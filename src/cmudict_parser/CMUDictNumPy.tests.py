@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGES, get_dict
+from CMUDictTesting import write_test_dictionary
+
+try:
+  import numpy as np
+
+  from cmudict_parser.CMUDictNumPy import (get_padded_matrix,
+                                           get_phoneme_arrays,
+                                           load_phoneme_arrays,
+                                           save_phoneme_arrays)
+except ImportError:
+  np = None
+
+SYMBOLS = "AH0\nN\nOW1\nT\nUW1\n"
+DICTIONARY = "A  AH0\nNO  N OW1\nTO  T UW1\nTO(1)  T AH0\n"
+
+ENTRIES = {
+  "TO": [["T", "UW1"], ["T", "AH0"]],
+  "A": [["AH0"]],
+  "NO": [["N", "OW1"]],
+}
+ENTRIES_SYMBOLS = {"AH0", "N", "OW1", "T", "UW1"}
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class NumPyUnitTests(unittest.TestCase):
+  def test_get_phoneme_arrays__returns_csr_layout(self):
+    res = get_phoneme_arrays(ENTRIES, ENTRIES_SYMBOLS)
+
+    self.assertEqual(["TO", "A", "NO"], res.words)
+    self.assertEqual(["AH0", "N", "OW1", "T", "UW1"], res.symbols)
+    self.assertEqual([3, 4, 3, 0, 0, 1, 2], res.symbol_ids.tolist())
+    self.assertEqual([0, 2, 4, 5, 7], res.offsets.tolist())
+    self.assertEqual([0, 0, 1, 2], res.word_index.tolist())
+    self.assertEqual([2, 1, 1], res.variant_counts.tolist())
+    self.assertEqual(np.uint8, res.symbol_ids.dtype)
+
+  def test_get_phoneme_arrays__empty_entries__returns_empty_arrays(self):
+    res = get_phoneme_arrays({}, ENTRIES_SYMBOLS)
+
+    self.assertEqual([0], res.offsets.tolist())
+    self.assertEqual(0, len(res.symbol_ids))
+    self.assertEqual((0, 0), get_padded_matrix(res).shape)
+
+  def test_get_padded_matrix__fills_rows_with_pad_id(self):
+    arrays = get_phoneme_arrays(ENTRIES, ENTRIES_SYMBOLS)
+
+    self.assertEqual([[3, 4], [3, 0], [0, -1], [1, 2]], get_padded_matrix(arrays).tolist())
+    self.assertEqual([[3, 4], [3, 0], [0, 5], [1, 2]], get_padded_matrix(arrays, pad_id=5).tolist())
+
+  def test_load_phoneme_arrays__returns_saved_arrays(self):
+    arrays = get_phoneme_arrays(ENTRIES, ENTRIES_SYMBOLS)
+    folder = tempfile.mkdtemp()
+    try:
+      save_phoneme_arrays(arrays, folder)
+      for mmap in (True, False):
+        res = load_phoneme_arrays(folder, mmap=mmap)
+
+        self.assertEqual(mmap, isinstance(res.symbol_ids, np.memmap))
+        self.assertEqual(arrays.words, res.words)
+        self.assertEqual(arrays.symbols, res.symbols)
+        self.assertEqual(arrays.offsets.tolist(), res.offsets.tolist())
+        self.assertEqual(get_padded_matrix(arrays).tolist(), get_padded_matrix(res).tolist())
+    finally:
+      shutil.rmtree(folder)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_to_numpy__storages__return_pronunciations_of_each_word(self):
+    for storage in STORAGES:
+      cmu_dict = get_dict(self.folder, silent=True, storage=storage)
+      res = cmu_dict.to_numpy()
+
+      pronunciations = {}
+      for pos, word_index in enumerate(res.word_index):
+        symbols = [res.symbols[symbol_id] for symbol_id in res.symbol_ids[res.offsets[pos]:res.offsets[pos + 1]]]
+        pronunciations.setdefault(res.words[word_index], []).append(symbols)
+      self.assertEqual({word: cmu_dict.get_all_arpa(word) for word in res.words}, pronunciations)
+      self.assertEqual([len(cmu_dict.get_all_arpa(word)) for word in res.words], res.variant_counts.tolist())
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(NumPyUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,101 @@
+"""
+Converts large corpora with a pool of processes.
+The dictionary is handed to every worker once when the worker starts: with the fork start method the workers inherit it without pickling, together with the lookup tables of the conversion which are built before, otherwise it is pickled once per worker (a memory-mapped dictionary pickles only its file path).
+The tasks contain only the sentences of one chunk and the results are returned in the order of the input.
+"""
+
+import multiprocessing
+import multiprocessing.pool
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Iterable, Iterator, List, Optional
+
+from cmudict_parser.CMUDict import CMUDict
+
+CONVERSION_ARPA = "sentences_to_arpa"
+CONVERSION_ARPA_OLD = "sentences_to_arpa_old"
+CONVERSION_IPA = "sentences_to_ipa"
+CONVERSIONS = {CONVERSION_ARPA, CONVERSION_ARPA_OLD, CONVERSION_IPA}
+
+DEFAULT_CHUNK_SIZE = 1000
+# chunks per worker which are submitted ahead, this bounds the memory for large inputs
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+_worker_dict: Optional[CMUDict] = None
+_worker_conversion: Optional[str] = None
+_worker_kwargs: dict = {}
+
+
+def _init_worker(cmudict: CMUDict, conversion: str, kwargs: dict) -> None:
+  global _worker_dict, _worker_conversion, _worker_kwargs
+  _worker_dict = cmudict
+  _worker_conversion = conversion
+  _worker_kwargs = kwargs
+
+
+def _convert_chunk(sentences: List[str]) -> List[Any]:
+  assert _worker_dict is not None
+  method = getattr(_worker_dict, _worker_conversion)
+  return method(sentences, **_worker_kwargs)
+
+
+def _get_context() -> multiprocessing.context.BaseContext:
+  if "fork" in multiprocessing.get_all_start_methods():
+    return multiprocessing.get_context("fork")
+  return multiprocessing.get_context()
+
+
+def _build_lookup_tables(cmudict: CMUDict, conversion: str, kwargs: dict) -> None:
+  # the conversions build their tables on the first call, built here they are inherited by all forked workers instead of built by each
+  cmudict._ensure_data_is_loaded()
+  if conversion == CONVERSION_ARPA:
+    cmudict._get_entries_first_arpa(kwargs.get("stress", True))
+  elif conversion == CONVERSION_ARPA_OLD:
+    cmudict._get_first_arpa_lookup()
+  else:
+    cmudict._get_first_ipa_lookup()
+
+
+def _iter_chunks(sentences: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+  iterator = iter(sentences)
+  while True:
+    chunk = list(islice(iterator, chunk_size))
+    if len(chunk) == 0:
+      return
+    yield chunk
+
+
+def convert_parallel(cmudict: CMUDict, sentences: Iterable[str], conversion: str = CONVERSION_ARPA, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> Iterator[Any]:
+  '''
+  Yields the conversion of each sentence in input order.
+  conversion: name of the batch method of CMUDict, e.g. CONVERSION_ARPA
+  workers: number of processes, defaults to the number of CPUs; with 1 worker the sentences are converted in this process
+  kwargs: passed to the batch method, e.g. replace_unknown_with for CONVERSION_ARPA_OLD and CONVERSION_IPA
+  '''
+  if conversion not in CONVERSIONS:
+    raise ValueError(f"Unknown conversion \"{conversion}\"!")
+  if chunk_size < 1:
+    raise ValueError("Parameter chunk_size needs to be at least 1.")
+  if workers is None:
+    workers = os.cpu_count() or 1
+  chunks = _iter_chunks(sentences, chunk_size)
+
+  if workers <= 1:
+    method = getattr(cmudict, conversion)
+    for chunk in chunks:
+      yield from method(chunk, **kwargs)
+    return
+
+  context = _get_context()
+  if context.get_start_method() == "fork":
+    # otherwise the tables would be pickled for every worker
+    _build_lookup_tables(cmudict, conversion, kwargs)
+  with context.Pool(workers, initializer=_init_worker, initargs=(cmudict, conversion, kwargs)) as pool:
+    pending: Deque[multiprocessing.pool.AsyncResult] = deque()
+    for chunk in chunks:
+      pending.append(pool.apply_async(_convert_chunk, (chunk,)))
+      if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+        yield from pending.popleft().get()
+    while len(pending) > 0:
+      yield from pending.popleft().get()
@@ -0,0 +1,72 @@
+import multiprocessing
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cmudict_parser.CMUDict import STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictParallel import (CONVERSION_ARPA,
+                                            CONVERSION_ARPA_OLD,
+                                            CONVERSION_IPA, convert_parallel)
+from CMUDictTesting import write_test_dictionary
+
+SENTENCES = [f"to {'no ' * (i % 3)}xxl a{'.' * (i % 2)}" for i in range(250)]
+
+
+class UnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp())
+    cls.cmu_dict = get_dict(cls.folder, silent=True)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_convert_parallel__arpa__returns_results_in_input_order(self):
+    res = list(convert_parallel(self.cmu_dict, iter(SENTENCES), workers=2, chunk_size=7))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa(SENTENCES), res)
+
+  def test_convert_parallel__arpa_old__passes_arguments(self):
+    res = list(convert_parallel(self.cmu_dict, SENTENCES, CONVERSION_ARPA_OLD,
+               workers=2, chunk_size=10, replace_unknown_with="_"))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa_old(SENTENCES, replace_unknown_with="_"), res)
+
+  def test_convert_parallel__one_worker__converts_in_process(self):
+    res = list(convert_parallel(self.cmu_dict, SENTENCES, CONVERSION_ARPA, workers=1, chunk_size=10))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa(SENTENCES), res)
+
+  def test_convert_parallel__mapped_dict__returns_same_results(self):
+    mapped = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+    res = list(convert_parallel(mapped, SENTENCES, workers=2, chunk_size=10))
+
+    self.assertEqual(self.cmu_dict.sentences_to_arpa(SENTENCES), res)
+
+  @unittest.skipIf("fork" not in multiprocessing.get_all_start_methods(), "no fork start method on this platform")
+  def test_convert_parallel__fork__builds_lookup_before_workers_start(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    with patch("multiprocessing.pool.Pool.apply_async", side_effect=RuntimeError):
+      with self.assertRaises(RuntimeError):
+        list(convert_parallel(cmu_dict, SENTENCES, CONVERSION_ARPA_OLD, workers=2, replace_unknown_with="_"))
+      with self.assertRaises(RuntimeError):
+        list(convert_parallel(cmu_dict, SENTENCES, CONVERSION_IPA, workers=2, replace_unknown_with="_"))
+
+    self.assertIsNotNone(cmu_dict._first_arpa_lookup)
+    self.assertIsNotNone(cmu_dict._first_ipa_lookup)
+
+  def test_convert_parallel__empty_input__returns_nothing(self):
+    res = list(convert_parallel(self.cmu_dict, [], workers=2))
+
+    self.assertEqual([], res)
+
+  def test_convert_parallel__unknown_conversion__throws_exception(self):
+    with self.assertRaises(ValueError):
+      list(convert_parallel(self.cmu_dict, SENTENCES, "sentence_to_xyz"))
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
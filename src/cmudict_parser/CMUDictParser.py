@@ -3,10 +3,12 @@ adapted from https://github.com/keithito/tacotron/blob/master/text/cmudict.py
 '''
 
 import re
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from tqdm import tqdm
 
+from cmudict_parser.CMUDictInstrumentation import LoadRecorder, get_recorder
+
 ''' Regex for alternative pronunciation '''
 _alt_re = re.compile(r'\([0-9]+\)')
 
@@ -18,6 +20,7 @@ ARPASymbol = str
 ARPAPronunciation = List[ARPASymbol]
 ARPAPronunciations = List[ARPAPronunciation]
 ARPADict = Dict[Word, ARPAPronunciations]
+Entry = Tuple[Word, int, ARPAPronunciation]
 
 
 def _read_lines(file: str) -> List[str]:
@@ -25,49 +28,77 @@ def _read_lines(file: str) -> List[str]:
     return f.readlines()
 
 
-def parse(paths: Tuple[str, str, str], silent: bool) -> Tuple[ARPADict, Set[ARPASymbol]]:
+def parse(paths: Tuple[str, str, str], silent: bool, recorder: Optional[LoadRecorder] = None) -> Tuple[ARPADict, Set[ARPASymbol]]:
+  ''' recorder: receives the stages read_symbols, parse_entries and check_symbols '''
   symbols_path, _, dict_path = paths
+  recorder = get_recorder(recorder)
 
-  symbols_content = _read_lines(symbols_path)
-  all_arpa_symbols = _parse_symbols(symbols_content)
+  with recorder.stage("read_symbols") as counts:
+    symbols_content = _read_lines(symbols_path)
+    all_arpa_symbols = _parse_symbols(symbols_content)
+    counts["lines"] = len(symbols_content)
+    counts["symbols"] = len(all_arpa_symbols)
 
-  dict_content = _read_lines(dict_path)
-  result = _parse_cmudict(dict_content, silent)
+  # the file is read while it is parsed, therefore both are one stage
+  with recorder.stage("parse_entries") as counts:
+    entries = iter_entries(dict_path)
+    result = _parse_cmudict(entries, silent)
+    counts["entries"] = sum(len(pronunciations) for pronunciations in result.values())
+    counts["words"] = len(result)
 
-  _check_have_unknown_symbols(result, all_arpa_symbols)
+  with recorder.stage("check_symbols") as counts:
+    _check_have_unknown_symbols(result, all_arpa_symbols)
+    counts["entries"] = sum(len(pronunciations) for pronunciations in result.values())
 
   return result, all_arpa_symbols
 
 
-def _parse_cmudict(lines: List[str], silent: bool) -> ARPADict:
-  result: ARPADict = dict()
-  data = lines if silent else tqdm(lines)
-  for line in data:
-    line_should_be_processed = _line_should_be_processed(line)
+def iter_entries(path: str) -> Iterator[Entry]:
+  '''
+  Yields (word, variant_index, pronunciation) for each entry of the dictionary file while reading it line by line.
+  example: ABBE(1)  AE1 B IY0 => ("ABBE", 1, ["AE1", "B", "IY0"])
+  '''
+  with open(path, encoding='latin-1') as f:
+    for line in f:
+      if _line_should_be_processed(line):
+        yield _get_entry(line)
 
-    if line_should_be_processed:
-      _process_line(line, result)
 
-  return result
+def _parse_cmudict(entries: Iterable[Entry], silent: bool) -> ARPADict:
+  result: ARPADict = dict()
+  data = entries if silent else tqdm(entries, unit=" entries")
+  for word, _, pronunciation_arpa in data:
+    _add_entry(word, pronunciation_arpa, result)
 
+  return result
 
-def _process_line(line: str, cmudict: ARPADict) -> None:
-  word, pronunciation_arpa = _get_word_and_pronunciation(line)
 
+def _add_entry(word: Word, pronunciation_arpa: ARPAPronunciation, cmudict: ARPADict) -> None:
   if word not in cmudict:
     cmudict[word] = list()
 
   cmudict[word].append(pronunciation_arpa)
 
 
-def _get_word_and_pronunciation(line: str) -> Tuple[Word, ARPAPronunciation]:
+def _get_entry(line: str) -> Entry:
   parts = line.split(WORD_AND_PRONUNCIATION_SEP)
   word = parts[0]
+  variant_index = _get_variant_index(word)
   word = _remove_double_indicators(word)
   pronunciation = parts[1].strip()
   pronunciation_arpa = pronunciation.split(ARPA_SYMBOL_SEPARATOR)
 
-  return word, pronunciation_arpa
+  return word, variant_index, pronunciation_arpa
+
+
+def _get_variant_index(word: Word) -> int:
+  ''' example: ABBE(1) => 1, ABBE => 0 '''
+  match = _alt_re.search(word)
+  if match is None:
+    return 0
+  result = int(match.group()[1:-1])
+
+  return result
 
 
 def _remove_double_indicators(word: Word) -> Word:
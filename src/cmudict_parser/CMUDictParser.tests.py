@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+from cmudict_parser.CMUDictParser import iter_entries, parse
+
+SYMBOLS = "AE1\nAH0\nB\nIY0\nT\nUW1\n"
+DICTIONARY = ";;; comment\n!EXCLAMATION-POINT  B\nABBE  AE1 B\nABBE(1)  AE1 B IY0\n'TIS  T AH0\nTO  T UW1\n"
+
+
+class UnitTests(unittest.TestCase):
+  def setUp(self) -> None:
+    self.folder = tempfile.mkdtemp()
+    self.symbols_path = os.path.join(self.folder, "symbols")
+    self.dict_path = os.path.join(self.folder, "dict")
+    self._write(self.symbols_path, SYMBOLS)
+    self._write(self.dict_path, DICTIONARY)
+
+  def tearDown(self) -> None:
+    shutil.rmtree(self.folder)
+
+  def _write(self, path: str, content: str) -> None:
+    with open(path, "w", encoding="latin-1") as f:
+      f.write(content)
+
+  def test_iter_entries__is_generator(self):
+    res = iter_entries(self.dict_path)
+
+    self.assertIsInstance(res, types.GeneratorType)
+
+  def test_iter_entries__returns_entries_with_variant_index(self):
+    res = list(iter_entries(self.dict_path))
+
+    self.assertEqual([
+      ("ABBE", 0, ["AE1", "B"]),
+      ("ABBE", 1, ["AE1", "B", "IY0"]),
+      ("'TIS", 0, ["T", "AH0"]),
+      ("TO", 0, ["T", "UW1"]),
+    ], res)
+
+  def test_parse__returns_entries_and_symbols(self):
+    entries, symbols = parse((self.symbols_path, "", self.dict_path), silent=True)
+
+    self.assertEqual({
+      "ABBE": [["AE1", "B"], ["AE1", "B", "IY0"]],
+      "'TIS": [["T", "AH0"]],
+      "TO": [["T", "UW1"]],
+    }, entries)
+    self.assertEqual({"AE1", "AH0", "B", "IY0", "T", "UW1"}, symbols)
+
+  def test_parse__unknown_symbol__throws_exception(self):
+    self._write(self.dict_path, DICTIONARY + "TOO  T UW2\n")
+
+    with self.assertRaises(Exception):
+      parse((self.symbols_path, "", self.dict_path), silent=True)
+
+
+if __name__ == '__main__':
+  suite = unittest.TestLoader().loadTestsFromTestCase(UnitTests)
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,60 @@
+"""
+Prefix queries on the words of a dictionary, e.g. for autocompletion: all words with a prefix, their count and the longest word which is a prefix of a token.
+The words are kept in a sorted list, a query needs O(log n) comparisons with binary search plus the size of the result, it does not scan the dictionary.
+"""
+
+import sys
+from bisect import bisect_left
+from typing import Iterable, List, Optional
+
+from cmudict_parser.CMUDictParser import Word
+
+
+class PrefixIndex():
+  ''' The words are expected in upper case like the keys of the dictionary, the queries are converted to upper case. '''
+
+  def __init__(self, words: Iterable[Word]):
+    self._words: List[Word] = sorted(words)
+
+  def _get_range(self, prefix: str) -> range:
+    start = bisect_left(self._words, prefix)
+    if prefix == "":
+      return range(start, len(self._words))
+    # the first string after all strings which start with the prefix
+    end_of_prefix = f"{prefix[:-1]}{chr(ord(prefix[-1]) + 1)}" if ord(prefix[-1]) < sys.maxunicode else None
+    end = len(self._words) if end_of_prefix is None else bisect_left(self._words, end_of_prefix, start)
+    return range(start, end)
+
+  def words_with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Word]:
+    ''' Sorted words which start with the prefix, only the first limit words if a limit is given. '''
+    if limit is not None and limit < 0:
+      raise ValueError("Parameter limit needs to be non-negative.")
+    positions = self._get_range(prefix.upper())
+    if limit is not None:
+      positions = positions[:limit]
+    return self._words[positions.start:positions.stop]
+
+  def count_words_with_prefix(self, prefix: str) -> int:
+    return len(self._get_range(prefix.upper()))
+
+  def longest_prefix_match(self, token: str) -> Optional[Word]:
+    ''' The longest word which is a prefix of the token, None if no word is a prefix of it. '''
+    token = token.upper()
+    result = None
+    start = 0
+    for length in range(1, len(token) + 1):
+      prefix = token[:length]
+      # a longer prefix is sorted after a shorter one, therefore the search continues from the last position
+      start = bisect_left(self._words, prefix, start)
+      if start == len(self._words) or not self._words[start].startswith(prefix):
+        break
+      if self._words[start] == prefix:
+        result = prefix
+    return result
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the sorted list and the words, the words can be shared with the keys of the dictionary. '''
+    return sys.getsizeof(self._words) + sum(sys.getsizeof(word) for word in self._words)
+
+  def __len__(self) -> int:
+    return len(self._words)
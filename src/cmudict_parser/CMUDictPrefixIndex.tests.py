@@ -0,0 +1,99 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictPrefixIndex import PrefixIndex
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH1\nEY1\nN\nOW1\nT\nUW1\nD\n"
+DICTIONARY = "A  AH0\nNO  N OW1\nNOT  N AH1 T\nTO  T UW1\nTODAY  T AH0 D EY1\n"
+
+
+class PrefixIndexUnitTests(unittest.TestCase):
+  def test_words_with_prefix__returns_sorted_words(self):
+    index = PrefixIndex(["TOO", "NO", "TO", "TODAY", "T"])
+
+    self.assertEqual(["TO", "TODAY", "TOO"], index.words_with_prefix("to"))
+    self.assertEqual(["TODAY"], index.words_with_prefix("TOD"))
+    self.assertEqual([], index.words_with_prefix("x"))
+
+  def test_words_with_prefix__empty_prefix__returns_all_words(self):
+    index = PrefixIndex(["TO", "NO"])
+
+    self.assertEqual(["NO", "TO"], index.words_with_prefix(""))
+
+  def test_words_with_prefix__limit__returns_first_words(self):
+    index = PrefixIndex(["TOO", "TO", "TODAY"])
+
+    self.assertEqual(["TO", "TODAY"], index.words_with_prefix("to", limit=2))
+    self.assertEqual([], index.words_with_prefix("to", limit=0))
+
+  def test_words_with_prefix__negative_limit__throws_exception(self):
+    with self.assertRaises(ValueError):
+      PrefixIndex(["TO"]).words_with_prefix("to", limit=-1)
+
+  def test_words_with_prefix__apostrophe_and_last_letter__returns_only_words_with_prefix(self):
+    index = PrefixIndex(["'TIS", "TIS", "Z", "ZZ", "ZZZ"])
+
+    self.assertEqual(["'TIS"], index.words_with_prefix("'"))
+    self.assertEqual(["ZZ", "ZZZ"], index.words_with_prefix("zz"))
+
+  def test_count_words_with_prefix__returns_number_of_words(self):
+    index = PrefixIndex(["TOO", "NO", "TO", "TODAY"])
+
+    self.assertEqual(3, index.count_words_with_prefix("to"))
+    self.assertEqual(4, index.count_words_with_prefix(""))
+    self.assertEqual(0, index.count_words_with_prefix("toz"))
+
+  def test_longest_prefix_match__returns_longest_word(self):
+    index = PrefixIndex(["T", "TO", "TODAY", "TOO"])
+
+    self.assertEqual("TODAY", index.longest_prefix_match("todays"))
+    self.assertEqual("TO", index.longest_prefix_match("Tod"))
+    self.assertEqual("T", index.longest_prefix_match("tx"))
+    self.assertIsNone(index.longest_prefix_match("xto"))
+    self.assertIsNone(index.longest_prefix_match(""))
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_prefix_queries__return_words_of_dictionary(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual(["TO", "TODAY"], cmu_dict.words_with_prefix("to"))
+    self.assertEqual(2, cmu_dict.count_words_with_prefix("no"))
+    self.assertEqual("TODAY", cmu_dict.longest_prefix_match("todays"))
+
+  def test_prefix_queries__mmap__return_words_of_dictionary(self):
+    cmu_dict = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+
+    self.assertEqual(["NO", "NOT"], cmu_dict.words_with_prefix("no"))
+    self.assertEqual("A", cmu_dict.longest_prefix_match("ab"))
+
+  def test_index_statistics__index_is_built_once_on_first_query(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual([], cmu_dict.index_statistics)
+    cmu_dict.words_with_prefix("to")
+    cmu_dict.longest_prefix_match("today")
+    res = cmu_dict.index_statistics
+
+    self.assertEqual(["build_prefix_index"], [stage.name for stage in res])
+    self.assertEqual(5, res[0].counts["entries"])
+    self.assertGreater(res[0].counts["memory_bytes"], 0)
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(PrefixIndexUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,50 @@
+"""
+Reverse index from a pronunciation to the words which have it, e.g. for homophones: "N OW1" -> ["KNOW", "NO", "NOH"].
+Optionally the stress markers are ignored, then "T AH0" and "T AH1" are the same pronunciation.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, List, Union
+
+from cmudict_parser.CMUDictParser import (ARPA_SYMBOL_SEPARATOR,
+                                          ARPAPronunciation, Word)
+
+STRESS_MARKERS = "012"
+
+
+def remove_stress(pronunciation: ARPAPronunciation) -> ARPAPronunciation:
+  return [symbol.rstrip(STRESS_MARKERS) for symbol in pronunciation]
+
+
+class ReverseIndex():
+  ''' The words of each pronunciation are in the order of the dictionary; a word with several pronunciations is listed under each of them. '''
+
+  def __init__(self, entries: Mapping, stress: bool = True):
+    self._stress = stress
+    self._words: Dict[str, List[Word]] = {}
+    for word, pronunciations in entries.items():
+      for pronunciation in pronunciations:
+        words = self._words.setdefault(self._get_key(pronunciation), [])
+        # pronunciations which differ only in the stress have the same key
+        if len(words) == 0 or words[-1] != word:
+          words.append(word)
+
+  def _get_key(self, pronunciation: Union[str, ARPAPronunciation]) -> str:
+    # a string needs less memory than a tuple of symbols
+    if isinstance(pronunciation, str):
+      pronunciation = pronunciation.split()
+    if not self._stress:
+      pronunciation = remove_stress(pronunciation)
+    return ARPA_SYMBOL_SEPARATOR.join(pronunciation)
+
+  def get_words(self, pronunciation: Union[str, ARPAPronunciation]) -> List[Word]:
+    ''' pronunciation: list of symbols or a string like "T UW1" '''
+    return list(self._words.get(self._get_key(pronunciation), []))
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the dict, the keys and the lists of words without the words, which are shared with the dictionary. '''
+    return sys.getsizeof(self._words) + sum(sys.getsizeof(key) + sys.getsizeof(words) for key, words in self._words.items())
+
+  def __len__(self) -> int:
+    return len(self._words)
@@ -0,0 +1,94 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_ENCODED, get_dict
+from cmudict_parser.CMUDictReverseIndex import ReverseIndex, remove_stress
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH1\nN\nOW0\nOW1\nT\nUW1\n"
+DICTIONARY = "KNOW  N OW1\nNO  N OW1\nNOH  N OW1\nNOT  N AH1 T\nNOW  N OW0\nTO  T UW1\nTO(1)  T AH0\nTOO  T UW1\n"
+
+ENTRIES = {
+  "KNOW": [["N", "OW1"]],
+  "NO": [["N", "OW1"], ["N", "OW0"]],
+  "NOW": [["N", "OW0"]],
+  "TO": [["T", "UW1"], ["T", "AH0"]],
+  "TOO": [["T", "UW1"]],
+}
+
+
+class ReverseIndexUnitTests(unittest.TestCase):
+  def test_remove_stress__removes_digits(self):
+    res = remove_stress(["N", "OW1", "AH0", "ER2"])
+
+    self.assertEqual(["N", "OW", "AH", "ER"], res)
+
+  def test_get_words__returns_words_in_order_of_dictionary(self):
+    index = ReverseIndex(ENTRIES)
+
+    self.assertEqual(["KNOW", "NO"], index.get_words(["N", "OW1"]))
+    self.assertEqual(["NO", "NOW"], index.get_words("N OW0"))
+    self.assertEqual(["TO", "TOO"], index.get_words("T UW1"))
+    self.assertEqual([], index.get_words("T OW1"))
+
+  def test_get_words__without_stress__lists_each_word_once(self):
+    index = ReverseIndex(ENTRIES, stress=False)
+
+    self.assertEqual(["KNOW", "NO", "NOW"], index.get_words("N OW1"))
+    self.assertEqual(["KNOW", "NO", "NOW"], index.get_words(["N", "OW"]))
+    self.assertEqual(3, len(index))
+
+  def test_get_words__result_is_changed__index_is_not_changed(self):
+    index = ReverseIndex(ENTRIES)
+    index.get_words("T UW1").append("XXL")
+
+    self.assertEqual(["TO", "TOO"], index.get_words("T UW1"))
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_get_words_for_arpa__returns_words(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual(["KNOW", "NO", "NOH"], cmu_dict.get_words_for_arpa("N OW1"))
+    self.assertEqual(["KNOW", "NO", "NOH", "NOW"], cmu_dict.get_words_for_arpa(["N", "OW1"], stress=False))
+
+  def test_homophones__returns_other_words_of_all_pronunciations(self):
+    cmu_dict = get_dict(self.folder, silent=True, storage=STORAGE_ENCODED)
+
+    self.assertEqual(["KNOW", "NOH"], cmu_dict.homophones("no"))
+    self.assertEqual(["TOO"], cmu_dict.homophones("to"))
+    self.assertEqual([], cmu_dict.homophones("not"))
+    self.assertEqual(["KNOW", "NOH", "NOW"], cmu_dict.homophones("no", stress=False))
+
+  def test_homophones__unknown_word__throws_exception(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    with self.assertRaises(Exception):
+      cmu_dict.homophones("xxl")
+
+  def test_index_statistics__records_build_of_each_reverse_index(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    cmu_dict.homophones("no")
+    cmu_dict.homophones("to")
+    cmu_dict.homophones("no", stress=False)
+    res = cmu_dict.index_statistics
+
+    self.assertEqual(["build_reverse_index", "build_reverse_index_without_stress"], [stage.name for stage in res])
+    self.assertEqual(5, res[0].counts["entries"])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(ReverseIndexUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,44 @@
+"""
+Rhyme index: words rhyme if their pronunciations are equal from the last vowel with primary stress to the end, e.g. "T UW1" and "B L UW1" or "D EY1 T AH0" and "S T EY1 T AH0".
+A pronunciation without primary stress rhymes from its last vowel with secondary stress, without any stress from its last vowel.
+"""
+
+from collections.abc import Mapping
+from typing import Union
+
+from cmudict_parser.CMUDictParser import (ARPA_SYMBOL_SEPARATOR,
+                                          ARPAPronunciation)
+from cmudict_parser.CMUDictReverseIndex import ReverseIndex
+
+PRIMARY_STRESS = "1"
+SECONDARY_STRESS = "2"
+NO_STRESS = "0"
+
+
+def get_rhyme_part(pronunciation: ARPAPronunciation) -> ARPAPronunciation:
+  ''' The symbols from the last vowel with the strongest stress to the end, the whole pronunciation if it has no vowel. '''
+  # only the vowels have a stress marker
+  for stress in (PRIMARY_STRESS, SECONDARY_STRESS, NO_STRESS):
+    for pos in range(len(pronunciation) - 1, -1, -1):
+      if pronunciation[pos][-1] == stress:
+        return pronunciation[pos:]
+  return pronunciation
+
+
+class RhymeIndex(ReverseIndex):
+  '''
+  Index from the rhyme part of a pronunciation to the words.
+  secondary_stress: False to ignore the secondary stress in the rhyme part, e.g. "AH2" rhymes with "AH0"
+  '''
+
+  def __init__(self, entries: Mapping, secondary_stress: bool = True):
+    self._secondary_stress = secondary_stress
+    super().__init__(entries)
+
+  def _get_key(self, pronunciation: Union[str, ARPAPronunciation]) -> str:
+    if isinstance(pronunciation, str):
+      pronunciation = pronunciation.split()
+    rhyme_part = get_rhyme_part(pronunciation)
+    if not self._secondary_stress:
+      rhyme_part = [f"{symbol[:-1]}{NO_STRESS}" if symbol[-1] == SECONDARY_STRESS else symbol for symbol in rhyme_part]
+    return ARPA_SYMBOL_SEPARATOR.join(rhyme_part)
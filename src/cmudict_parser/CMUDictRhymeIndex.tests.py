@@ -0,0 +1,89 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictRhymeIndex import RhymeIndex, get_rhyme_part
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH2\nB\nD\nEY1\nL\nS\nT\nUW1\n"
+DICTIONARY = "BLUE  B L UW1\nDATA  D EY1 T AH0\nSTATA  S T EY1 T AH2\nSTATE  S T EY1 T\nTO  T UW1\nTO(1)  T AH0\nTOO  T UW1\n"
+
+ENTRIES = {
+  "BLUE": [["B", "L", "UW1"]],
+  "DATA": [["D", "EY1", "T", "AH0"]],
+  "STATA": [["S", "T", "EY1", "T", "AH2"]],
+  "TO": [["T", "UW1"], ["T", "AH0"]],
+  "TOO": [["T", "UW1"]],
+}
+
+
+class RhymeIndexUnitTests(unittest.TestCase):
+  def test_get_rhyme_part__primary_stress__returns_symbols_from_last_stressed_vowel(self):
+    self.assertEqual(["EY1", "T", "AH0"], get_rhyme_part(["D", "EY1", "T", "AH0"]))
+    self.assertEqual(["UW1", "Z"], get_rhyme_part(["T", "UW1", "Z"]))
+    self.assertEqual(["EH1", "K", "S", "AH0"], get_rhyme_part(["AH1", "N", "EH1", "K", "S", "AH0"]))
+
+  def test_get_rhyme_part__without_primary_stress__returns_symbols_from_last_vowel_with_strongest_stress(self):
+    self.assertEqual(["AO2", "L", "AH0"], get_rhyme_part(["AO2", "L", "AH0"]))
+    self.assertEqual(["AH0"], get_rhyme_part(["DH", "AH0"]))
+    self.assertEqual(["HH", "M"], get_rhyme_part(["HH", "M"]))
+
+  def test_get_words__returns_words_with_same_rhyme_part(self):
+    index = RhymeIndex(ENTRIES)
+
+    self.assertEqual(["BLUE", "TO", "TOO"], index.get_words("S UW1"))
+    self.assertEqual(["DATA"], index.get_words(["B", "EY1", "T", "AH0"]))
+    self.assertEqual([], index.get_words("N OW1"))
+
+  def test_get_words__without_secondary_stress__secondary_stress_rhymes_with_no_stress(self):
+    index = RhymeIndex(ENTRIES, secondary_stress=False)
+
+    self.assertEqual(["DATA", "STATA"], index.get_words("B EY1 T AH0"))
+    self.assertEqual(["DATA", "STATA"], index.get_words("B EY1 T AH2"))
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_rhymes__returns_other_words(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual(["BLUE", "TOO"], cmu_dict.rhymes("to"))
+    self.assertEqual([], cmu_dict.rhymes("data"))
+    self.assertEqual(["STATA"], cmu_dict.rhymes("data", secondary_stress=False))
+
+  def test_rhymes_for_arpa__mmap__returns_words(self):
+    cmu_dict = get_dict(self.folder, silent=True, storage=STORAGE_MMAP)
+
+    self.assertEqual(["STATE"], cmu_dict.rhymes_for_arpa("W EY1 T"))
+    self.assertEqual(["BLUE", "TO", "TOO"], cmu_dict.rhymes_for_arpa(["UW1"]))
+
+  def test_rhymes__unknown_word__throws_exception(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    with self.assertRaises(Exception):
+      cmu_dict.rhymes("xxl")
+
+  def test_index_statistics__records_build_of_rhyme_index(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    cmu_dict.rhymes("to")
+    cmu_dict.rhymes("too")
+    res = cmu_dict.index_statistics
+
+    self.assertEqual(["build_rhyme_index"], [stage.name for stage in res])
+    self.assertEqual(5, res[0].counts["entries"])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(RhymeIndexUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,129 @@
+"""
+Counters for the lookups of a dictionary: number of lookups, hits and misses and the most frequent unknown words.
+The unknown words are counted with the Space-Saving algorithm (Metwally et al., 2005), which needs memory only for the top_k tracked words.
+"""
+
+import threading
+from heapq import heappush, heapreplace
+from typing import Any, Dict, List, Mapping, Tuple
+
+DEFAULT_TOP_K = 100
+# distinct unknown words which are buffered before they are added to the top-k sketch
+MAX_PENDING_WORDS = 1024
+
+# word, estimated count, maximum overestimation of the count
+TopKWord = Tuple[str, int, int]
+
+
+class SpaceSaving():
+  '''
+  Approximate counts of the most frequent words in a stream with memory for k words.
+  Every word whose real count is greater than (number of added words) / k is contained; its count is overestimated by at most the returned error.
+  '''
+
+  def __init__(self, k: int = DEFAULT_TOP_K):
+    if k < 1:
+      raise ValueError("Parameter k needs to be at least 1.")
+    self._k = k
+    self._counts: Dict[str, int] = {}
+    self._errors: Dict[str, int] = {}
+    # one entry per tracked word; the stored count can be lower than the real one, it is corrected when the entry reaches the top
+    self._heap: List[Tuple[int, str]] = []
+
+  def add(self, word: str, occurrences: int = 1) -> None:
+    count = self._counts.get(word)
+    if count is not None:
+      self._counts[word] = count + occurrences
+      return
+    if len(self._counts) < self._k:
+      self._counts[word] = occurrences
+      self._errors[word] = 0
+      heappush(self._heap, (occurrences, word))
+      return
+    min_count, min_word = self._heap[0]
+    while self._counts[min_word] != min_count:
+      heapreplace(self._heap, (self._counts[min_word], min_word))
+      min_count, min_word = self._heap[0]
+    # the new word replaces the word with the lowest count and inherits its count as error
+    del self._counts[min_word]
+    del self._errors[min_word]
+    self._counts[word] = min_count + occurrences
+    self._errors[word] = min_count
+    heapreplace(self._heap, (min_count + occurrences, word))
+
+  def get_top(self, count: int) -> List[TopKWord]:
+    ''' The most frequent words, sorted descending by their count. '''
+    ranked = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+    return [(word, word_count, self._errors[word]) for word, word_count in ranked[:count]]
+
+  def __len__(self) -> int:
+    return len(self._counts)
+
+
+class LookupStatistics():
+  '''
+  Counts lookups, hits and misses and the most frequent unknown words.
+  The unknown words are counted in a buffer and added to the top-k sketch in batches, therefore a lookup neither locks nor updates the sketch.
+  The counters may miss a few counts if several threads look up words at once.
+  '''
+
+  def __init__(self, top_k: int = DEFAULT_TOP_K):
+    self._top_k = top_k
+    self._lock = threading.Lock()
+    self.reset()
+
+  def reset(self) -> None:
+    self.hits = 0
+    self.misses = 0
+    self._pending_unknown_words: Dict[str, int] = {}
+    self._unknown_words = SpaceSaving(self._top_k)
+
+  @property
+  def lookups(self) -> int:
+    return self.hits + self.misses
+
+  def record(self, word: str, found: bool, occurrences: int = 1) -> None:
+    if found:
+      self.hits += occurrences
+      return
+    self.misses += occurrences
+    pending = self._pending_unknown_words
+    upper_word = word.upper()
+    pending[upper_word] = pending.get(upper_word, 0) + occurrences
+    if len(pending) >= MAX_PENDING_WORDS:
+      self._add_pending_unknown_words()
+
+  def record_counts(self, hits: int, unknown_words: Mapping[str, int]) -> None:
+    ''' Counts the lookups of a batch at once: the number of hits and the number of occurrences of each unknown word. '''
+    self.hits += hits
+    self.misses += sum(unknown_words.values())
+    with self._lock:
+      for word, occurrences in unknown_words.items():
+        self._unknown_words.add(word.upper(), occurrences)
+
+  def _add_pending_unknown_words(self) -> None:
+    pending = self._pending_unknown_words
+    self._pending_unknown_words = {}
+    with self._lock:
+      for word, occurrences in pending.items():
+        self._unknown_words.add(word, occurrences)
+
+  def snapshot(self) -> Dict[str, Any]:
+    self._add_pending_unknown_words()
+    with self._lock:
+      top_unknown_words = self._unknown_words.get_top(self._top_k)
+    lookups = self.lookups
+    return {
+      "lookups": lookups,
+      "hits": self.hits,
+      "misses": self.misses,
+      "oov_rate": self.misses / lookups if lookups > 0 else 0.0,
+      "top_unknown_words": top_unknown_words,
+    }
+
+  def __getstate__(self) -> Dict[str, Any]:
+    # e.g. the workers of convert_parallel count on their own
+    return {"top_k": self._top_k}
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    self.__init__(state["top_k"])
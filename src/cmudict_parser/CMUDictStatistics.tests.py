@@ -0,0 +1,163 @@
+import pickle
+import random
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+from cmudict_parser.CMUDict import get_dict
+from cmudict_parser.CMUDictStatistics import (MAX_PENDING_WORDS,
+                                              LookupStatistics, SpaceSaving)
+from CMUDictTesting import write_test_dictionary
+
+
+class SpaceSavingUnitTests(unittest.TestCase):
+  def test_add__less_words_than_k__counts_exactly(self):
+    sketch = SpaceSaving(k=3)
+    for word in ["a", "b", "a", "c", "a", "b"]:
+      sketch.add(word)
+
+    self.assertEqual([("a", 3, 0), ("b", 2, 0), ("c", 1, 0)], sketch.get_top(3))
+
+  def test_add__more_words_than_k__replaces_minimum_and_keeps_error(self):
+    sketch = SpaceSaving(k=2)
+    for word in ["a", "a", "b", "c"]:
+      sketch.add(word)
+
+    self.assertEqual([("a", 2, 0), ("c", 2, 1)], sketch.get_top(2))
+    self.assertEqual(2, len(sketch))
+
+  def test_add__zipf_stream__contains_frequent_words_with_bounded_error(self):
+    rnd = random.Random(1)
+    words = [f"w{i}" for i in range(2000)]
+    stream = rnd.choices(words, weights=[1 / (rank + 1) for rank in range(len(words))], k=50000)
+    sketch = SpaceSaving(k=50)
+    for word in stream:
+      sketch.add(word)
+    exact = Counter(stream)
+
+    res = {word: (count, error) for word, count, error in sketch.get_top(50)}
+    for word, count in exact.most_common(5):
+      self.assertIn(word, res)
+      estimated, error = res[word]
+      self.assertLessEqual(count, estimated)
+      self.assertLessEqual(estimated - error, count)
+
+  def test_init__k_zero__throws_exception(self):
+    with self.assertRaises(ValueError):
+      SpaceSaving(k=0)
+
+
+class LookupStatisticsUnitTests(unittest.TestCase):
+  def test_record__counts_hits_misses_and_unknown_words(self):
+    statistics = LookupStatistics(top_k=2)
+    statistics.record("to", True)
+    statistics.record("xxl", False)
+    statistics.record("Xxl", False)
+    res = statistics.snapshot()
+
+    self.assertEqual({"lookups": 3, "hits": 1, "misses": 2, "oov_rate": 2 / 3,
+                     "top_unknown_words": [("XXL", 2, 0)]}, res)
+
+  def test_record_counts__counts_batch(self):
+    statistics = LookupStatistics(top_k=2)
+    statistics.record_counts(3, {"xxl": 2, "Xxl": 1, "abc": 1})
+    res = statistics.snapshot()
+
+    self.assertEqual(7, res["lookups"])
+    self.assertEqual(3, res["hits"])
+    self.assertEqual(4, res["misses"])
+    self.assertEqual(("XXL", 3, 0), res["top_unknown_words"][0])
+
+  def test_record__more_unknown_words_than_buffered__keeps_counts(self):
+    statistics = LookupStatistics(top_k=10)
+    for i in range(MAX_PENDING_WORDS + 1):
+      statistics.record(f"w{i}", False)
+      statistics.record("xxl", False)
+    res = statistics.snapshot()
+
+    self.assertEqual(2 * (MAX_PENDING_WORDS + 1), res["misses"])
+    self.assertEqual("XXL", res["top_unknown_words"][0][0])
+    self.assertLessEqual(MAX_PENDING_WORDS + 1, res["top_unknown_words"][0][1])
+
+  def test_reset__sets_counters_to_zero(self):
+    statistics = LookupStatistics()
+    statistics.record("xxl", False)
+    statistics.reset()
+
+    self.assertEqual(0, statistics.snapshot()["lookups"])
+    self.assertEqual([], statistics.snapshot()["top_unknown_words"])
+
+  def test_pickle__drops_counts(self):
+    statistics = LookupStatistics(top_k=5)
+    statistics.record("xxl", False)
+    res = pickle.loads(pickle.dumps(statistics))
+
+    self.assertEqual(0, res.snapshot()["lookups"])
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp())
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_lookup_statistics__disabled__throws_exception(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    cmu_dict.contains("to")
+
+    with self.assertRaises(Exception):
+      _ = cmu_dict.lookup_statistics
+
+  def test_lookup_statistics__lookups_and_conversions__counts_each_word_once(self):
+    cmu_dict = get_dict(self.folder, silent=True, statistics=True)
+    cmu_dict.contains("to")
+    cmu_dict.get_all_arpa("no")
+    cmu_dict.sentence_to_arpa("to xxl")
+    cmu_dict.sentences_to_arpa(["xxl xxl", "not yyy"])
+    cmu_dict.sentence_to_arpa_old("(xxl-to), no.", replace_unknown_with="_")
+    res = cmu_dict.lookup_statistics
+
+    self.assertEqual(11, res["lookups"])
+    self.assertEqual(6, res["hits"])
+    self.assertEqual(5, res["misses"])
+    self.assertEqual([("XXL", 4, 0), ("YYY", 1, 0)], res["top_unknown_words"])
+    self.assertEqual(2, res["cache"]["misses"])
+
+  def test_reset_statistics__resets_lookups_and_cache_counters(self):
+    cmu_dict = get_dict(self.folder, silent=True, statistics=True)
+    cmu_dict.sentence_to_arpa_old("to xxl", replace_unknown_with="_")
+    cmu_dict.reset_statistics()
+    res = cmu_dict.lookup_statistics
+
+    self.assertEqual(0, res["lookups"])
+    self.assertEqual(0, res["cache"]["misses"])
+
+  def test_sentences_to_arpa_old__with_statistics__returns_same_results(self):
+    sentences = ["to xxl.", "no-xxl, (not)"]
+    cmu_dict = get_dict(self.folder, silent=True, statistics=True)
+
+    res = cmu_dict.sentences_to_arpa_old(iter(sentences), replace_unknown_with="_")
+
+    self.assertEqual(get_dict(self.folder, silent=True).sentences_to_arpa_old(sentences, replace_unknown_with="_"), res)
+    self.assertEqual(5, cmu_dict.lookup_statistics["lookups"])
+
+  def test_iter_words_of_sentence__hyphenated_and_punctuated_words__does_not_count_them(self):
+    cmu_dict = get_dict(self.folder, silent=True, statistics=True)
+
+    res = list(cmu_dict.iter_words_of_sentence("(to-xxl), no-not. a"))
+
+    self.assertEqual([("to", True), ("xxl", False), ("no", True), ("not", True), ("a", True)], res)
+    self.assertEqual(0, cmu_dict.lookup_statistics["lookups"])
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(SpaceSavingUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(LookupStatisticsUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,58 @@
+"""
+Pronunciations without stress markers, e.g. "T AH0" -> "T AH", for tools which work on phones without stress.
+Pronunciations of a word which differ only in the stress become one pronunciation. Equal pronunciations of different words, e.g. of homophones, share one list, therefore the returned lists must not be changed.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
+
+from cmudict_parser.CMUDictParser import (ARPAPronunciation,
+                                          ARPAPronunciations, Word)
+from cmudict_parser.CMUDictReverseIndex import STRESS_MARKERS
+
+
+class StresslessARPADict(Mapping):
+  ''' Read-only mapping from upper case words to their pronunciations without stress markers, in the order of the dictionary. '''
+
+  def __init__(self, entries: Mapping):
+    pronunciations_without_stress: Dict[Tuple[str, ...], ARPAPronunciation] = {}
+    self._entries: Dict[Word, ARPAPronunciations] = {}
+    for word, pronunciations in entries.items():
+      result: ARPAPronunciations = []
+      for pronunciation in pronunciations:
+        key = tuple([symbol.rstrip(STRESS_MARKERS) for symbol in pronunciation])
+        pronunciation_without_stress = pronunciations_without_stress.get(key)
+        if pronunciation_without_stress is None:
+          pronunciation_without_stress = [sys.intern(symbol) for symbol in key]
+          pronunciations_without_stress[key] = pronunciation_without_stress
+        if pronunciation_without_stress not in result:
+          result.append(pronunciation_without_stress)
+      self._entries[word] = result
+    self._pronunciation_count = len(pronunciations_without_stress)
+    self._pronunciations_size = sum(sys.getsizeof(pronunciation) for pronunciation in pronunciations_without_stress.values())
+
+  @property
+  def pronunciation_count(self) -> int:
+    ''' Number of distinct pronunciations without stress. '''
+    return self._pronunciation_count
+
+  def get_first(self, word: Word) -> Optional[ARPAPronunciation]:
+    pronunciations = self._entries.get(word, None)
+    return None if pronunciations is None else pronunciations[0]
+
+  def __getitem__(self, word: Word) -> ARPAPronunciations:
+    return self._entries[word]
+
+  def __contains__(self, word: object) -> bool:
+    return word in self._entries
+
+  def __iter__(self) -> Iterator[Word]:
+    return iter(self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get_memory_size(self) -> int:
+    ''' Bytes of the dict, the lists of pronunciations and the distinct pronunciations without the words and the symbols, which are shared. '''
+    return sys.getsizeof(self._entries) + sum(sys.getsizeof(pronunciations) for pronunciations in self._entries.values()) + self._pronunciations_size
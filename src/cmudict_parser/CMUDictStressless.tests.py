@@ -0,0 +1,93 @@
+import shutil
+import tempfile
+import unittest
+
+from cmudict_parser.CMUDict import STORAGE_ENCODED, STORAGE_MMAP, get_dict
+from cmudict_parser.CMUDictStressless import StresslessARPADict
+from CMUDictTesting import write_test_dictionary
+
+SYMBOLS = "AH0\nAH1\nN\nOW1\nT\nUW1\n"
+DICTIONARY = "A  AH0\nA(1)  AH1\nKNOW  N OW1\nNO  N OW1\nTO  T UW1\nTO(1)  T AH0\n"
+
+ENTRIES = {
+  "A": [["AH0"], ["AH1"]],
+  "KNOW": [["N", "OW1"]],
+  "NO": [["N", "OW1"]],
+  "TO": [["T", "UW1"], ["T", "AH0"]],
+}
+
+
+class StresslessARPADictUnitTests(unittest.TestCase):
+  def test_getitem__returns_pronunciations_without_stress(self):
+    res = StresslessARPADict(ENTRIES)
+
+    self.assertEqual([["T", "UW"], ["T", "AH"]], res["TO"])
+    self.assertEqual(["N", "OW"], res.get_first("KNOW"))
+    self.assertIsNone(res.get_first("XXL"))
+
+  def test_getitem__pronunciations_which_differ_only_in_stress__are_returned_once(self):
+    res = StresslessARPADict(ENTRIES)
+
+    self.assertEqual([["AH"]], res["A"])
+
+  def test_init__equal_pronunciations__are_shared(self):
+    res = StresslessARPADict(ENTRIES)
+
+    self.assertIs(res["KNOW"][0], res["NO"][0])
+    self.assertEqual(4, res.pronunciation_count)
+    self.assertEqual(4, len(res))
+
+
+class CMUDictUnitTests(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls) -> None:
+    cls.folder = write_test_dictionary(tempfile.mkdtemp(), SYMBOLS, DICTIONARY)
+
+  @classmethod
+  def tearDownClass(cls) -> None:
+    shutil.rmtree(cls.folder)
+
+  def test_get_first_arpa__without_stress__returns_symbols_without_stress(self):
+    for storage in (STORAGE_ENCODED, STORAGE_MMAP):
+      cmu_dict = get_dict(self.folder, silent=True, storage=storage)
+
+      self.assertEqual(["T", "UW"], cmu_dict.get_first_arpa("to", stress=False))
+      self.assertEqual(["T", "UW1"], cmu_dict.get_first_arpa("to"))
+
+  def test_get_all_arpa__without_stress__returns_distinct_pronunciations(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    self.assertEqual([["AH"]], cmu_dict.get_all_arpa("a", stress=False))
+    self.assertEqual([["T", "UW"], ["T", "AH"]], cmu_dict.get_all_arpa("to", stress=False))
+
+  def test_get_all_arpa__without_stress__unknown_word__throws_exception(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+
+    with self.assertRaises(Exception):
+      cmu_dict.get_all_arpa("xxl", stress=False)
+
+  def test_sentences_to_arpa__without_stress__returns_same_results_as_sentence_to_arpa(self):
+    cmu_dict = get_dict(self.folder, silent=True)
+    sentences = ["to no", "xxl a"]
+    res = cmu_dict.sentences_to_arpa(sentences, stress=False)
+
+    self.assertEqual([["T", "UW", " ", "N", "OW"], ["<UNK>", " ", "AH"]], res)
+    self.assertEqual([cmu_dict.sentence_to_arpa(sentence, stress=False) for sentence in sentences], res)
+
+  def test_index_statistics__records_build_of_table_once(self):
+    cmu_dict = get_dict(self.folder, silent=True, lazy=True)
+    cmu_dict.get_first_arpa("to", stress=False)
+    cmu_dict.get_all_arpa("no", stress=False)
+    res = cmu_dict.index_statistics
+
+    self.assertEqual(["build_stressless_arpa"], [stage.name for stage in res])
+    self.assertEqual(4, res[0].counts["entries"])
+    self.assertGreater(res[0].counts["memory_bytes"], 0)
+
+
+if __name__ == '__main__':
+  suite = unittest.TestSuite([
+    unittest.TestLoader().loadTestsFromTestCase(StresslessARPADictUnitTests),
+    unittest.TestLoader().loadTestsFromTestCase(CMUDictUnitTests),
+  ])
+  unittest.TextTestRunner(verbosity=2).run(suite)
@@ -3,43 +3,228 @@ Remarks:
 https://github.com/cmusphinx/cmudict is newer than 0.7b! It has for example 'declarative' but is has unfortunately no MIT-license.
 """
 
+import re
 import string
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import accumulate
 from logging import getLogger
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Set, Tuple, Union)
+from weakref import WeakSet
 
 PUNCTUATION_AND_LINEBREAK = f"{string.punctuation}\n"
-
-IPA_CACHE: Dict[str, str] = {}
+_PUNCTUATION_RE = re.compile(f"[{re.escape(PUNCTUATION_AND_LINEBREAK)}]")
+_PUNCTUATION_PREFIX_RE = re.compile(f"[{re.escape(PUNCTUATION_AND_LINEBREAK)}]*")
+
+DEFAULT_CACHE_SIZE = 100000
+
+ReplaceUnknownWith = Optional[Union[str, Callable[[str], str]]]
+CacheKey = Tuple[str, ReplaceUnknownWith]
+
+_ALL_CACHES: "WeakSet[ConversionCache]" = WeakSet()
+_MISSING = object()
+
+
+class ConversionCache():
+  '''
+  LRU cache for converted words which is keyed by the word and the policy for unknown words (replace_unknown_with).
+  max_size: maximum number of cached words, None for no limit
+  The cache can be shared by several threads: get() does not lock, it relies on the atomic dict operations of OrderedDict, whereas set() and clear() are serialized with a lock.
+  The statistics are exact for one thread and may miss a few counts under concurrent use.
+  '''
+
+  def __init__(self, max_size: Optional[int] = DEFAULT_CACHE_SIZE):
+    if max_size is not None and max_size < 0:
+      raise ValueError("Parameter max_size needs to be non-negative.")
+    self._max_size = max_size
+    self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    _ALL_CACHES.add(self)
+
+  @property
+  def max_size(self) -> Optional[int]:
+    return self._max_size
+
+  def get(self, word: str, replace_unknown_with: ReplaceUnknownWith) -> Optional[str]:
+    key = (word, replace_unknown_with)
+    result = self._entries.get(key, _MISSING)
+    if result is _MISSING:
+      self.misses += 1
+      return None
+    try:
+      self._entries.move_to_end(key)
+    except KeyError:
+      # evicted by another thread in the meantime, the value is still valid
+      pass
+    self.hits += 1
+    return result
+
+  def set(self, word: str, replace_unknown_with: ReplaceUnknownWith, ipa: str) -> None:
+    if self._max_size == 0:
+      return
+    key = (word, replace_unknown_with)
+    with self._lock:
+      self._entries[key] = ipa
+      self._entries.move_to_end(key)
+      if self._max_size is not None and len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+  def reset_statistics(self) -> None:
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  @property
+  def statistics(self) -> Dict[str, Any]:
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "size": len(self._entries),
+      "max_size": self._max_size,
+    }
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def __getstate__(self) -> Dict[str, Any]:
+    # the cached words are not transferred to other processes, the keys can contain functions which can not be pickled
+    return {"max_size": self._max_size}
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    self.__init__(state["max_size"])
+
+
+# used if no cache is passed to sentence_to_ipa
+IPA_CACHE = ConversionCache()
 
 
 def clear_cache() -> None:
-  IPA_CACHE.clear()
+  ''' Clears all conversion caches, including the caches of all CMUDict instances. '''
+  for cache in list(_ALL_CACHES):
+    cache.clear()
+
+
+class UpperKeyDict(Mapping):
+  '''
+  Read-only view on a dictionary whose keys are checked once on construction to be upper case.
+  The converter functions skip the check of all keys for instances of this class.
+  '''
+
+  def __init__(self, dict: Mapping):
+    if isinstance(dict, UpperKeyDict):
+      dict = dict._dict
+    elif not all_keys_are_upper(dict):
+      raise ValueError("All keys of the dictionary need to be upper case!")
+    self._dict = dict
+    self._hyphen_index: Optional[HyphenIndex] = None
+
+  @property
+  def hyphen_index(self) -> "HyphenIndex":
+    ''' Index of the keys which contain a hyphen, it is built on first use. '''
+    # if several threads build it at once, all of them build the same index
+    if self._hyphen_index is None:
+      self._hyphen_index = HyphenIndex(self._dict)
+    return self._hyphen_index
+
+  def __getitem__(self, key: str) -> str:
+    return self._dict[key]
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._dict
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(self._dict)
+
+  def __len__(self) -> int:
+    return len(self._dict)
+
+
+class HyphenIndex():
+  '''
+  The hyphen-separated parts of all keys which contain a hyphen, without the apostrophes at the beginning and at the end of the key.
+  A combination of parts can only be in the dictionary if its parts are in the index, therefore the other combinations are not probed.
+  '''
 
+  def __init__(self, dict: Mapping):
+    self._parts: Set[Tuple[str, ...]] = set()
+    self.max_part_count = 1
+    self.max_key_length = 0
+    for key in dict:
+      self.max_key_length = max(self.max_key_length, len(key))
+      if "-" in key:
+        parts = key.split("-")
+        self._parts.add(normalize_hyphen_parts(parts))
+        self.max_part_count = max(self.max_part_count, len(parts))
 
-def sentence_to_ipa(dict: Dict[str, str], sentence: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool) -> str:
+  def may_contain(self, upper_parts: List[str]) -> bool:
+    return normalize_hyphen_parts(upper_parts) in self._parts
+
+
+def normalize_hyphen_parts(parts: List[str]) -> Tuple[str, ...]:
+  # the apostrophes at the beginning and at the end are stripped and partly added again before the dictionary is probed
+  assert len(parts) >= 2
+  return (parts[0].lstrip("'"), *parts[1:-1], parts[-1].rstrip("'"))
+
+
+def has_upper_keys(dict: Mapping) -> bool:
+  return isinstance(dict, UpperKeyDict) or all_keys_are_upper(dict)
+
+
+def sentence_to_ipa(dict: Dict[str, str], sentence: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool, cache: Optional[ConversionCache] = None) -> str:
+  ''' cache: used if use_caching is True, defaults to the module-wide IPA_CACHE; pass one cache per dictionary '''
   words = sentence.split(" ")
   if use_caching:
+    cache = IPA_CACHE if cache is None else cache
     ipa_words = [get_ipa_of_word_in_sentence_cache(
-      dict, word, replace_unknown_with) for word in words]
+      dict, word, replace_unknown_with, cache) for word in words]
   else:
     ipa_words = [get_ipa_of_word_in_sentence(dict, word, replace_unknown_with) for word in words]
   res = " ".join(ipa_words)
   return res
 
 
-def get_ipa_of_word_in_sentence_cache(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
-  global IPA_CACHE
-  if word in IPA_CACHE:
-    return IPA_CACHE[word]
-  else:
+def sentences_to_ipa(dict: Dict[str, str], sentences: Iterable[str], replace_unknown_with: Optional[Union[str, Callable[[str], str]]], use_caching: bool, cache: Optional[ConversionCache] = None) -> List[str]:
+  '''
+  Converts a batch of sentences; every distinct word of the batch is converted only once.
+  A custom replace_unknown_with function is therefore called once per distinct unknown word of the batch.
+  '''
+  sentences_words = [sentence.split(" ") for sentence in sentences]
+  cache = IPA_CACHE if cache is None else cache
+  ipa_of_words: Dict[str, str] = {}
+  for words in sentences_words:
+    for word in words:
+      if word not in ipa_of_words:
+        if use_caching:
+          ipa_of_words[word] = get_ipa_of_word_in_sentence_cache(
+            dict, word, replace_unknown_with, cache)
+        else:
+          ipa_of_words[word] = get_ipa_of_word_in_sentence(dict, word, replace_unknown_with)
+  res = [" ".join([ipa_of_words[word] for word in words]) for words in sentences_words]
+  return res
+
+
+def get_ipa_of_word_in_sentence_cache(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]], cache: ConversionCache) -> str:
+  ipa = cache.get(word, replace_unknown_with)
+  if ipa is None:
     ipa = get_ipa_of_word_in_sentence(dict, word, replace_unknown_with)
-    IPA_CACHE[word] = ipa
-    return ipa
+    cache.set(word, replace_unknown_with, ipa)
+  return ipa
 
 
 def get_ipa_of_word_in_sentence(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
-  global IPA_CACHE
-  if any(char in PUNCTUATION_AND_LINEBREAK for char in word):
+  if _PUNCTUATION_RE.search(word) is not None:
     ipa = get_ipa_of_word_with_punctuation(dict, word, replace_unknown_with)
   else:
     ipa = get_ipa_of_word_without_punctuation_or_unknown_words(dict, word, replace_unknown_with)
@@ -47,32 +232,72 @@ def get_ipa_of_word_in_sentence(dict: Dict[str, str], word: str, replace_unknown
 
 
 def get_ipa_of_word_with_punctuation(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
-  word, punctuation_before_word = extract_punctuation_before_word(word)
-  if word == "":
-    return punctuation_before_word
-  word_without_punctuation, punctuation_after_word = extract_punctuation_after_word_except_hyphen_or_apostrophe(
-    word)
-  return ipa_of_punctuation_and_words_combined(dict, punctuation_before_word, word_without_punctuation, punctuation_after_word, replace_unknown_with)
+  # the token is scanned once from left to right: punctuation, word, punctuation, word, ...
+  # the parts after a word are converted as long as they contain a letter, the rest is kept as it is
+  last_letter_pos = _get_last_letter_pos(word)
+  result = []
+  start = 0
+  while True:
+    word_start = _end_of_punctuation(word, start)
+    punctuation_before_word = word[start:word_start]
+    if word_start == len(word):
+      result.append(punctuation_before_word)
+      break
+    word_end = _end_of_word(word, word_start)
+    word_without_punctuation = word[word_start:word_end]
+    result.append(ipa_of_punctuation_and_word(dict, punctuation_before_word,
+                  word_without_punctuation, replace_unknown_with))
+    if last_letter_pos < word_end:
+      result.append(word[word_end:])
+      break
+    start = word_end
+  return "".join(result)
+
+
+def _end_of_punctuation(word: str, start: int) -> int:
+  return _PUNCTUATION_PREFIX_RE.match(word, start).end()
+
+
+def _end_of_word(word: str, start: int) -> int:
+  end = start
+  while end < len(word) and (word[end].isalpha() or word[end] in "'-"):
+    end += 1
+  return end
+
+
+def _get_last_letter_pos(word: str) -> int:
+  for pos in range(len(word) - 1, -1, -1):
+    if word[pos].isalpha():
+      return pos
+  return -1
 
 
 def extract_punctuation_before_word(word: str) -> Tuple[str, str]:
-  punctuation_before_word = ""
-  while word != "" and (word[0] in PUNCTUATION_AND_LINEBREAK):
-    punctuation_before_word += word[0]
-    word = word[1:]
-  return word, punctuation_before_word
+  end = _end_of_punctuation(word, 0)
+  return word[end:], word[:end]
 
 
 def extract_punctuation_after_word_except_hyphen_or_apostrophe(word: str) -> Tuple[str, str]:
-  punctuation_after_word = word
-  word_without_punctuation = ""
-  while punctuation_after_word != "" and (punctuation_after_word[0].isalpha() or punctuation_after_word[0] in "'-"):
-    word_without_punctuation += punctuation_after_word[0]
-    punctuation_after_word = punctuation_after_word[1:]
-  return word_without_punctuation, punctuation_after_word
+  end = _end_of_word(word, 0)
+  return word[:end], word[end:]
 
 
 def ipa_of_punctuation_and_words_combined(dict: Dict[str, str], punctuation_before_word: str, word_without_punctuation: str, punctuation_after_word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
+  ipa_with_punctuation_before_word = ipa_of_punctuation_and_word(
+    dict, punctuation_before_word, word_without_punctuation, replace_unknown_with)
+  return value_depending_on_is_alphabetic_value_in_punctuation_after_word(dict, "", ipa_with_punctuation_before_word, punctuation_after_word, replace_unknown_with)
+
+
+def ipa_of_punctuation_and_word(dict: Dict[str, str], punctuation_before_word: str, word_without_punctuation: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
+  ipa_before, word_with_hyphen, ipa_after = split_punctuation_and_word(
+    dict, punctuation_before_word, word_without_punctuation, replace_unknown_with)
+  if word_with_hyphen is None:
+    return ipa_before
+  return f"{ipa_before}{get_ipa_of_words_with_hyphen(dict, word_with_hyphen, replace_unknown_with)}{ipa_after}"
+
+
+def split_punctuation_and_word(dict: Dict[str, str], punctuation_before_word: str, word_without_punctuation: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> Tuple[str, Optional[str], str]:
+  ''' Returns the IPA before, the word whose hyphenated parts need to be converted (None if there is none) and the IPA after it. '''
   assert word_without_punctuation != "" and word_without_punctuation[0].isalpha()
   word_without_punctuation, char_at_end, word_with_apo_at_beginning, word_with_apo_at_end, word_with_apo_at_end_and_beginning = word_with_apo(
     word_without_punctuation)
@@ -87,10 +312,10 @@ def ipa_of_punctuation_and_words_combined(dict: Dict[str, str], punctuation_befo
     ipa_of_word_without_punct = get_ipa_of_word_without_punctuation_or_unknown_words(
       dict, word_with_apo_at_end, replace_unknown_with)
   elif "-" in word_without_punctuation and not word_without_punctuation.upper() in dict:
-    ipa_of_word_without_punct = f"{get_ipa_of_words_with_hyphen(dict, word_without_punctuation, replace_unknown_with)}{char_at_end}"
+    return punctuation_before_word, word_without_punctuation, char_at_end
   else:
     ipa_of_word_without_punct = f"{get_ipa_of_word_without_punctuation_or_unknown_words(dict, word_without_punctuation, replace_unknown_with)}{char_at_end}"
-  return value_depending_on_is_alphabetic_value_in_punctuation_after_word(dict, punctuation_before_word, ipa_of_word_without_punct, punctuation_after_word, replace_unknown_with)
+  return f"{punctuation_before_word}{ipa_of_word_without_punct}", None, ""
 
 
 def word_with_apo(word_without_punctuation: str) -> Tuple[str, str, str, str, str]:
@@ -106,6 +331,8 @@ def value_depending_on_is_alphabetic_value_in_punctuation_after_word(dict: Dict[
 
 
 def get_ipa_of_words_with_hyphen(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
+  if isinstance(dict, UpperKeyDict):
+    return HyphenChain(dict, word, replace_unknown_with).get_ipa()
   parts = word.split("-")
   ipa = ""
   for length_of_combination in range(len(parts), 0, -1):
@@ -120,8 +347,161 @@ def get_ipa_of_words_with_hyphen(dict: Dict[str, str], word: str, replace_unknow
   return ipa
 
 
+# start, end, text of the first part, text of the last part; the first and the last part of a range can be shorter than in the word
+PartsRange = Tuple[int, int, str, str]
+
+_TASK_TEXT = 0
+_TASK_WORD = 1
+_TASK_HYPHEN = 2
+
+
+class HyphenChain():
+  '''
+  Converts a word with hyphens like get_ipa_of_words_with_hyphen does for other dictionaries, but without recursion: the remaining parts before and after a found combination are tasks on a stack.
+  The tasks refer to ranges of the parts of the word, therefore the parts are split and looked up in the hyphen index only once and long chains are converted in nearly linear time.
+  '''
+
+  def __init__(self, dict: UpperKeyDict, word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]):
+    self._dict = dict
+    self._replace_unknown_with = replace_unknown_with
+    self._parts = word.split("-")
+    self._offsets = list(accumulate((len(part) + 1 for part in self._parts), initial=0))
+    hyphen_index = dict.hyphen_index
+    self._max_key_length = hyphen_index.max_key_length
+    upper_parts = [part.upper() for part in self._parts]
+    # sorted start positions of the combinations which may be in the dictionary, per number of parts
+    self._starts_of_length: Dict[int, List[int]] = {}
+    for length in range(min(hyphen_index.max_part_count, len(self._parts)), 1, -1):
+      self._starts_of_length[length] = [start for start in range(len(self._parts) - length + 1)
+                                        if hyphen_index.may_contain(upper_parts[start:start + length])]
+
+  def get_ipa(self) -> str:
+    result: List[str] = []
+    tasks: List[Tuple[int, Any]] = [(_TASK_HYPHEN, self._get_range(0, len(self._parts)))]
+    # the tasks are pushed in reverse order, therefore they are processed in the order of the text
+    while len(tasks) > 0:
+      task, value = tasks.pop()
+      if task == _TASK_TEXT:
+        result.append(value)
+      elif task == _TASK_WORD:
+        self._convert_word(value, tasks)
+      else:
+        self._convert_hyphen_word(value, tasks)
+    return "".join(result)
+
+  def _convert_word(self, parts_range: PartsRange, tasks: List[Tuple[int, Any]]) -> None:
+    ''' Like get_ipa_of_word_in_sentence on the parts, which contain only letters and apostrophes. '''
+    start, end, _, _ = parts_range
+    word_start = next((pos for pos in range(start, end) if self._get_part(parts_range, pos).strip("'") != ""), None)
+    if word_start is None:
+      tasks.append((_TASK_TEXT, self._get_text(parts_range)))
+      return
+    part = self._get_part(parts_range, word_start)
+    stripped_part = part.lstrip("'")
+    punctuation_before_word = f"{self._get_text(self._get_sub_range(parts_range, start, word_start))}-" if word_start > start else ""
+    punctuation_before_word += part[:len(part) - len(stripped_part)]
+    word_range = self._replace_first(self._get_sub_range(parts_range, word_start, end), stripped_part)
+
+    # like word_with_apo
+    last_part = self._get_part(word_range, end - 1)
+    if last_part == "":
+      char_at_end = "-"
+      word_range_without_char_at_end = self._get_sub_range(word_range, word_start, end - 1)
+    elif last_part[-1] == "'":
+      char_at_end = "'"
+      word_range_without_char_at_end = self._replace_last(word_range, last_part[:-1])
+    else:
+      char_at_end = ""
+      word_range_without_char_at_end = word_range
+
+    start, end, _, _ = word_range_without_char_at_end
+    if end - start > 1 and self._get_length(word_range_without_char_at_end) > self._max_key_length:
+      # neither the word nor the word with apostrophes can be a key
+      tasks.extend([(_TASK_TEXT, char_at_end), (_TASK_HYPHEN, word_range_without_char_at_end), (_TASK_TEXT, punctuation_before_word)])
+      return
+    ipa_before, word_with_hyphen, ipa_after = split_punctuation_and_word(
+      self._dict, punctuation_before_word, self._get_text(word_range), self._replace_unknown_with)
+    if word_with_hyphen is None:
+      tasks.append((_TASK_TEXT, ipa_before))
+    else:
+      assert word_with_hyphen == self._get_text(word_range_without_char_at_end)
+      tasks.extend([(_TASK_TEXT, ipa_after), (_TASK_HYPHEN, word_range_without_char_at_end), (_TASK_TEXT, ipa_before)])
+
+  def _convert_hyphen_word(self, parts_range: PartsRange, tasks: List[Tuple[int, Any]]) -> None:
+    ''' Like get_ipa_of_words_with_hyphen: the longest combination of parts which is in the dictionary, the leftmost one if there are several. '''
+    start, end, _, _ = parts_range
+    for length in range(min(end - start, len(self._starts_of_length) + 1), 1, -1):
+      starts = self._starts_of_length[length]
+      for pos in range(bisect_left(starts, start), len(starts)):
+        if starts[pos] > end - length:
+          break
+        if self._add_combination(parts_range, starts[pos], length, tasks):
+          return
+    for startword_pos in range(start, end):
+      if self._add_combination(parts_range, startword_pos, 1, tasks):
+        return
+    unknown_list = [get_ipa_of_word_without_punctuation_or_unknown_words(
+      self._dict, self._get_part(parts_range, pos), self._replace_unknown_with) for pos in range(start, end)]
+    tasks.append((_TASK_TEXT, "-".join(unknown_list)))
+
+  def _add_combination(self, parts_range: PartsRange, startword_pos: int, length_of_combination: int, tasks: List[Tuple[int, Any]]) -> bool:
+    start, end, _, _ = parts_range
+    endword_pos = startword_pos + length_of_combination
+    combination = self._get_text(self._get_sub_range(parts_range, startword_pos, endword_pos))
+    word, apos_before, apos_after = strip_apos_at_beginning_and_end_if_they_do_not_belong_to_word(
+      self._dict, combination)
+    if word.upper() not in self._dict:
+      return False
+    hyphen_before = "-" if startword_pos > start else ""
+    hyphen_after = "-" if endword_pos < end else ""
+    tasks.extend([
+      (_TASK_WORD, self._get_sub_range(parts_range, endword_pos, end)),
+      (_TASK_TEXT, f"{hyphen_before}{apos_before}{self._dict[word.upper()]}{apos_after}{hyphen_after}"),
+      (_TASK_WORD, self._get_sub_range(parts_range, start, startword_pos)),
+    ])
+    return True
+
+  def _get_range(self, start: int, end: int) -> PartsRange:
+    if start == end:
+      return start, end, "", ""
+    return start, end, self._parts[start], self._parts[end - 1]
+
+  def _get_part(self, parts_range: PartsRange, pos: int) -> str:
+    start, end, first, last = parts_range
+    if pos == start:
+      return first
+    if pos == end - 1:
+      return last
+    return self._parts[pos]
+
+  def _get_sub_range(self, parts_range: PartsRange, start: int, end: int) -> PartsRange:
+    if start == end:
+      return start, end, "", ""
+    return start, end, self._get_part(parts_range, start), self._get_part(parts_range, end - 1)
+
+  def _replace_first(self, parts_range: PartsRange, first: str) -> PartsRange:
+    start, end, _, last = parts_range
+    return start, end, first, first if end - start == 1 else last
+
+  def _replace_last(self, parts_range: PartsRange, last: str) -> PartsRange:
+    start, end, first, _ = parts_range
+    return start, end, last if end - start == 1 else first, last
+
+  def _get_text(self, parts_range: PartsRange) -> str:
+    start, end, first, last = parts_range
+    if end - start <= 1:
+      return first
+    return "-".join([first, *self._parts[start + 1:end - 1], last])
+
+  def _get_length(self, parts_range: PartsRange) -> int:
+    start, end, first, last = parts_range
+    if end - start <= 1:
+      return len(first)
+    return self._offsets[end] - self._offsets[start] - 1 - (len(self._parts[start]) - len(first)) - (len(self._parts[end - 1]) - len(last))
+
+
 def find_combination_of_certain_length_in_dict(dict: Dict[str, str], parts: List[str], length_of_combination, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> Optional[str]:
-  assert all_keys_are_upper(dict)
+  assert has_upper_keys(dict)
   for startword_pos in range(len(parts) - length_of_combination + 1):
     combination = recombine_word(parts, startword_pos, startword_pos + length_of_combination)
     word, apos_before, apos_after = strip_apos_at_beginning_and_end_if_they_do_not_belong_to_word(
@@ -148,11 +528,8 @@ def strip_apos_at_beginning_and_end_if_they_do_not_belong_to_word(dict: Dict[str
 
 def strip_apos(word: str, pos: int) -> Tuple[str, str]:
   assert pos == 0 or pos == -1
-  apos = ""
-  while word != "" and word[pos] == "'":
-    apos += "'"
-    word = word[1:] if pos == 0 else word[:-1]
-  return word, apos
+  stripped = word.lstrip("'") if pos == 0 else word.rstrip("'")
+  return stripped, "'" * (len(word) - len(stripped))
 
 
 def word_and_hyphen_before_or_after(parts: List[str], startpos: int, endpos: int) -> Tuple[str, str]:
@@ -169,7 +546,7 @@ def recombine_word(parts: List[str], startpos: int, endpos: int) -> str:
 
 
 def get_ipa_of_word_without_punctuation_or_unknown_words(dict: Dict[str, str], word: str, replace_unknown_with: Optional[Union[str, Callable[[str], str]]]) -> str:
-  assert all_keys_are_upper(dict)
+  assert has_upper_keys(dict)
   if word == "":
     return ""
   if word.upper() in dict:
@@ -198,7 +575,7 @@ def word_is_really_upper(word: str) -> bool:
 
 
 def big_letters_to_ipa(dict: Dict[str, str], word: str) -> str:
-  assert all_keys_are_upper(dict)
+  assert has_upper_keys(dict)
   assert word_is_really_upper(word) or word == ""
   ipa = ""
   for char in word:
@@ -1,14 +1,17 @@
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from cmudict_parser.SentenceToIPA import (
-    big_letters_to_ipa,
-    extract_punctuation_after_word_except_hyphen_or_apostrophe,
+    IPA_CACHE, ConversionCache, HyphenIndex, UpperKeyDict, big_letters_to_ipa,
+    clear_cache, extract_punctuation_after_word_except_hyphen_or_apostrophe,
     extract_punctuation_before_word,
     find_combination_of_certain_length_in_dict, get_ipa_of_word_in_sentence,
     get_ipa_of_word_with_punctuation,
     get_ipa_of_word_without_punctuation_or_unknown_words,
-    get_ipa_of_words_with_hyphen, ipa_of_punctuation_and_words_combined,
-    recombine_word, replace_unknown_with_is_string, sentence_to_ipa,
+    get_ipa_of_words_with_hyphen, has_upper_keys,
+    ipa_of_punctuation_and_words_combined, recombine_word,
+    replace_unknown_with_is_string, sentence_to_ipa, sentences_to_ipa,
     strip_apos, strip_apos_at_beginning_and_end_if_they_do_not_belong_to_word,
     value_depending_on_is_alphabetic_value_in_punctuation_after_word,
     word_and_hyphen_before_or_after, word_is_really_upper, word_with_apo)
@@ -18,6 +21,164 @@ class UnitTests(unittest.TestCase):
   def __init__(self, methodName: str) -> None:
     super().__init__(methodName)
 
+  # region ConversionCache
+
+  def test_conversion_cache__get_after_set__returns_value_and_counts_hit(self):
+    cache = ConversionCache(max_size=2)
+    cache.set("to", "_", "tu")
+    res = cache.get("to", "_")
+
+    self.assertEqual("tu", res)
+    self.assertEqual(1, cache.hits)
+    self.assertEqual(0, cache.misses)
+
+  def test_conversion_cache__other_replace_unknown_with__is_miss(self):
+    cache = ConversionCache(max_size=2)
+    cache.set("xxl", "_", "___")
+    res = cache.get("xxl", None)
+
+    self.assertIsNone(res)
+    self.assertEqual(1, cache.misses)
+
+  def test_conversion_cache__full__evicts_least_recently_used(self):
+    cache = ConversionCache(max_size=2)
+    cache.set("a", None, "1")
+    cache.set("b", None, "2")
+    cache.get("a", None)
+    cache.set("c", None, "3")
+
+    self.assertEqual(2, len(cache))
+    self.assertEqual(1, cache.evictions)
+    self.assertEqual("1", cache.get("a", None))
+    self.assertIsNone(cache.get("b", None))
+    self.assertEqual("3", cache.get("c", None))
+
+  def test_conversion_cache__max_size_zero__caches_nothing(self):
+    cache = ConversionCache(max_size=0)
+    cache.set("a", None, "1")
+
+    self.assertEqual(0, len(cache))
+
+  def test_conversion_cache__statistics__returns_counters(self):
+    cache = ConversionCache(max_size=1)
+    cache.get("a", None)
+    cache.set("a", None, "1")
+    cache.set("b", None, "2")
+    cache.get("b", None)
+
+    self.assertEqual({"hits": 1, "misses": 1, "evictions": 1, "size": 1, "max_size": 1}, cache.statistics)
+
+  def test_conversion_cache__threads__values_stay_correct_and_size_bounded(self):
+    cache = ConversionCache(max_size=3)
+
+    def use_cache(thread: int) -> bool:
+      correct = True
+      for i in range(20000):
+        word = str((i * (thread + 1)) % 11)
+        value = cache.get(word, None)
+        if value is None:
+          cache.set(word, None, word * 2)
+        else:
+          correct &= value == word * 2
+        if i % 1000 == 0:
+          cache.clear()
+      return correct
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+      with ThreadPoolExecutor(8) as executor:
+        res = list(executor.map(use_cache, range(8)))
+    finally:
+      sys.setswitchinterval(switch_interval)
+
+    self.assertEqual([True] * 8, res)
+    self.assertLessEqual(len(cache), 3)
+
+  def test_clear_cache__clears_all_caches(self):
+    cache = ConversionCache()
+    cache.set("a", None, "1")
+    IPA_CACHE.set("a", None, "1")
+    clear_cache()
+
+    self.assertEqual(0, len(cache))
+    self.assertEqual(0, len(IPA_CACHE))
+
+  def test_sentence_to_ipa__with_cache__uses_passed_cache(self):
+    input_dict = {"TO": "tu"}
+    cache1 = ConversionCache()
+    cache2 = ConversionCache()
+    sentence_to_ipa(input_dict, "to", replace_unknown_with="_", use_caching=True, cache=cache1)
+    res = sentence_to_ipa({"TO": "to"}, "to", replace_unknown_with="_", use_caching=True, cache=cache2)
+
+    self.assertEqual("to", res)
+    self.assertEqual(1, len(cache1))
+    self.assertEqual(1, len(cache2))
+
+  # endregion
+
+  # region UpperKeyDict
+
+  def test_upper_key_dict__upper_keys__returns_values(self):
+    res = UpperKeyDict({"TO": "a", "'TIS": "b"})
+
+    self.assertEqual("a", res["TO"])
+    self.assertIn("'TIS", res)
+    self.assertNotIn("to", res)
+    self.assertEqual(2, len(res))
+
+  def test_upper_key_dict__lower_key__throws_exception(self):
+    with self.assertRaises(ValueError):
+      UpperKeyDict({"TO": "a", "to": "b"})
+
+  def test_upper_key_dict__wrapped_twice__uses_same_dict(self):
+    input_dict = {"TO": "a"}
+    res = UpperKeyDict(UpperKeyDict(input_dict))
+
+    self.assertIs(input_dict, res._dict)
+
+  def test_has_upper_keys__upper_key_dict__does_not_iterate_keys(self):
+    res = UpperKeyDict({"TO": "a"})
+    res._dict["to"] = "b"
+
+    self.assertTrue(has_upper_keys(res))
+    self.assertFalse(has_upper_keys(res._dict))
+
+  def test_sentence_to_ipa__upper_key_dict__returns_same_result_as_dict(self):
+    input_dict = {"TO": "tu", "NO-BRAINER": "nb", "P": "p", "R": "r", "S": "s"}
+    sentence = "(to-no-brainer PRS, xxl"
+    res = sentence_to_ipa(UpperKeyDict(input_dict), sentence, replace_unknown_with="_", use_caching=False)
+
+    self.assertEqual(sentence_to_ipa(input_dict, sentence, replace_unknown_with="_", use_caching=False), res)
+    self.assertEqual("(tu-nb prs, ___", res)
+
+  # endregion
+
+  # region sentences_to_ipa
+
+  def test_sentences_to_ipa__returns_same_results_as_sentence_to_ipa(self):
+    input_dict = {"TO": "tu", "NO-BRAINER": "nb", "P": "p", "R": "r", "S": "s"}
+    sentences = ["(to-no-brainer PRS, xxl", "to  to.", "", "xxl to"]
+    res = sentences_to_ipa(input_dict, sentences, replace_unknown_with="_", use_caching=False)
+
+    self.assertEqual([sentence_to_ipa(input_dict, sentence, replace_unknown_with="_",
+                     use_caching=False) for sentence in sentences], res)
+
+  def test_sentences_to_ipa__converts_each_distinct_word_once(self):
+    input_dict = {"TO": "tu"}
+    unknown_words = []
+
+    def replace(word: str) -> str:
+      unknown_words.append(word)
+      return "?"
+
+    res = sentences_to_ipa(input_dict, iter(["xxl to xxl", "to xxl"]), replace, use_caching=False)
+
+    self.assertEqual(["? tu ?", "tu ?"], res)
+    self.assertEqual(["xxl"], unknown_words)
+
+  # endregion
+
   # region big_letters_to_ipa
   def test_big_letters_to_ipa__only_big_letters__returns_combination_of_values(self):
     input_dict = {"A": "a", "P": "x", "R": "y", "S": "z"}
@@ -200,6 +361,43 @@ class UnitTests(unittest.TestCase):
 
   # region get_ipa_of_words_with_hyphen
 
+  def test_hyphen_index__returns_parts_of_keys_with_hyphen(self):
+    res = HyphenIndex({"'CAT-O-NINE-TAILS'": "xyz", "TO": "a", "WELL-KNOWN": "b"})
+
+    self.assertEqual(4, res.max_part_count)
+    self.assertEqual(len("'CAT-O-NINE-TAILS'"), res.max_key_length)
+    self.assertTrue(res.may_contain(["CAT", "O", "NINE", "TAILS"]))
+    self.assertTrue(res.may_contain(["''WELL", "KNOWN'"]))
+    self.assertFalse(res.may_contain(["KNOWN", "WELL"]))
+
+  def test_get_ipa_of_words_with_hyphen__upper_key_dict__returns_same_result_as_dict(self):
+    input_dict = {"DAY-BY-DAY": "dbd", "DAY": "d", "BY": "b", "TO": "t", "'TIS": "ts", "WELL-KNOWN'": "wk", "CAT-O-NINE-TAILS": "xyz"}
+    words = ["day-by-day-to-day", "to-day-by-day", "'tis-to-xx-day-'tis", "''well-known''-by", "to-cat-o-nine-tails-o-nine",
+             "x-'-day--by-'", "by-day-by-day-by-day-by"]
+    for word in words:
+      with self.subTest(word=word):
+        res = get_ipa_of_words_with_hyphen(UpperKeyDict(input_dict), word, "_")
+
+        self.assertEqual(get_ipa_of_words_with_hyphen(input_dict, word, "_"), res)
+
+  def test_get_ipa_of_words_with_hyphen__upper_key_dict_and_custom_func__calls_func_in_same_order_as_dict(self):
+    input_dict = {"DAY-BY-DAY": "dbd", "BY": "b"}
+    word = "xx-day-by-day-yy-by-zz'"
+    calls_dict = []
+    calls_upper_key_dict = []
+    res = get_ipa_of_words_with_hyphen(UpperKeyDict(input_dict), word, lambda word: calls_upper_key_dict.append(word) or "?")
+
+    self.assertEqual(get_ipa_of_words_with_hyphen(input_dict, word, lambda word: calls_dict.append(word) or "?"), res)
+    self.assertEqual(["xx", "yy", "zz"], calls_upper_key_dict)
+    self.assertEqual(calls_dict, calls_upper_key_dict)
+
+  def test_get_ipa_of_word_in_sentence__upper_key_dict_and_long_chain__returns_values_without_recursion_error(self):
+    input_dict = UpperKeyDict({"DAY-BY-DAY": "dbd", "BY": "b", "TO": "t"})
+    word = "-".join(["day-by-day-to"] * 5000)
+    res = get_ipa_of_word_in_sentence(input_dict, word, "_")
+
+    self.assertEqual("-".join(["dbd-t"] * 5000), res)
+
   def test_get_ipa_of_words_with_hyphen__three_words__returns_combination_of_values(self):
     input_word = "to-cat-o-nine-tails-to"
     input_dict = {"CAT-O-NINE-TAILS": "xyz", "TO": "a"}
@@ -517,6 +715,20 @@ class UnitTests(unittest.TestCase):
 
     self.assertEqual("-e-", res)
 
+  def test_get_ipa_of_word_in_sentence__many_words_between_punctuation__returns_values_and_punctuation(self):
+    input_dict = {"A": "c", "B": "d"}
+    input_word = "(a,b)." * 5000
+    res = get_ipa_of_word_in_sentence(input_dict, input_word, "_")
+
+    self.assertEqual("(c,d)." * 5000, res)
+
+  def test_get_ipa_of_word_in_sentence__word_and_digits_after_last_letter__keeps_rest(self):
+    input_dict = {"A": "c", "B": "d"}
+    input_word = "a,b!12)"
+    res = get_ipa_of_word_in_sentence(input_dict, input_word, "_")
+
+    self.assertEqual("c,d!12)", res)
+
   # endregion
 
   # region sentence_to_ipa
@@ -561,13 +773,18 @@ class UnitTests(unittest.TestCase):
   def test_sentence_to_ipa__with_caching__executes_custom_func_only_once(self):
     input_dict = {}
     input_word = "x"
+    calls = []
+
+    def replace(word: str) -> str:
+      calls.append(word)
+      return str(len(calls) - 1)
 
     res = [sentence_to_ipa(
       dict=input_dict,
       sentence=input_word,
-      replace_unknown_with=lambda _: str(i),
+      replace_unknown_with=replace,
       use_caching=True
-    ) for i in range(2)]
+    ) for _ in range(2)]
 
     self.assertEqual(["0", "0"], res)
 
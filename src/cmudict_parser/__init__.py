@@ -1,3 +1,13 @@
+from cmudict_parser.ARPAToIPA import IPA_EAGER, IPA_LAZY
 from cmudict_parser.CMUDict import (ARPA_ALLOWED_PUNCTUATION, ARPA_SPACE,
-                                    ARPA_UNKNOWN, CMUDict, get_dict)
+                                    ARPA_UNKNOWN, STORAGE_ENCODED,
+                                    STORAGE_LISTS, STORAGE_MMAP, CMUDict,
+                                    get_dict)
+from cmudict_parser.CMUDictAsync import convert_async
+from cmudict_parser.CMUDictInstrumentation import (LoadStage,
+                                                   register_load_callback,
+                                                   unregister_load_callback)
+from cmudict_parser.CMUDictParallel import (CONVERSION_ARPA,
+                                            CONVERSION_ARPA_OLD,
+                                            CONVERSION_IPA, convert_parallel)
 from cmudict_parser.SentenceToIPA import clear_cache